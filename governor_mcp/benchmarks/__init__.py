@@ -0,0 +1,14 @@
+"""Classification benchmarks for Governor MCP"""
+
+from .corpus import BenchmarkCase, generate_corpus
+from .runner import compare_results, load_results, run_benchmarks, summarize, write_results
+
+__all__ = [
+    "BenchmarkCase",
+    "generate_corpus",
+    "run_benchmarks",
+    "compare_results",
+    "summarize",
+    "write_results",
+    "load_results",
+]
@@ -0,0 +1,49 @@
+"""Run classification benchmarks: python -m governor_mcp.benchmarks"""
+
+import argparse
+import json
+import sys
+
+from .corpus import DEFAULT_SEED, DEFAULT_SIZE
+from .runner import DEFAULT_MAX_REGRESSION, compare_results, load_results, run_benchmarks, write_results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks and optionally compare against a baseline"""
+    parser = argparse.ArgumentParser(
+        prog="python -m governor_mcp.benchmarks",
+        description="Measure classification throughput and latency",
+    )
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE, help="corpus size")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="corpus seed")
+    parser.add_argument("--rounds", type=int, default=3, help="timed passes per target")
+    parser.add_argument("--target", action="append", dest="targets",
+                        help="target to run (repeatable): resource_classify, classify_action, "
+                             "classify_scope, assess")
+    parser.add_argument("--cached", action="store_true",
+                        help="let assess use the classification cache")
+    parser.add_argument("--output", "-o", help="write results JSON to this file")
+    parser.add_argument("--baseline", help="compare against a stored results JSON")
+    parser.add_argument("--max-regression", type=float, default=DEFAULT_MAX_REGRESSION,
+                        help="allowed slowdown before failing (fraction, default 0.10)")
+    args = parser.parse_args(argv)
+
+    try:
+        results = run_benchmarks(args.size, args.seed, args.rounds, args.targets, args.cached)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.baseline:
+        results["comparison"] = compare_results(results, load_results(args.baseline), args.max_regression)
+    if args.output:
+        write_results(results, args.output)
+
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    if args.baseline and results["comparison"]["regressions"]:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""Reproducible benchmark corpus of realistic agent operations"""
+
+import random
+from dataclasses import dataclass
+
+DEFAULT_SEED = 1729
+DEFAULT_SIZE = 2000
+
+# Share of the corpus per category; pathological inputs are rare but slow
+CATEGORY_WEIGHTS = {
+    "shell": 30,
+    "pipeline": 15,
+    "sql": 20,
+    "http": 15,
+    "prose": 18,
+    "pathological": 2,
+}
+
+_FILES = [
+    "README.md", "src/app.py", "config.yaml", "settings.json", "notes.txt",
+    ".env", ".env.production", "~/.ssh/id_rsa", "certs/server.pem", "data/export.csv",
+    "migrations/0042_add_index.py", "db/app.sqlite3", "dump.sql", "/etc/hosts",
+    "/var/log/app/error.log", "k8s/secret-prod.yaml", "~/.aws/credentials", "package.json",
+]
+_DIRS = ["/tmp/build", "./dist", "node_modules", "/var/lib/app", "~/projects/site", "."]
+_SHELL = [
+    "ls -la {dir}", "cat {file}", "rm -rf {dir}", "rm {file}", "cp {file} {dir}",
+    "mv {file} {dir}", "chmod 600 {file}", "sudo chown root {file}", "mkdir -p {dir}",
+    "touch {file}", "git status", "git add {file}", "git push origin main",
+    "pytest -q", "python manage.py migrate", "npm install", "pip install requests",
+    "sudo apt install nginx", "systemctl restart nginx", "kill -9 {pid}", "docker ps",
+    "kubectl apply -f {file}", "ssh deploy@{host}", "tail -n 100 {file}", "head {file}",
+    "find {dir} -name '*.py'", "du -sh {dir}", "tar czf backup.tgz {dir}",
+]
+_PIPE_STAGES = [
+    "cat {file}", "grep -i error", "sort", "uniq -c", "head -n 20", "wc -l",
+    "awk '{{print $1}}'", "sed 's/foo/bar/g'", "xargs rm", "tee {file}",
+    "jq '.items[]'", "cut -d, -f2", "curl -s https://{host}/api/v1/items",
+]
+_TABLES = ["users", "orders", "sessions", "audit_log", "public.accounts", "inventory"]
+_COLUMNS = ["id", "name", "email", "created_at", "status", "total", "owner_id"]
+_HOSTS = [
+    "api.github.com", "api.stripe.com", "example.com", "internal.example.com",
+    "localhost:8080", "hooks.slack.com", "graphql.example.org", "10.0.0.12",
+]
+_HTTP = [
+    "curl https://{host}/{path}", "curl -X POST https://{host}/{path} -d @body.json",
+    "GET https://{host}/{path}", "DELETE https://{host}/{path}",
+    "fetch('https://{host}/{path}')", "requests.post('https://{host}/{path}', json=payload)",
+    "axios.get('https://{host}/{path}')", "wget https://{host}/{path}",
+    "http.request({{host: '{host}', path: '/{path}'}})", "send webhook to https://{host}/{path}",
+]
+_PATHS = ["api/v1/users", "api/v2/orders/42", "v1/charges", "graphql", "health", "repos/org/repo/issues"]
+_PROSE_SUBJECTS = [
+    "the README", "all tables in the staging database", "this config file", "several log files",
+    "every user session", "the production cluster", "a single record", "the entire repository",
+    "the deploy script", "some cached entries", "the service account key", "the admin account",
+]
+_PROSE_VERBS = [
+    "Read", "Summarize", "Update", "Delete", "Deploy", "Refactor", "Check", "Create",
+    "Remove", "Restart", "Migrate", "Inspect", "Back up", "Rotate", "Review",
+]
+_PROSE_TAILS = [
+    "", "before the release", "and report any errors", "for the quarterly audit",
+    "without touching other services", "then notify the team", "if the tests pass",
+]
+_FILLER = (
+    "The quick brown fox jumps over the lazy dog while the build runs in the "
+    "background and the team reviews the change log for regressions. "
+)
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """One benchmark input"""
+    category: str
+    operation: str
+    context: str = ""
+
+
+def _fill(template: str, rnd: random.Random) -> str:
+    return template.format(
+        file=rnd.choice(_FILES),
+        dir=rnd.choice(_DIRS),
+        host=rnd.choice(_HOSTS),
+        path=rnd.choice(_PATHS),
+        pid=rnd.randint(100, 99999),
+    )
+
+
+def _shell(rnd: random.Random) -> BenchmarkCase:
+    context = rnd.choice(["", "", rnd.choice(_FILES), rnd.choice(_DIRS)])
+    return BenchmarkCase("shell", _fill(rnd.choice(_SHELL), rnd), context)
+
+
+def _pipeline(rnd: random.Random) -> BenchmarkCase:
+    stages = [_fill(rnd.choice(_PIPE_STAGES), rnd) for _ in range(rnd.randint(2, 6))]
+    return BenchmarkCase("pipeline", " | ".join(stages))
+
+
+def _sql_statement(rnd: random.Random) -> str:
+    table = rnd.choice(_TABLES)
+    columns = ", ".join(rnd.sample(_COLUMNS, rnd.randint(1, len(_COLUMNS))))
+    where = f" WHERE id = {rnd.randint(1, 10000)}" if rnd.random() < 0.7 else ""
+    kind = rnd.choice(["select", "select", "insert", "update", "delete", "ddl"])
+    if kind == "select":
+        return f"SELECT {columns} FROM {table}{where}"
+    if kind == "insert":
+        rows = ", ".join(f"({i}, 'name{i}', 'user{i}@example.com')" for i in range(rnd.randint(1, 50)))
+        return f"INSERT INTO {table} (id, name, email) VALUES {rows}"
+    if kind == "update":
+        return f"UPDATE {table} SET status = 'archived'{where}"
+    if kind == "delete":
+        return f"DELETE FROM {table}{where}"
+    return rnd.choice([f"DROP TABLE {table}", f"TRUNCATE TABLE {table}", f"ALTER TABLE {table} ADD COLUMN note text"])
+
+
+def _sql(rnd: random.Random) -> BenchmarkCase:
+    statements = "; ".join(_sql_statement(rnd) for _ in range(rnd.choice([1, 1, 1, 2, 5, 20])))
+    wrapper = rnd.choice(["{}", "psql -c \"{}\"", "mysql -e \"{}\"", "run query: {}"])
+    return BenchmarkCase("sql", wrapper.format(statements), rnd.choice(["", "postgres://db/app", "production database"]))
+
+
+def _http(rnd: random.Random) -> BenchmarkCase:
+    return BenchmarkCase("http", _fill(rnd.choice(_HTTP), rnd), rnd.choice(["", "", "auth token in header"]))
+
+
+def _prose(rnd: random.Random) -> BenchmarkCase:
+    sentence = f"{rnd.choice(_PROSE_VERBS)} {rnd.choice(_PROSE_SUBJECTS)} {rnd.choice(_PROSE_TAILS)}".strip()
+    if rnd.random() < 0.3:
+        sentence += " " + _FILLER * rnd.randint(1, 8)
+    return BenchmarkCase("prose", sentence, rnd.choice(["", rnd.choice(_FILES)]))
+
+
+def _pathological(rnd: random.Random) -> BenchmarkCase:
+    kind = rnd.choice(["long_prose", "long_sql", "long_token", "many_quotes", "huge_script"])
+    if kind == "long_prose":
+        operation = _FILLER * 200
+    elif kind == "long_sql":
+        operation = "SELECT " + "a, " * 5000 + "b FROM t WHERE " + " AND ".join(f"c{i} = {i}" for i in range(500))
+    elif kind == "long_token":
+        operation = "x" * 50_000
+    elif kind == "many_quotes":
+        operation = "echo " + "'a' \"b\" " * 5000
+    else:
+        # Above the streaming threshold
+        operation = "\n".join(_fill(rnd.choice(_SHELL), rnd) for _ in range(4000))
+    return BenchmarkCase("pathological", operation)
+
+
+_GENERATORS = {
+    "shell": _shell,
+    "pipeline": _pipeline,
+    "sql": _sql,
+    "http": _http,
+    "prose": _prose,
+    "pathological": _pathological,
+}
+
+
+def generate_corpus(size: int = DEFAULT_SIZE, seed: int = DEFAULT_SEED) -> list[BenchmarkCase]:
+    """
+    Generate a reproducible corpus of benchmark operations.
+
+    The same size and seed always produce the same cases in the same order.
+
+    Args:
+        size: Number of cases
+        seed: Random seed
+
+    Returns:
+        List of BenchmarkCase
+    """
+    rnd = random.Random(seed)
+    categories = list(CATEGORY_WEIGHTS)
+    weights = [CATEGORY_WEIGHTS[category] for category in categories]
+    return [
+        _GENERATORS[category](rnd)
+        for category in rnd.choices(categories, weights=weights, k=size)
+    ]
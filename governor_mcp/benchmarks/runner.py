@@ -0,0 +1,186 @@
+"""Benchmark runner for the classification and assessment pipeline"""
+
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable
+
+from ..classification import ActionClassifier, ResourceClassifier
+from ..core import ClassificationCache, RiskAssessor
+from .corpus import DEFAULT_SEED, DEFAULT_SIZE, BenchmarkCase, generate_corpus
+
+# Benchmarks fail a baseline comparison when p50 or throughput regress by
+# more than this fraction
+DEFAULT_MAX_REGRESSION = 0.10
+
+
+def _targets(cached: bool) -> dict[str, Callable[[BenchmarkCase], Any]]:
+    """Build the functions to benchmark, keyed by name"""
+    resource_classifier = ResourceClassifier()
+    action_classifier = ActionClassifier()
+    # A zero-size cache measures classification itself, not cache lookups
+    assessor = RiskAssessor(cache=None if cached else ClassificationCache(maxsize=0))
+    return {
+        "resource_classify": lambda case: resource_classifier.classify(case.operation, case.context),
+        "classify_action": lambda case: action_classifier.classify_action(case.operation),
+        "classify_scope": lambda case: action_classifier.classify_scope(case.operation, case.context),
+        "assess": lambda case: assessor.assess(case.operation, "", case.context),
+    }
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of pre-sorted values"""
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies_ns: list[int]) -> dict[str, float]:
+    """
+    Summarize per-call latencies.
+
+    Args:
+        latencies_ns: Per-call latencies in nanoseconds
+
+    Returns:
+        Dict with calls, throughput (calls/s) and mean/p50/p99/max in microseconds
+    """
+    if not latencies_ns:
+        return {"calls": 0}
+    values = sorted(latencies_ns)
+    total = sum(values)
+    return {
+        "calls": len(values),
+        "throughput": round(len(values) / (total / 1e9), 1) if total else None,
+        "mean_us": round(statistics.fmean(values) / 1000, 3),
+        "p50_us": round(_percentile(values, 0.50) / 1000, 3),
+        "p99_us": round(_percentile(values, 0.99) / 1000, 3),
+        "max_us": round(values[-1] / 1000, 3),
+    }
+
+
+def run_benchmarks(
+    size: int = DEFAULT_SIZE,
+    seed: int = DEFAULT_SEED,
+    rounds: int = 3,
+    targets: list[str] | None = None,
+    cached: bool = False,
+) -> dict[str, Any]:
+    """
+    Benchmark each classification entry point over the generated corpus.
+
+    Every target is warmed up with one untimed pass over the corpus, then
+    timed for the given number of rounds. Latencies are reported overall
+    and per corpus category.
+
+    Args:
+        size: Number of corpus cases
+        seed: Corpus random seed
+        rounds: Timed passes over the corpus per target
+        targets: Target names to run (default: all)
+        cached: Let RiskAssessor.assess use the classification cache
+
+    Returns:
+        JSON-serializable results with run metadata
+    """
+    corpus = generate_corpus(size, seed)
+    available = _targets(cached)
+    unknown = set(targets or []) - set(available)
+    if unknown:
+        raise ValueError(f"Unknown benchmark targets: {', '.join(sorted(unknown))}")
+
+    results: dict[str, Any] = {}
+    for name in targets or list(available):
+        function = available[name]
+        for case in corpus:
+            function(case)
+
+        by_category: dict[str, list[int]] = {}
+        clock = time.perf_counter_ns
+        for _ in range(rounds):
+            for case in corpus:
+                start = clock()
+                function(case)
+                by_category.setdefault(case.category, []).append(clock() - start)
+
+        results[name] = {
+            "overall": summarize([ns for latencies in by_category.values() for ns in latencies]),
+            "categories": {
+                category: summarize(latencies)
+                for category, latencies in sorted(by_category.items())
+            },
+        }
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "corpus_size": size,
+            "seed": seed,
+            "rounds": rounds,
+            "cached": cached,
+        },
+        "results": results,
+    }
+
+
+def compare_results(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    max_regression: float = DEFAULT_MAX_REGRESSION,
+) -> dict[str, Any]:
+    """
+    Compare benchmark results against a stored baseline.
+
+    Args:
+        current: Results from run_benchmarks
+        baseline: Previously stored results
+        max_regression: Allowed slowdown as a fraction (0.10 = 10%)
+
+    Returns:
+        Dict with per-target ratios (current / baseline; above 1 is slower)
+        and a list of regressions beyond max_regression
+    """
+    comparison: dict[str, Any] = {}
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        now, before = result["overall"], base["overall"]
+        ratios = {
+            metric: round(now[metric] / before[metric], 3)
+            for metric in ("p50_us", "p99_us", "mean_us")
+            if before.get(metric)
+        }
+        if before.get("throughput") and now.get("throughput"):
+            # Inverted so that above 1 means slower for every metric
+            ratios["throughput"] = round(before["throughput"] / now["throughput"], 3)
+        comparison[name] = ratios
+        for metric in ("p50_us", "throughput"):
+            if ratios.get(metric, 0) > 1 + max_regression:
+                regressions.append(f"{name}.{metric} {ratios[metric]:.2f}x slower")
+
+    if current["meta"].get("corpus_size") != baseline.get("meta", {}).get("corpus_size") or (
+        current["meta"].get("seed") != baseline.get("meta", {}).get("seed")
+    ):
+        comparison["warning"] = "corpus size or seed differs from the baseline"
+
+    return {"ratios": comparison, "regressions": regressions}
+
+
+def write_results(results: dict[str, Any], path: str) -> str:
+    """Write results as JSON and return the path"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    return path
+
+
+def load_results(path: str) -> dict[str, Any]:
+    """Load results previously written with write_results"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
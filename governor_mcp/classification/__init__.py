@@ -1,6 +1,29 @@
 """Classification system for Governor MCP"""
 
-from .patterns import SENSITIVE_FILE_PATTERNS, DATABASE_PATTERNS, API_PATTERNS
+from .patterns import SENSITIVE_FILE_PATTERNS, DATABASE_PATTERNS, API_PATTERNS, PatternSet
+from .keywords import KeywordAutomaton
+from .hosts import HostSuffixTrie
+from .rules import (
+    RuleSet,
+    RulePackLoader,
+    get_rule_set,
+    get_rule_stats,
+    load_rule_pack,
+    configure_rule_pack,
+    configure_rule_pack_from_env,
+)
+from .features import OperationFeatures, extract_features
+from .streaming import (
+    StreamingClassifier,
+    StreamingResult,
+    StreamingState,
+    IncrementalClassifier,
+    STREAMING_THRESHOLD,
+)
+from .statements import StatementClassifier, StatementVerdict, statement_shape
+from .fingerprint import Fingerprint, fingerprint, literals_inert
+from .targets import PathTrie, TargetClassifier, TargetScan, dedupe_targets
+from .instrumentation import ClassificationStats, get_classification_stats
 from .resource_classifier import ResourceClassifier, ResourceType
 from .action_classifier import ActionClassifier, ActionType, ScopeType
 
@@ -8,6 +31,35 @@ __all__ = [
     "SENSITIVE_FILE_PATTERNS",
     "DATABASE_PATTERNS",
     "API_PATTERNS",
+    "PatternSet",
+    "KeywordAutomaton",
+    "HostSuffixTrie",
+    "RuleSet",
+    "RulePackLoader",
+    "get_rule_set",
+    "get_rule_stats",
+    "load_rule_pack",
+    "configure_rule_pack",
+    "configure_rule_pack_from_env",
+    "OperationFeatures",
+    "extract_features",
+    "StreamingClassifier",
+    "StreamingResult",
+    "StreamingState",
+    "IncrementalClassifier",
+    "STREAMING_THRESHOLD",
+    "StatementClassifier",
+    "StatementVerdict",
+    "statement_shape",
+    "Fingerprint",
+    "fingerprint",
+    "literals_inert",
+    "PathTrie",
+    "TargetClassifier",
+    "TargetScan",
+    "dedupe_targets",
+    "ClassificationStats",
+    "get_classification_stats",
     "ResourceClassifier",
     "ResourceType",
     "ActionClassifier",
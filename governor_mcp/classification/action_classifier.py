@@ -2,7 +2,9 @@
 
 from enum import Enum
 
-from .patterns import READ_ONLY_PATTERNS, matches_any_pattern
+from .features import OperationFeatures, extract_features
+from .instrumentation import STATS
+from .patterns import matches_any_pattern
 
 
 class ActionType(str, Enum):
@@ -38,6 +40,11 @@ SCOPE_MULTIPLIERS = {
 }
 
 
+# Families checked in order of severity (highest first)
+ACTION_PRECEDENCE = [ActionType.EXECUTE, ActionType.DELETE, ActionType.WRITE, ActionType.READ]
+SCOPE_PRECEDENCE = [ScopeType.SYSTEM, ScopeType.COLLECTION, ScopeType.MULTIPLE]
+
+
 class ActionClassifier:
     """Classifies actions and scope based on operation descriptions"""
 
@@ -101,28 +108,54 @@ class ActionClassifier:
         Returns:
             Tuple of (ActionType, risk_multiplier)
         """
-        operation_lower = operation.lower()
+        return self.classify_action_features(extract_features(operation))
 
+    def classify_action_features(self, features: OperationFeatures) -> tuple[ActionType, float]:
+        """Classify the action type from pre-extracted operation features"""
         # Check if it's a read-only operation first
-        if matches_any_pattern(operation, READ_ONLY_PATTERNS):
+        if matches_any_pattern(features.operation, features.rules.read_only) or self._is_read_only_sql(features):
+            if STATS.enabled:
+                self._record_read_only_decision(features)
             return ActionType.READ, ACTION_MULTIPLIERS[ActionType.READ]
 
         # Check action keywords in order of severity (highest first)
-        if any(kw in operation_lower for kw in self.EXECUTE_KEYWORDS):
-            return ActionType.EXECUTE, ACTION_MULTIPLIERS[ActionType.EXECUTE]
-
-        if any(kw in operation_lower for kw in self.DELETE_KEYWORDS):
-            return ActionType.DELETE, ACTION_MULTIPLIERS[ActionType.DELETE]
-
-        if any(kw in operation_lower for kw in self.WRITE_KEYWORDS):
-            return ActionType.WRITE, ACTION_MULTIPLIERS[ActionType.WRITE]
-
-        if any(kw in operation_lower for kw in self.READ_KEYWORDS):
-            return ActionType.READ, ACTION_MULTIPLIERS[ActionType.READ]
+        hits = features.operation_hits
+        for action_type in ACTION_PRECEDENCE:
+            if action_type in hits:
+                if STATS.enabled:
+                    STATS.record_decision(f"action:{action_type.value}", action_type, sorted(hits[action_type]))
+                return action_type, ACTION_MULTIPLIERS[action_type]
 
         # Default to write (moderate risk)
+        if STATS.enabled:
+            STATS.record_decision("action:write", "default", ["write"])
         return ActionType.WRITE, ACTION_MULTIPLIERS[ActionType.WRITE]
 
+    @staticmethod
+    def _is_read_only_sql(features: OperationFeatures) -> bool:
+        """
+        Check whether the operation is a read-only SQL query.
+
+        A SELECT only makes the operation a read when nothing around it is
+        riskier: execute or delete keywords and shell commands keep their
+        own verdict, so "rm -rf build; SELECT id FROM t" is not a read.
+        """
+        if not features.operation_sql.is_read_only:
+            return False
+        hits = features.operation_hits
+        if ActionType.EXECUTE in hits or ActionType.DELETE in hits:
+            return False
+        return features.rules.system_command.search(features.operation) is None
+
+    def _record_read_only_decision(self, features: OperationFeatures) -> None:
+        """Record which rule made an operation read-only (instrumentation only)"""
+        read_only = features.rules.read_only
+        pattern = read_only.first_pattern(features.operation)
+        if pattern is not None:
+            STATS.record_decision("action:read", read_only.family, [pattern])
+        else:
+            STATS.record_decision("action:read", "sql", sorted(features.operation_sql.shapes))
+
     def classify_scope(self, operation: str, context: str = "") -> tuple[ScopeType, float]:
         """
         Classify the scope of an operation and return the risk multiplier.
@@ -134,19 +167,21 @@ class ActionClassifier:
         Returns:
             Tuple of (ScopeType, risk_multiplier)
         """
-        combined = f"{operation} {context}".lower()
+        return self.classify_scope_features(extract_features(operation, context))
 
+    def classify_scope_features(self, features: OperationFeatures) -> tuple[ScopeType, float]:
+        """Classify the scope from pre-extracted operation features"""
         # Check scope keywords in order of severity (highest first)
-        if any(kw in combined for kw in self.SYSTEM_KEYWORDS):
-            return ScopeType.SYSTEM, SCOPE_MULTIPLIERS[ScopeType.SYSTEM]
-
-        if any(kw in combined for kw in self.COLLECTION_KEYWORDS):
-            return ScopeType.COLLECTION, SCOPE_MULTIPLIERS[ScopeType.COLLECTION]
-
-        if any(kw in combined for kw in self.MULTIPLE_KEYWORDS):
-            return ScopeType.MULTIPLE, SCOPE_MULTIPLIERS[ScopeType.MULTIPLE]
+        hits = features.combined_hits
+        for scope_type in SCOPE_PRECEDENCE:
+            if scope_type in hits:
+                if STATS.enabled:
+                    STATS.record_decision(f"scope:{scope_type.value}", scope_type, sorted(hits[scope_type]))
+                return scope_type, SCOPE_MULTIPLIERS[scope_type]
 
         # Default to single (lowest scope risk)
+        if STATS.enabled:
+            STATS.record_decision("scope:single", "default", ["single"])
         return ScopeType.SINGLE, SCOPE_MULTIPLIERS[ScopeType.SINGLE]
 
     def get_action_multiplier(self, action_type: ActionType) -> float:
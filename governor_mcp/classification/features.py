@@ -0,0 +1,140 @@
+"""Shared feature extraction for Governor MCP classifiers"""
+
+import re
+import shlex
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Hashable
+
+from .keywords import KeywordAutomaton
+from .rules import RuleSet, get_rule_set
+from .sql import SqlScan, scan_sql
+
+
+URL_PATTERN = re.compile(r"\b[a-z][a-z0-9+.\-]*://[^\s'\"<>()\[\]{}]+", re.IGNORECASE)
+TOKEN_PATTERN = re.compile(r"[a-z0-9_]+")
+EXTENSION_PATTERN = re.compile(r"^[\w.\-~ ]*\.[A-Za-z0-9]{1,10}$")
+
+# Characters stripped from the edges of argv words before path detection
+_PATH_EDGE_CHARS = "@'\"`()[]{}<>,;:=|&"
+
+SQL_VERBS = frozenset({
+    "select", "insert", "update", "delete", "merge", "replace", "upsert",
+    "create", "alter", "drop", "truncate", "rename",
+    "grant", "revoke", "copy", "vacuum", "begin", "commit", "rollback",
+})
+
+def keyword_automaton() -> KeywordAutomaton:
+    """Get the active automaton over every classifier keyword family"""
+    return get_rule_set().automaton
+
+
+@dataclass
+class OperationFeatures:
+    """
+    Normalized view of an operation shared by all classifiers.
+
+    Each derived feature is computed on first access and then reused, so a
+    single assessment lowercases, tokenizes and keyword-scans its input once
+    no matter how many classifiers consult it.
+    """
+    operation: str
+    context: str = ""
+    # Rules pinned for the lifetime of this assessment
+    rules: RuleSet = field(default_factory=get_rule_set, repr=False, compare=False)
+
+    @cached_property
+    def combined(self) -> str:
+        """Operation and context joined for pattern matching"""
+        return f"{self.operation} {self.context}".strip()
+
+    @cached_property
+    def combined_lower(self) -> str:
+        """Lowercased combined text"""
+        return self.combined.lower()
+
+    @cached_property
+    def operation_hits(self) -> dict[Hashable, set[str]]:
+        """Keyword hits per family in the operation alone"""
+        return self.rules.automaton.scan(self.operation)
+
+    @cached_property
+    def context_hits(self) -> dict[Hashable, set[str]]:
+        """Keyword hits per family in the context alone"""
+        return self.rules.automaton.scan(self.context) if self.context else {}
+
+    @cached_property
+    def combined_hits(self) -> dict[Hashable, set[str]]:
+        """Keyword hits per family across operation and context"""
+        # Keywords contain no whitespace, so nothing can span the join
+        if not self.context_hits:
+            return self.operation_hits
+        hits = {family: set(found) for family, found in self.operation_hits.items()}
+        for family, found in self.context_hits.items():
+            hits.setdefault(family, set()).update(found)
+        return hits
+
+    @cached_property
+    def tokens(self) -> list[str]:
+        """Lowercased word tokens across operation and context"""
+        return TOKEN_PATTERN.findall(self.combined_lower)
+
+    @cached_property
+    def argv(self) -> list[str]:
+        """Shell-style argument vector of the operation"""
+        try:
+            return shlex.split(self.operation)
+        except ValueError:
+            # Unbalanced quotes: fall back to whitespace splitting
+            return self.operation.split()
+
+    @cached_property
+    def urls(self) -> list[str]:
+        """URLs found in operation and context, in order of appearance"""
+        return list(dict.fromkeys(URL_PATTERN.findall(self.combined)))
+
+    @cached_property
+    def paths(self) -> list[str]:
+        """Candidate file system paths found in operation and context"""
+        paths: dict[str, None] = {}
+        for word in self.argv + self.context.split():
+            word = word.strip(_PATH_EDGE_CHARS)
+            if not word or "://" in word:
+                continue
+            if "/" in word or "\\" in word or EXTENSION_PATTERN.match(word) or (
+                word.startswith(".") and len(word) > 1 and word.strip(".")
+            ):
+                paths[word] = None
+        return list(paths)
+
+    @cached_property
+    def sql_verbs(self) -> list[str]:
+        """SQL statement verbs present in the input, in order of first appearance"""
+        return [
+            token for token in dict.fromkeys(self.tokens)
+            if token in SQL_VERBS
+        ]
+
+    @cached_property
+    def sql(self) -> SqlScan:
+        """SQL statements across operation and context"""
+        return scan_sql(self.combined)
+
+    @cached_property
+    def operation_sql(self) -> SqlScan:
+        """SQL statements in the operation alone"""
+        return scan_sql(self.operation) if self.context.strip() else self.sql
+
+
+def extract_features(operation: str, context: str = "") -> OperationFeatures:
+    """
+    Build the shared feature object for an operation.
+
+    Args:
+        operation: The operation description or command
+        context: Additional context (file paths, URLs, etc.)
+
+    Returns:
+        OperationFeatures with lazily computed derived features
+    """
+    return OperationFeatures(operation=operation, context=context)
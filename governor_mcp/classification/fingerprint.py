@@ -0,0 +1,160 @@
+"""Literal-stripping fingerprints of operations"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+
+from .features import SQL_VERBS, TOKEN_PATTERN
+from .rules import RuleSet
+
+# Literal kinds and their placeholders. Placeholders keep the character
+# class of what they replace (digits stay digits, quotes stay quotes), so
+# rules that look around a literal see the same shape of text.
+PLACEHOLDERS = {
+    "uuid": "00000000-0000-0000-0000-000000000000",
+    "hash": "0",
+    "temp_path": "/tmp/_",
+    "quoted": "'?'",
+    "number": "0",
+}
+
+# Quoted literals longer than this are kept verbatim
+MAX_QUOTED_CHARS = 256
+
+# One alternation, tried left to right at each position; every branch is
+# bounded or anchored on distinct characters, so the pass stays linear
+LITERAL_PATTERN = re.compile(
+    r"(?P<uuid>\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b)"
+    r"|(?P<hash>\b(?=[a-fA-F]*\d)[0-9a-fA-F]{12,}\b)"
+    r"|(?P<temp_path>(?<![\w.~])(?:/private)?(?:/var)?/tmp/[\w.\-]+(?:/[\w.\-]+)*)"
+    rf"|(?P<quoted>'[^'\n]{{0,{MAX_QUOTED_CHARS}}}'|\"[^\"\n]{{0,{MAX_QUOTED_CHARS}}}\")"
+    r"|(?P<number>\b\d+(?:\.\d+)?\b)"
+)
+
+# Quoted literals made only of these characters are masked; anything else
+# (paths, file names, globs, variables) can change what a command does and
+# stays part of the fingerprint
+_PLAIN_LITERAL = re.compile(r"[\w@+\-:, ]*")
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    """Stable 64-bit fingerprint of an operation with its literals masked"""
+    value: int
+    template: str
+    context_template: str = ""
+    # (kind, literal) of every masked literal of the operation and of the
+    # context, in order; quoted strings are kept without their quotes
+    literals: tuple[tuple[str, str], ...] = ()
+    context_literals: tuple[tuple[str, str], ...] = ()
+
+    @property
+    def hex(self) -> str:
+        return f"{self.value:016x}"
+
+
+def _mask(text: str, literals: list[tuple[str, str]]) -> str:
+    """Replace the literals of a text with placeholders, collecting them"""
+
+    def replace(match: re.Match) -> str:
+        kind = match.lastgroup
+        literal = match.group()
+        if kind == "quoted":
+            literal = literal[1:-1]
+            if not _PLAIN_LITERAL.fullmatch(literal):
+                return match.group()
+        literals.append((kind, literal))
+        return PLACEHOLDERS[kind]
+
+    return LITERAL_PATTERN.sub(replace, text) if text else text
+
+
+def fingerprint(operation: str, context: str = "") -> Fingerprint:
+    """
+    Fingerprint an operation by masking its literal values.
+
+    Numbers, UUIDs, hex hashes (12+ digits), quoted strings and temp paths
+    are replaced with placeholders, so `DELETE FROM sessions WHERE id=17`
+    and `... id=18` share one fingerprint. Quoted strings are only masked
+    when they consist of plain characters (letters, digits, @ + - : , and
+    spaces). The value is a BLAKE2b digest of the templates, identical
+    across processes and platforms.
+
+    Args:
+        operation: Operation text
+        context: Additional context, masked the same way
+
+    Returns:
+        Fingerprint with the 64-bit value, the masked templates and the
+        masked literals
+    """
+    literals: list[tuple[str, str]] = []
+    context_literals: list[tuple[str, str]] = []
+    template = _mask(operation, literals)
+    context_template = _mask(context, context_literals)
+    data = template if not context else f"{template}\0{context_template}"
+    value = int.from_bytes(hashlib.blake2b(data.encode("utf-8"), digest_size=8).digest(), "big")
+    return Fingerprint(value, template, context_template, tuple(literals), tuple(context_literals))
+
+
+# Digit runs a rule can match at the start of a number, i.e. not glued to
+# a letter (the 9 of kill -9, but not the 3 of sqlite3)
+_RULE_DIGITS = re.compile(r"(?<![\w\\])\d+")
+
+# Rule digit runs per rule set version
+_rule_digits: dict[int, tuple[str, ...]] = {}
+
+
+def _numbers_in_rules(rules: RuleSet) -> tuple[str, ...]:
+    """Digit runs of every pattern and keyword of a rule set"""
+    digits = _rule_digits.get(rules.version)
+    if digits is None:
+        sources = [pattern.pattern for pattern_set in rules.pattern_sets for pattern in pattern_set.patterns]
+        sources += [keyword for keywords in rules.automaton.families.values() for keyword in keywords]
+        digits = tuple(sorted({run for source in sources for run in _RULE_DIGITS.findall(source)}))
+        if len(_rule_digits) >= 16:
+            _rule_digits.clear()
+        _rule_digits[rules.version] = digits
+    return digits
+
+
+def _literal_inert(kind: str, literal: str, keywords: set[str], rules: RuleSet) -> bool:
+    """Check one masked literal against the rules"""
+    if kind == "number":
+        return not literal.startswith(_numbers_in_rules(rules))
+    if not rules.automaton.found_keywords(literal) <= keywords:
+        return False
+    if any(pattern_set.search(literal) for pattern_set in rules.pattern_sets):
+        return False
+    return not any(token in SQL_VERBS for token in TOKEN_PATTERN.findall(literal.lower()))
+
+
+def literals_inert(fp: Fingerprint, rules: RuleSet) -> bool:
+    """
+    Check that the masked literals of an input cannot change its verdict.
+
+    Keywords match anywhere in a word ("output" contains "put"), so a
+    literal is only inert if every keyword it contains already occurs in
+    the masked text it belongs to (classifiers only see which keywords
+    occur, not how often), it matches no pattern family on its own and
+    names no SQL verb. Numbers are inert unless they start with a digit
+    sequence that appears in a rule, such as the 9 of kill -9.
+
+    Args:
+        fp: Fingerprint of an operation and its context
+        rules: Rule set the input is classified with
+
+    Returns:
+        True if classifying the masked templates gives the same verdict
+        as long as it does for one input with this fingerprint
+    """
+    if not fp.literals and not fp.context_literals:
+        return True
+    keywords = rules.automaton.found_keywords(fp.template)
+    if not all(_literal_inert(kind, literal, keywords, rules) for kind, literal in fp.literals):
+        return False
+    if fp.context_literals:
+        # Context keywords feed the combined hits, which include the operation's
+        keywords = keywords | rules.automaton.found_keywords(fp.context_template)
+        return all(_literal_inert(kind, literal, keywords, rules) for kind, literal in fp.context_literals)
+    return True
@@ -0,0 +1,92 @@
+"""Host-suffix lookups for URL classification"""
+
+from functools import lru_cache
+from typing import Iterable, Mapping
+from urllib.parse import urlsplit
+
+# Per-trie cache of host lookups
+DEFAULT_HOST_CACHE_SIZE = 4096
+
+
+def url_host(url: str) -> str | None:
+    """Get the lowercased host of a URL, or None if it has none"""
+    try:
+        host = urlsplit(url).hostname
+    except ValueError:
+        return None
+    return host.rstrip(".") if host else None
+
+
+class HostSuffixTrie:
+    """
+    Maps hosts and domains to resource classes.
+
+    Domains are stored label by label from the top-level domain down, so a
+    lookup walks at most one node per label of the host and returns the
+    value of the most specific matching entry: with entries for
+    ``example.com`` and ``api.example.com``, the host ``v2.api.example.com``
+    resolves to the ``api.example.com`` value. Results are cached per host.
+    """
+
+    def __init__(
+        self,
+        entries: Mapping[str, object] | None = None,
+        cache_size: int = DEFAULT_HOST_CACHE_SIZE,
+    ):
+        self._root: dict = {}
+        self._size = 0
+        self._cached_lookup = lru_cache(maxsize=cache_size)(self._lookup)
+        for domain, value in (entries or {}).items():
+            self.add(domain, value)
+
+    @staticmethod
+    def _labels(domain: str) -> list[str]:
+        return list(reversed(domain.lower().strip(".").split(".")))
+
+    def add(self, domain: str, value: object) -> None:
+        """Map a domain and all of its subdomains to a value"""
+        if not domain.strip("."):
+            raise ValueError("host entries must not be empty")
+        node = self._root
+        for label in self._labels(domain):
+            node = node.setdefault(label, {})
+        if None not in node:
+            self._size += 1
+        # The None key holds the value of the domain ending at this node
+        node[None] = value
+        self._cached_lookup.cache_clear()
+
+    def _lookup(self, host: str) -> object | None:
+        node = self._root
+        found = None
+        for label in self._labels(host):
+            node = node.get(label)
+            if node is None:
+                break
+            found = node.get(None, found)
+        return found
+
+    def lookup(self, host: str) -> object | None:
+        """Get the value of the most specific entry covering the host"""
+        return self._cached_lookup(host.lower())
+
+    def lookup_urls(self, urls: Iterable[str]) -> list[object]:
+        """Get the values for every URL whose host has an entry"""
+        values = []
+        for url in urls:
+            host = url_host(url)
+            if host is not None:
+                value = self.lookup(host)
+                if value is not None:
+                    values.append(value)
+        return values
+
+    def cache_info(self) -> dict[str, int]:
+        info = self._cached_lookup.cache_info()
+        return {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
@@ -0,0 +1,135 @@
+"""Opt-in hit and timing instrumentation for the classification layer"""
+
+import json
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Hashable, Iterable
+
+
+def rule_id(family: Hashable, rule: str) -> str:
+    """Build a stable identifier for a rule within a family"""
+    return f"{getattr(family, 'value', family)}:{rule}"
+
+
+class ClassificationStats:
+    """
+    Per-rule hit counts, per-family timings and deciding rules.
+
+    Disabled by default. Hot paths only test the ``enabled`` attribute, so
+    the cost when disabled is a single attribute lookup per check. When
+    enabled, pattern families also evaluate each rule individually to
+    attribute hits and time, which makes classification noticeably slower.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self.started_at = datetime.now()
+        self.rule_hits: dict[str, int] = defaultdict(int)
+        self.rule_time: dict[str, float] = defaultdict(float)
+        self.rule_evaluations: dict[str, int] = defaultdict(int)
+        self.family_time: dict[str, float] = defaultdict(float)
+        self.family_calls: dict[str, int] = defaultdict(int)
+        self.decisions: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Clear all recorded data"""
+        with self._lock:
+            self._reset()
+
+    def record_family(self, family: Hashable, seconds: float) -> None:
+        """Record one evaluation of a rule family"""
+        name = str(getattr(family, "value", family))
+        with self._lock:
+            self.family_calls[name] += 1
+            self.family_time[name] += seconds
+
+    def record_rule(self, family: Hashable, rule: str, hit: bool, seconds: float = 0.0) -> None:
+        """Record one evaluation of a single rule"""
+        key = rule_id(family, rule)
+        with self._lock:
+            self.rule_evaluations[key] += 1
+            self.rule_time[key] += seconds
+            if hit:
+                self.rule_hits[key] += 1
+
+    def record_hits(self, family: Hashable, rules: Iterable[str]) -> None:
+        """Record rules that matched without per-rule timing (e.g. keywords)"""
+        with self._lock:
+            for rule in rules:
+                self.rule_hits[rule_id(family, rule)] += 1
+
+    def record_decision(self, verdict: str, family: Hashable, rules: Iterable[str]) -> None:
+        """Record the rule(s) that decided a verdict, e.g. verdict="resource:database" """
+        with self._lock:
+            for rule in rules:
+                self.decisions[verdict][rule_id(family, rule)] += 1
+
+    def to_dict(self, top: int | None = None) -> dict[str, Any]:
+        """
+        Get recorded data as a JSON-serializable dict.
+
+        Args:
+            top: Only include the N most frequent rules per section
+        """
+        with self._lock:
+            rules = [
+                {
+                    "rule": key,
+                    "hits": self.rule_hits.get(key, 0),
+                    "evaluations": self.rule_evaluations.get(key, 0),
+                    "total_ms": round(self.rule_time.get(key, 0.0) * 1000, 4),
+                }
+                for key in set(self.rule_hits) | set(self.rule_evaluations)
+            ]
+            rules.sort(key=lambda r: (-r["hits"], -r["total_ms"], r["rule"]))
+            families = {
+                name: {
+                    "calls": self.family_calls[name],
+                    "total_ms": round(self.family_time[name] * 1000, 4),
+                    "mean_us": round(self.family_time[name] / self.family_calls[name] * 1e6, 3),
+                }
+                for name in sorted(self.family_calls)
+            }
+            decisions = {
+                verdict: dict(sorted(rules_hit.items(), key=lambda item: -item[1])[:top])
+                for verdict, rules_hit in sorted(self.decisions.items())
+            }
+            return {
+                "enabled": self.enabled,
+                "since": self.started_at.isoformat(),
+                "rules": rules[:top],
+                "families": families,
+                "decisions": decisions,
+            }
+
+    def dump_json(self, path: str) -> str:
+        """Write recorded data to a JSON file and return the path"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+
+# Global instrumentation instance, checked on hot paths
+STATS = ClassificationStats()
+
+
+def get_classification_stats() -> ClassificationStats:
+    """Get the global classification instrumentation"""
+    return STATS
+
+
+def timer() -> float:
+    """High-resolution timestamp for instrumentation"""
+    return time.perf_counter()
@@ -0,0 +1,153 @@
+"""Multi-family keyword matching for Governor MCP"""
+
+import re
+from collections import deque
+from typing import Hashable, Iterable, Mapping
+
+from .instrumentation import STATS, timer
+
+try:  # Optional accelerated backend
+    import ahocorasick
+except ImportError:  # pragma: no cover - depends on environment
+    ahocorasick = None
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over several keyword families.
+
+    A single scan of the text reports every keyword of every family that
+    occurs as a substring, grouped by family. This matches the semantics of
+    ``any(kw in text for kw in keywords)`` per family, but visits the text
+    once instead of once per keyword.
+
+    Scanning uses pyahocorasick when installed. Otherwise the trie is
+    compiled into a prefix-factored regex that reports the longest keyword
+    starting at each position; every keyword contained in that match is
+    added from a table built with the pure-Python automaton.
+    """
+
+    def __init__(self, families: Mapping[Hashable, Iterable[str]]):
+        self.families: dict[Hashable, frozenset[str]] = {
+            family: frozenset(kw.lower() for kw in keywords if kw)
+            for family, keywords in families.items()
+        }
+
+        # Keyword -> families it belongs to
+        self._keyword_families: dict[str, tuple[Hashable, ...]] = {}
+        for family, keywords in self.families.items():
+            for keyword in keywords:
+                self._keyword_families.setdefault(keyword, ())
+                self._keyword_families[keyword] += (family,)
+
+        self._build_trie()
+
+        # Keyword -> every keyword occurring inside it (itself included)
+        self._contained: dict[str, tuple[str, ...]] = {
+            keyword: tuple(sorted(self._iter_python(keyword)))
+            for keyword in self._keyword_families
+        }
+
+        if ahocorasick is not None:
+            self.backend = "pyahocorasick"
+            self._native = ahocorasick.Automaton()
+            for keyword in self._keyword_families:
+                self._native.add_word(keyword, keyword)
+            self._native.make_automaton()
+        else:
+            self.backend = "regex"
+            self._native = None
+            self._regex = re.compile(f"(?=({self._trie_pattern(0)}))") if self._keyword_families else None
+
+    def _build_trie(self) -> None:
+        """Build goto, failure and output tables"""
+        self._goto: list[dict[str, int]] = [{}]
+        self._output: list[set[str]] = [set()]
+        self._terminal: list[bool] = [False]
+        for keyword in self._keyword_families:
+            node = 0
+            for char in keyword:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._output.append(set())
+                    self._terminal.append(False)
+                node = next_node
+            self._output[node].add(keyword)
+            self._terminal[node] = True
+
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] |= self._output[self._fail[child]]
+
+    def _iter_python(self, text: str) -> set[str]:
+        """Find all keywords in lowercased text with the pure-Python automaton"""
+        found: set[str] = set()
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node]:
+                found |= output[node]
+        return found
+
+    def _trie_pattern(self, node: int) -> str:
+        """Render the trie below a node as a greedy, longest-first regex"""
+        branches = [
+            re.escape(char) + self._trie_pattern(child)
+            for char, child in sorted(self._goto[node].items())
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if self._terminal[node] else body
+
+    def found_keywords(self, text: str) -> set[str]:
+        """Get every keyword occurring in the text (case-insensitive)"""
+        text = text.lower()
+        if self._native is not None:
+            return {keyword for _, keyword in self._native.iter(text)}
+        if self._regex is None:
+            return set()
+        found: set[str] = set()
+        contained = self._contained
+        for longest in set(self._regex.findall(text)):
+            found.update(contained[longest])
+        return found
+
+    def scan(self, text: str) -> dict[Hashable, set[str]]:
+        """
+        Scan text once and group keyword hits by family.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Mapping of family -> keywords found; families with no hits are omitted
+        """
+        start = timer() if STATS.enabled else 0.0
+        hits: dict[Hashable, set[str]] = {}
+        keyword_families = self._keyword_families
+        for keyword in self.found_keywords(text):
+            for family in keyword_families[keyword]:
+                hits.setdefault(family, set()).add(keyword)
+        if STATS.enabled:
+            STATS.record_family("keywords", timer() - start)
+            for family, keywords in hits.items():
+                STATS.record_hits(family, keywords)
+        return hits
+
+    def __len__(self) -> int:
+        return len(self._keyword_families)
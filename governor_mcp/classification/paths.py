@@ -0,0 +1,109 @@
+"""Literal lookups for path-shaped classification rules"""
+
+import re
+from dataclasses import dataclass, field
+
+# A run of literal characters: anything but regex metacharacters, or an
+# escaped punctuation character
+_LITERAL_CHAR = r"(?:[^\\.^$*+?{}\[\]|()]|\\[^A-Za-z0-9])"
+
+# Rule shapes: a literal anchored at the end (optionally with single optional
+# characters, e.g. ".*\.sqlite3?$") or a literal anywhere ("id_rsa.*")
+_SUFFIX_RULE = re.compile(rf"^(?:\.\*)?((?:{_LITERAL_CHAR}\??)+)\$$")
+_SUBSTRING_RULE = re.compile(rf"^(?:\.\*)?({_LITERAL_CHAR}+)(?:\.\*)?$")
+_LITERAL_TOKEN = re.compile(rf"({_LITERAL_CHAR})(\?)?")
+
+
+def _unescape(token: str) -> str:
+    return token[1:] if token.startswith("\\") else token
+
+
+def _expand(body: str) -> list[str] | None:
+    """Expand a literal with optional characters into every string it matches"""
+    variants = [""]
+    pos = 0
+    while pos < len(body):
+        match = _LITERAL_TOKEN.match(body, pos)
+        if match is None:
+            return None
+        char = _unescape(match.group(1))
+        if match.group(2):
+            variants = [v for variant in variants for v in (variant, variant + char)]
+        else:
+            variants = [variant + char for variant in variants]
+        pos = match.end()
+    return variants
+
+
+@dataclass
+class PathRuleIndex:
+    """
+    Index over rules that are plain suffix or substring checks.
+
+    Many path rules are written as regexes like ``.*\\.pem$`` (the input
+    ends with an extension) or ``id_rsa.*`` / ``\\.netrc`` (the input contains
+    a basename). Instead of running them through the regex engine at every
+    position, suffix rules become a single ``str.endswith`` over every
+    suffix and substring rules use ``str.__contains__`` on the lowercased
+    input.
+
+    Only case-insensitive rules whose source is entirely literal are
+    indexed; everything else stays with the regex engine. Inputs with
+    non-ASCII characters bypass the index, since Unicode case folding in
+    the regex engine differs from ``str.lower``.
+    """
+    # Source index of every rule the index answers for
+    indexed: set[int] = field(default_factory=set)
+    # Lowercased suffixes, checked against the input's tail in one call
+    suffixes: tuple[str, ...] = ()
+    substrings: tuple[str, ...] = ()
+
+    @classmethod
+    def build(cls, patterns: list[re.Pattern]) -> "PathRuleIndex":
+        """Index every rule that is a literal suffix or substring check"""
+        index = cls()
+        for position, pattern in enumerate(patterns):
+            if not pattern.flags & re.IGNORECASE or pattern.flags & re.MULTILINE:
+                continue
+            source = pattern.pattern
+            suffix = _SUFFIX_RULE.match(source)
+            substring = None if suffix else _SUBSTRING_RULE.match(source)
+            if suffix:
+                variants = _expand(suffix.group(1))
+                if not variants or not all(variants):
+                    continue
+                index.suffixes += tuple(variant.lower() for variant in variants)
+            elif substring:
+                variants = _expand(substring.group(1))
+                if not variants or len(variants) != 1:
+                    continue
+                index.substrings += (variants[0].lower(),)
+            else:
+                continue
+            index.indexed.add(position)
+        return index
+
+    def __bool__(self) -> bool:
+        return bool(self.indexed)
+
+    def matches(self, lower: str) -> bool:
+        """
+        Check the indexed rules against an input.
+
+        Args:
+            lower: The lowercased input; only exact for ASCII text, so
+                callers must check ``text.isascii()`` first
+
+        Returns:
+            True if any indexed rule matches
+        """
+        for substring in self.substrings:
+            if substring in lower:
+                return True
+        if self.suffixes:
+            if lower.endswith(self.suffixes):
+                return True
+            # "$" also matches just before a trailing newline
+            if lower.endswith("\n") and lower[:-1].endswith(self.suffixes):
+                return True
+        return False
@@ -1,6 +1,10 @@
 """Regex patterns for classifying resources and operations"""
 
 import re
+from typing import Iterable
+
+from .instrumentation import STATS, timer
+from .paths import PathRuleIndex
 
 # Sensitive file patterns - files that contain credentials, secrets, or sensitive config
 SENSITIVE_FILE_PATTERNS = [
@@ -54,10 +58,9 @@ DATABASE_PATTERNS = [
 
     # Database connection strings and operations
     re.compile(r"(postgres|postgresql|mysql|mongodb|redis|sqlite)://", re.IGNORECASE),
-    re.compile(r"(DROP|TRUNCATE|ALTER)\s+(TABLE|DATABASE|SCHEMA)", re.IGNORECASE),
-    re.compile(r"DELETE\s+FROM\s+\w+", re.IGNORECASE),
-    re.compile(r"(INSERT|UPDATE)\s+INTO", re.IGNORECASE),
-    re.compile(r"SELECT\s+.*\s+FROM\s+\w+", re.IGNORECASE),
+
+    # SQL statements (DROP/DELETE/INSERT/UPDATE/SELECT ...) are detected by
+    # the linear-time scanner in sql.py rather than backtracking regexes
 
     # Migration files
     re.compile(r"migrations?/.*\.(sql|py|rb|js|ts)", re.IGNORECASE),
@@ -121,17 +124,173 @@ READ_ONLY_PATTERNS = [
     re.compile(r"\bls\s+", re.IGNORECASE),
     re.compile(r"\bpwd\b", re.IGNORECASE),
     re.compile(r"\bwhoami\b", re.IGNORECASE),
-    re.compile(r"SELECT\s+.*\s+FROM", re.IGNORECASE),
+    # Read-only SQL (SELECT ... FROM) is detected by the scanner in sql.py
     re.compile(r"\.read\(", re.IGNORECASE),
     re.compile(r"open\(.*,\s*['\"]r['\"]", re.IGNORECASE),
 ]
 
 
-def matches_any_pattern(text: str, patterns: list[re.Pattern]) -> bool:
+class PatternSet:
+    """
+    A family of patterns compiled into a single alternation.
+
+    Each rule becomes a named group ``r<index>`` so one scan over the input
+    answers "does any rule in this family match?" and reports which rule
+    matched first. Per-rule flags are preserved with scoped inline flags.
+    """
+
+    def __init__(self, family: str, patterns: list[re.Pattern]):
+        self.family = family
+        self.patterns = list(patterns)
+
+        # Tagged form: one named group per rule, used to report which rule hit
+        tagged = [
+            f"(?P<r{index}>{self._scoped(pattern)})"
+            for index, pattern in enumerate(self.patterns)
+        ]
+        # An empty family must never match
+        self.tagged = re.compile("|".join(tagged) or r"(?!)")
+
+        # Per-rule regexes, compiled on first instrumented scan
+        self._rule_regexes: list[re.Pattern] | None = None
+
+        # Literal suffix/substring rules (".*\.pem$", "id_rsa.*") answered by
+        # string lookups; the rest stay in the residual alternation
+        self.path_index = PathRuleIndex.build(self.patterns)
+
+        # Untagged form for yes/no scans: capturing groups and scoped flags
+        # defeat some of the regex engine's optimizations, so when every rule
+        # shares the same flags they are applied to the whole alternation
+        indices = range(len(self.patterns))
+        self.compiled = self._compile_alternation(indices)
+        self.residual = self._compile_alternation(
+            [index for index in indices if index not in self.path_index.indexed]
+        )
+
+    def _compile_alternation(self, indices: Iterable[int]) -> re.Pattern:
+        """Compile the given rules into one untagged alternation"""
+        patterns = [self.patterns[index] for index in indices]
+        if not patterns:
+            return re.compile(r"(?!)")
+        flags = {pattern.flags for pattern in patterns}
+        if len(flags) == 1:
+            plain = [f"(?:{self._strip_wildcards(pattern.pattern)})" for pattern in patterns]
+            return re.compile("|".join(plain), flags.pop())
+        return re.compile("|".join(f"(?:{self._scoped(pattern)})" for pattern in patterns))
+
+    def _rules(self) -> list[re.Pattern]:
+        """Per-rule regexes with wildcards stripped, in source order"""
+        if self._rule_regexes is None:
+            self._rule_regexes = [
+                re.compile(self._strip_wildcards(pattern.pattern), pattern.flags)
+                for pattern in self.patterns
+            ]
+        return self._rule_regexes
+
+    def precompile(self) -> None:
+        """Compile the per-rule regexes now instead of on first use"""
+        self._rules()
+
+    @staticmethod
+    def _strip_wildcards(source: str) -> str:
+        """
+        Drop leading/trailing ``.*`` from a pattern.
+
+        Under ``search`` semantics they never change whether a match exists,
+        but a leading ``.*`` makes every start position rescan to the end of
+        the input, which is quadratic on long operations.
+        """
+        if source.startswith(".*?"):
+            source = source[3:]
+        elif source.startswith(".*"):
+            source = source[2:]
+        if source.endswith(".*"):
+            body = source[:-2]
+            trailing_backslashes = len(body) - len(body.rstrip("\\"))
+            if trailing_backslashes % 2 == 0:
+                source = body
+        return source
+
+    @classmethod
+    def _scoped(cls, pattern: re.Pattern) -> str:
+        """Wrap a pattern so its own flags apply only to its alternative"""
+        source = cls._strip_wildcards(pattern.pattern)
+        flags = ""
+        if pattern.flags & re.IGNORECASE:
+            flags += "i"
+        if pattern.flags & re.MULTILINE:
+            flags += "m"
+        if pattern.flags & re.DOTALL:
+            flags += "s"
+        return f"(?{flags}:{source})" if flags else f"(?:{source})"
+
+    def search(self, text: str) -> re.Match | None:
+        """Scan the text once for any rule in the family"""
+        return self.compiled.search(text)
+
+    def matches(self, text: str) -> bool:
+        """Check if any rule in the family matches the text"""
+        if STATS.enabled:
+            return self._matches_instrumented(text)
+        if self.path_index and text.isascii():
+            return (
+                self.path_index.matches(text.lower())
+                or self.residual.search(text) is not None
+            )
+        return self.compiled.search(text) is not None
+
+    def _matches_instrumented(self, text: str) -> bool:
+        """matches() that also attributes hits and time to each rule"""
+        start = timer()
+        matched = self.compiled.search(text) is not None
+        STATS.record_family(self.family, timer() - start)
+
+        for pattern, regex in zip(self.patterns, self._rules()):
+            rule_start = timer()
+            hit = regex.search(text) is not None
+            STATS.record_rule(self.family, pattern.pattern, hit, timer() - rule_start)
+        return matched
+
+    def first_match(self, text: str) -> int | None:
+        """Get the index of the rule that produced the leftmost match"""
+        match = self.tagged.search(text)
+        if match is None:
+            return None
+        return int(match.lastgroup[1:])
+
+    def first_pattern(self, text: str) -> str | None:
+        """Get the pattern string of the rule that produced the leftmost match"""
+        index = self.first_match(text)
+        return None if index is None else self.patterns[index].pattern
+
+    def matching_patterns(self, text: str) -> list[str]:
+        """Get list of pattern strings that match the text"""
+        # Single-scan rejection covers the common no-match case
+        if self.compiled.search(text) is None:
+            return []
+        return [pattern.pattern for pattern in self.patterns if pattern.search(text)]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+
+# Compiled single-scan pattern sets, one per family
+SENSITIVE_FILE_SET = PatternSet("sensitive_file", SENSITIVE_FILE_PATTERNS)
+DATABASE_SET = PatternSet("database", DATABASE_PATTERNS)
+API_SET = PatternSet("api", API_PATTERNS)
+SYSTEM_COMMAND_SET = PatternSet("system_command", SYSTEM_COMMAND_PATTERNS)
+READ_ONLY_SET = PatternSet("read_only", READ_ONLY_PATTERNS)
+
+
+def matches_any_pattern(text: str, patterns: list[re.Pattern] | PatternSet) -> bool:
     """Check if text matches any of the given patterns"""
+    if isinstance(patterns, PatternSet):
+        return patterns.matches(text)
     return any(pattern.search(text) for pattern in patterns)
 
 
-def get_matching_patterns(text: str, patterns: list[re.Pattern]) -> list[str]:
+def get_matching_patterns(text: str, patterns: list[re.Pattern] | PatternSet) -> list[str]:
     """Get list of pattern strings that match the text"""
+    if isinstance(patterns, PatternSet):
+        return patterns.matching_patterns(text)
     return [pattern.pattern for pattern in patterns if pattern.search(text)]
@@ -2,13 +2,10 @@
 
 from enum import Enum
 
-from .patterns import (
-    SENSITIVE_FILE_PATTERNS,
-    DATABASE_PATTERNS,
-    API_PATTERNS,
-    SYSTEM_COMMAND_PATTERNS,
-    matches_any_pattern,
-)
+from .features import OperationFeatures, extract_features
+from .hosts import url_host
+from .instrumentation import STATS
+from .patterns import matches_any_pattern
 
 
 class ResourceType(str, Enum):
@@ -32,6 +29,22 @@ RESOURCE_RISK_SCORES = {
 }
 
 
+# Substrings that indicate file system access
+FILE_INDICATORS = [
+    # File extensions
+    ".txt", ".json", ".yaml", ".yml", ".xml", ".csv",
+    ".py", ".js", ".ts", ".java", ".go", ".rs", ".rb",
+    ".md", ".html", ".css", ".sh", ".bash",
+
+    # Path indicators
+    "/", "\\", "path", "file", "directory", "folder",
+
+    # File operations
+    "read", "write", "save", "load", "open", "create",
+    "delete", "remove", "copy", "move", "rename",
+]
+
+
 class ResourceClassifier:
     """Classifies resources based on type and risk level"""
 
@@ -46,45 +59,105 @@ class ResourceClassifier:
         Returns:
             Tuple of (ResourceType, base_risk_score)
         """
-        combined = f"{operation} {context}".strip()
-
-        # Check patterns in order of risk (highest first)
-        if matches_any_pattern(combined, SYSTEM_COMMAND_PATTERNS):
-            return ResourceType.SYSTEM_COMMAND, RESOURCE_RISK_SCORES[ResourceType.SYSTEM_COMMAND]
-
-        if matches_any_pattern(combined, DATABASE_PATTERNS):
-            return ResourceType.DATABASE, RESOURCE_RISK_SCORES[ResourceType.DATABASE]
-
-        if matches_any_pattern(combined, SENSITIVE_FILE_PATTERNS):
-            return ResourceType.SENSITIVE_FILE, RESOURCE_RISK_SCORES[ResourceType.SENSITIVE_FILE]
-
-        if matches_any_pattern(combined, API_PATTERNS):
-            return ResourceType.EXTERNAL_API, RESOURCE_RISK_SCORES[ResourceType.EXTERNAL_API]
+        return self.classify_features(extract_features(operation, context))
+
+    def classify_features(self, features: OperationFeatures) -> tuple[ResourceType, float]:
+        """Classify a resource from pre-extracted operation features"""
+        resource_type = self._classify_type(features)
+        if STATS.enabled:
+            self._record_decision(resource_type, features)
+        return resource_type, RESOURCE_RISK_SCORES[resource_type]
+
+    def _classify_type(self, features: OperationFeatures) -> ResourceType:
+        """Determine the resource type from operation features"""
+        combined = features.combined
+        rules = features.rules
+
+        # Configured hosts may rank above any pattern family, so the riskier
+        # of the host and pattern verdicts wins
+        host_type = self._classify_hosts(features)
+        pattern_type = self._classify_patterns(features)
+        if pattern_type is not None and host_type is not None:
+            return max(pattern_type, host_type, key=RESOURCE_RISK_SCORES.__getitem__)
+        if pattern_type is not None:
+            return pattern_type
+
+        # Configured hosts classify URLs more precisely than the API patterns
+        if host_type is not None:
+            return host_type
+
+        if matches_any_pattern(combined, rules.api):
+            return ResourceType.EXTERNAL_API
 
         # Check for generic file operations
-        if self._is_file_operation(combined):
-            return ResourceType.LOCAL_FILE, RESOURCE_RISK_SCORES[ResourceType.LOCAL_FILE]
+        if ResourceType.LOCAL_FILE in features.combined_hits:
+            return ResourceType.LOCAL_FILE
 
         # Default to memory (lowest risk)
-        return ResourceType.MEMORY, RESOURCE_RISK_SCORES[ResourceType.MEMORY]
-
-    def _is_file_operation(self, text: str) -> bool:
-        """Check if the operation involves file system access"""
-        file_indicators = [
-            # File extensions
-            ".txt", ".json", ".yaml", ".yml", ".xml", ".csv",
-            ".py", ".js", ".ts", ".java", ".go", ".rs", ".rb",
-            ".md", ".html", ".css", ".sh", ".bash",
-
-            # Path indicators
-            "/", "\\", "path", "file", "directory", "folder",
-
-            # File operations
-            "read", "write", "save", "load", "open", "create",
-            "delete", "remove", "copy", "move", "rename",
-        ]
-        text_lower = text.lower()
-        return any(indicator in text_lower for indicator in file_indicators)
+        return ResourceType.MEMORY
+
+    def _classify_patterns(self, features: OperationFeatures) -> ResourceType | None:
+        """Check the system, database and sensitive file families, highest risk first"""
+        combined = features.combined
+        rules = features.rules
+        if matches_any_pattern(combined, rules.system_command):
+            return ResourceType.SYSTEM_COMMAND
+        if features.sql.is_database or matches_any_pattern(combined, rules.database):
+            return ResourceType.DATABASE
+        if matches_any_pattern(combined, rules.sensitive_file):
+            return ResourceType.SENSITIVE_FILE
+        return None
+
+    def _classify_hosts(self, features: OperationFeatures) -> ResourceType | None:
+        """Resolve URL hosts through the host trie, or None if none is known"""
+        hosts = features.rules.hosts
+        if not hosts or not features.urls:
+            return None
+        host_types = hosts.lookup_urls(features.urls)
+        if not host_types:
+            return None
+        # Unknown hosts next to known ones still count as external calls
+        if len(host_types) < len(features.urls) and matches_any_pattern(features.combined, features.rules.api):
+            host_types.append(ResourceType.EXTERNAL_API)
+        return max(host_types, key=RESOURCE_RISK_SCORES.__getitem__)
+
+    def _decided_by_hosts(self, resource_type: ResourceType, features: OperationFeatures) -> bool:
+        """Check whether the host trie decided the resource type"""
+        rules = features.rules
+        same_type = {
+            ResourceType.SYSTEM_COMMAND: rules.system_command,
+            ResourceType.DATABASE: rules.database,
+            ResourceType.SENSITIVE_FILE: rules.sensitive_file,
+        }.get(resource_type)
+        if self._classify_hosts(features) != resource_type:
+            return False
+        if resource_type == ResourceType.DATABASE and features.sql.is_database:
+            return False
+        # Patterns of the same type decide ties with the hosts
+        return same_type is None or same_type.search(features.combined) is None
+
+    def _record_decision(self, resource_type: ResourceType, features: OperationFeatures) -> None:
+        """Record which rule decided the resource type (instrumentation only)"""
+        verdict = f"resource:{resource_type.value}"
+        rules = features.rules
+        pattern_sets = {
+            ResourceType.SYSTEM_COMMAND: rules.system_command,
+            ResourceType.DATABASE: rules.database,
+            ResourceType.SENSITIVE_FILE: rules.sensitive_file,
+            ResourceType.EXTERNAL_API: rules.api,
+        }
+        if resource_type == ResourceType.DATABASE and features.sql.is_database:
+            STATS.record_decision(verdict, "sql", sorted(features.sql.shapes))
+        elif self._decided_by_hosts(resource_type, features):
+            hosts = sorted({url_host(url) for url in features.urls} - {None})
+            STATS.record_decision(verdict, "hosts", hosts)
+        elif resource_type in pattern_sets:
+            pattern_set = pattern_sets[resource_type]
+            STATS.record_decision(verdict, pattern_set.family, [pattern_set.first_pattern(features.combined)])
+        elif resource_type == ResourceType.LOCAL_FILE:
+            STATS.record_decision(verdict, resource_type, sorted(features.combined_hits[resource_type]))
+        else:
+            STATS.record_decision(verdict, "default", [resource_type.value])
 
     def get_risk_score(self, resource_type: ResourceType) -> float:
         """Get the base risk score for a resource type"""
@@ -0,0 +1,456 @@
+"""Compiled rule sets and hot-reloadable external rule packs"""
+
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Hashable
+
+from .hosts import HostSuffixTrie
+from .keywords import KeywordAutomaton
+from . import patterns as _patterns
+from .patterns import (
+    API_PATTERNS,
+    DATABASE_PATTERNS,
+    READ_ONLY_PATTERNS,
+    SENSITIVE_FILE_PATTERNS,
+    SYSTEM_COMMAND_PATTERNS,
+    PatternSet,
+)
+
+try:  # TOML rule packs (stdlib on Python 3.11+)
+    import tomllib
+except ImportError:  # pragma: no cover - depends on environment
+    tomllib = None
+
+# Pattern families a rule pack may define, with their built-in rules
+PATTERN_FAMILIES = {
+    "sensitive_file": SENSITIVE_FILE_PATTERNS,
+    "database": DATABASE_PATTERNS,
+    "api": API_PATTERNS,
+    "system_command": SYSTEM_COMMAND_PATTERNS,
+    "read_only": READ_ONLY_PATTERNS,
+}
+
+# Keyword families a rule pack may define
+KEYWORD_FAMILIES = (
+    "read", "write", "delete", "execute",
+    "single", "multiple", "collection", "system",
+    "local_file",
+)
+
+# Environment variable naming a rule pack to load at startup
+RULES_PATH_ENV = "GOVERNOR_RULES_PATH"
+
+# Minimum seconds between checks of a rule pack's modification time
+DEFAULT_CHECK_INTERVAL = 2.0
+
+
+def _default_keywords() -> dict[str, list[str]]:
+    """Get the built-in keyword lists by family name"""
+    from .action_classifier import ActionClassifier
+    from .resource_classifier import FILE_INDICATORS
+
+    return {
+        "read": ActionClassifier.READ_KEYWORDS,
+        "write": ActionClassifier.WRITE_KEYWORDS,
+        "delete": ActionClassifier.DELETE_KEYWORDS,
+        "execute": ActionClassifier.EXECUTE_KEYWORDS,
+        "single": ActionClassifier.SINGLE_KEYWORDS,
+        "multiple": ActionClassifier.MULTIPLE_KEYWORDS,
+        "collection": ActionClassifier.COLLECTION_KEYWORDS,
+        "system": ActionClassifier.SYSTEM_KEYWORDS,
+        "local_file": FILE_INDICATORS,
+    }
+
+
+def _keyword_family_keys() -> dict[str, Hashable]:
+    """Map keyword family names to the enum members the classifiers use"""
+    from .action_classifier import ActionType, ScopeType
+    from .resource_classifier import ResourceType
+
+    keys: dict[str, Hashable] = {action.value: action for action in ActionType}
+    keys.update({scope.value: scope for scope in ScopeType})
+    keys["local_file"] = ResourceType.LOCAL_FILE
+    return keys
+
+
+@dataclass
+class RuleSet:
+    """
+    An immutable, fully compiled set of classification rules.
+
+    Classifiers pin the active rule set once per assessment, so swapping in
+    a new one never changes the rules an in-flight assessment sees.
+    """
+    sensitive_file: PatternSet
+    database: PatternSet
+    api: PatternSet
+    system_command: PatternSet
+    read_only: PatternSet
+    automaton: KeywordAutomaton
+    # Host/domain -> ResourceType for URLs (empty unless configured)
+    hosts: HostSuffixTrie = field(default_factory=HostSuffixTrie)
+    version: int = 0
+    source: str = "builtin"
+    loaded_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def pattern_sets(self) -> list[PatternSet]:
+        return [self.sensitive_file, self.database, self.api, self.system_command, self.read_only]
+
+    @property
+    def rule_count(self) -> int:
+        """Total number of patterns and keywords"""
+        return (
+            sum(len(pattern_set) for pattern_set in self.pattern_sets)
+            + sum(len(keywords) for keywords in self.automaton.families.values())
+            + len(self.hosts)
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": self.version,
+            "source": self.source,
+            "loaded_at": self.loaded_at.isoformat(),
+            "rule_count": self.rule_count,
+            "patterns": {pattern_set.family: len(pattern_set) for pattern_set in self.pattern_sets},
+            "keywords": {
+                str(getattr(family, "value", family)): len(keywords)
+                for family, keywords in self.automaton.families.items()
+            },
+            "hosts": len(self.hosts),
+            "host_cache": self.hosts.cache_info(),
+        }
+
+
+def build_rule_set(
+    patterns: dict[str, list[re.Pattern]],
+    keywords: dict[str, list[str]],
+    hosts: dict[str, str] | None = None,
+    version: int = 0,
+    source: str = "builtin",
+) -> RuleSet:
+    """
+    Compile pattern and keyword families into a rule set.
+
+    Args:
+        patterns: Compiled patterns by family name (see PATTERN_FAMILIES)
+        keywords: Keywords by family name (see KEYWORD_FAMILIES)
+        hosts: Resource type name by host or domain, e.g.
+            {"internal.example.com": "local_file"}
+        version: Version number of the rule set
+        source: Where the rules came from, for reporting
+
+    Returns:
+        RuleSet ready to be activated
+    """
+    return RuleSet(
+        **{family: PatternSet(family, patterns[family]) for family in PATTERN_FAMILIES},
+        automaton=_build_automaton(keywords),
+        hosts=_build_hosts(hosts or {}),
+        version=version,
+        source=source,
+    )
+
+
+def _build_automaton(keywords: dict[str, list[str]]) -> KeywordAutomaton:
+    """Build the keyword automaton keyed by the classifiers' enum members"""
+    keys = _keyword_family_keys()
+    return KeywordAutomaton({keys[family]: keywords[family] for family in KEYWORD_FAMILIES})
+
+
+def _build_hosts(hosts: dict[str, str]) -> HostSuffixTrie:
+    """Build the host trie, validating resource type names"""
+    from .resource_classifier import ResourceType
+
+    trie = HostSuffixTrie()
+    for domain, resource in hosts.items():
+        try:
+            trie.add(domain, ResourceType(resource))
+        except ValueError as e:
+            raise ValueError(f"hosts.{domain}: {e}") from e
+    return trie
+
+
+def _parse_pattern(family: str, index: int, entry: Any) -> re.Pattern:
+    """Compile one rule pack pattern entry"""
+    if isinstance(entry, str):
+        source, ignore_case = entry, True
+    elif isinstance(entry, dict) and isinstance(entry.get("pattern"), str):
+        source, ignore_case = entry["pattern"], bool(entry.get("ignore_case", True))
+    else:
+        raise ValueError(f"patterns.{family}[{index}]: expected a string or {{pattern = ...}} table")
+    try:
+        return re.compile(source, re.IGNORECASE if ignore_case else 0)
+    except re.error as e:
+        raise ValueError(f"patterns.{family}[{index}]: invalid regex {source!r}: {e}") from e
+
+
+def parse_rule_pack(data: dict[str, Any], version: int = 0, source: str = "") -> RuleSet:
+    """
+    Validate a decoded rule pack and compile it into a rule set.
+
+    A rule pack has optional ``patterns`` and ``keywords`` tables keyed by
+    family name, and an optional ``hosts`` table mapping hosts and domains
+    to a resource type. With ``mode = "extend"`` (the default) its rules are
+    added to the built-in ones; with ``mode = "replace"`` the families it
+    defines replace the built-in rules of those families.
+
+    Args:
+        data: Decoded TOML/JSON document
+        version: Version number to assign to the rule set
+        source: Where the rules came from, for reporting
+
+    Returns:
+        Compiled RuleSet
+
+    Raises:
+        ValueError: If the pack is malformed
+    """
+    if not isinstance(data, dict):
+        raise ValueError("rule pack must be a table/object")
+    mode = data.get("mode", "extend")
+    if mode not in ("extend", "replace"):
+        raise ValueError(f"mode must be 'extend' or 'replace', not {mode!r}")
+    unknown = set(data) - {"mode", "patterns", "keywords", "hosts", "name", "description"}
+    if unknown:
+        raise ValueError(f"unknown rule pack keys: {', '.join(sorted(unknown))}")
+
+    pack_patterns = data.get("patterns", {})
+    pack_keywords = data.get("keywords", {})
+    pack_hosts = data.get("hosts", {})
+    if not all(isinstance(table, dict) for table in (pack_patterns, pack_keywords, pack_hosts)):
+        raise ValueError("patterns, keywords and hosts must be tables/objects")
+    if not all(isinstance(resource, str) for resource in pack_hosts.values()):
+        raise ValueError("hosts values must be resource type names")
+
+    patterns = {family: list(rules) for family, rules in PATTERN_FAMILIES.items()}
+    for family, entries in pack_patterns.items():
+        if family not in PATTERN_FAMILIES:
+            raise ValueError(f"unknown pattern family: {family}")
+        if not isinstance(entries, list):
+            raise ValueError(f"patterns.{family} must be a list")
+        compiled = [_parse_pattern(family, index, entry) for index, entry in enumerate(entries)]
+        patterns[family] = compiled if mode == "replace" else patterns[family] + compiled
+
+    keywords = {family: list(words) for family, words in _default_keywords().items()}
+    for family, words in pack_keywords.items():
+        if family not in KEYWORD_FAMILIES:
+            raise ValueError(f"unknown keyword family: {family}")
+        if not isinstance(words, list) or not all(isinstance(word, str) and word for word in words):
+            raise ValueError(f"keywords.{family} must be a list of non-empty strings")
+        words = [word.lower() for word in words]
+        keywords[family] = words if mode == "replace" else keywords[family] + words
+
+    return build_rule_set(patterns, keywords, pack_hosts, version=version, source=source)
+
+
+def load_rule_pack(path: str, version: int = 0) -> RuleSet:
+    """
+    Load, validate and compile a TOML or JSON rule pack file.
+
+    Args:
+        path: Path to a .toml or .json rule pack
+        version: Version number to assign to the rule set
+
+    Returns:
+        Compiled RuleSet
+
+    Raises:
+        ValueError: If the file cannot be decoded or is malformed
+        OSError: If the file cannot be read
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    try:
+        if path.endswith(".json"):
+            data = json.loads(raw)
+        else:
+            if tomllib is None:
+                raise ValueError("TOML rule packs require Python 3.11+; use JSON instead")
+            data = tomllib.loads(raw.decode("utf-8"))
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(f"cannot decode {path}: {e}") from e
+    except Exception as e:
+        if tomllib is not None and isinstance(e, tomllib.TOMLDecodeError):
+            raise ValueError(f"cannot decode {path}: {e}") from e
+        raise
+    return parse_rule_pack(data, version=version, source=path)
+
+
+# Active rule set; replaced wholesale, never mutated
+_active: RuleSet | None = None
+_versions = 0
+_loader: "RulePackLoader | None" = None
+
+
+def _activate(rule_set: RuleSet) -> None:
+    """Make a compiled rule set the active one"""
+    global _active
+    # Single reference assignment: readers see the old or the new set
+    _active = rule_set
+
+
+def _next_version() -> int:
+    global _versions
+    _versions += 1
+    return _versions
+
+
+def get_rule_set() -> RuleSet:
+    """
+    Get the active rule set.
+
+    When a rule pack is configured, its modification time is checked at
+    most once per check interval and the pack is reloaded if it changed.
+    """
+    if _loader is not None:
+        _loader.poll()
+    if _active is None:
+        _activate(RuleSet(
+            sensitive_file=_patterns.SENSITIVE_FILE_SET,
+            database=_patterns.DATABASE_SET,
+            api=_patterns.API_SET,
+            system_command=_patterns.SYSTEM_COMMAND_SET,
+            read_only=_patterns.READ_ONLY_SET,
+            automaton=_build_automaton(_default_keywords()),
+        ))
+    return _active
+
+
+class RulePackLoader:
+    """
+    Watches a rule pack file and swaps in a freshly compiled rule set when
+    its modification time changes.
+
+    Checks are throttled to one stat() per check interval. A reload compiles
+    the new rules completely before activating them; if loading fails, the
+    previous rules stay active and the error is reported in the metrics.
+    """
+
+    def __init__(self, path: str, check_interval: float = DEFAULT_CHECK_INTERVAL):
+        self.path = path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._next_check = 0.0
+        self._mtime: float | None = None
+        self.reloads = 0
+        self.failures = 0
+        self.last_reload_ms: float | None = None
+        self.last_error: str | None = None
+        self.last_checked: datetime | None = None
+
+    def poll(self) -> bool:
+        """Reload the pack if the check interval elapsed and it changed"""
+        now = time.monotonic()
+        if now < self._next_check:
+            return False
+        # Only one caller reloads; others keep using the current rules
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            self._next_check = now + self.check_interval
+            return self._reload_if_changed()
+        finally:
+            self._lock.release()
+
+    def reload(self) -> bool:
+        """Reload the pack now, even if it has not changed"""
+        with self._lock:
+            self._mtime = None
+            return self._reload_if_changed()
+
+    def _reload_if_changed(self) -> bool:
+        self.last_checked = datetime.now()
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError as e:
+            self.failures += 1
+            self.last_error = str(e)
+            return False
+        if mtime == self._mtime:
+            return False
+
+        started = time.perf_counter()
+        try:
+            rule_set = load_rule_pack(self.path, version=_next_version())
+        except (OSError, ValueError) as e:
+            self.failures += 1
+            self.last_error = str(e)
+            # Do not retry a broken file until it changes again
+            self._mtime = mtime
+            return False
+        _activate(rule_set)
+        self._mtime = mtime
+        self.reloads += 1
+        self.last_reload_ms = round((time.perf_counter() - started) * 1000, 3)
+        self.last_error = None
+        return True
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get reload metrics"""
+        return {
+            "path": self.path,
+            "check_interval": self.check_interval,
+            "reloads": self.reloads,
+            "failures": self.failures,
+            "last_reload_ms": self.last_reload_ms,
+            "last_error": self.last_error,
+            "last_checked": self.last_checked.isoformat() if self.last_checked else None,
+        }
+
+
+def configure_rule_pack(path: str | None, check_interval: float = DEFAULT_CHECK_INTERVAL) -> RuleSet:
+    """
+    Load a rule pack and keep it hot-reloaded, or revert to built-in rules.
+
+    Args:
+        path: Path to a .toml or .json rule pack; None or "" for built-in rules
+        check_interval: Minimum seconds between modification time checks
+
+    Returns:
+        The active rule set
+
+    Raises:
+        ValueError: If the pack is malformed
+        OSError: If the file cannot be read
+    """
+    global _loader, _active
+    if not path:
+        _loader = None
+        _active = None
+        return get_rule_set()
+
+    loader = RulePackLoader(path, check_interval)
+    # Fail loudly on the initial load instead of silently using built-ins
+    started = time.perf_counter()
+    rule_set = load_rule_pack(path, version=_next_version())
+    loader._mtime = os.stat(path).st_mtime
+    loader._next_check = time.monotonic() + check_interval
+    loader.reloads = 1
+    loader.last_reload_ms = round((time.perf_counter() - started) * 1000, 3)
+    _activate(rule_set)
+    _loader = loader
+    return rule_set
+
+
+def configure_rule_pack_from_env() -> RuleSet | None:
+    """Configure the rule pack named by GOVERNOR_RULES_PATH, if set"""
+    path = os.environ.get(RULES_PATH_ENV)
+    return configure_rule_pack(path) if path else None
+
+
+def get_rule_pack_loader() -> RulePackLoader | None:
+    """Get the active rule pack loader, if a pack is configured"""
+    return _loader
+
+
+def get_rule_stats() -> dict[str, Any]:
+    """Get the active rule set summary and reload metrics"""
+    stats = get_rule_set().to_dict()
+    stats["reload"] = _loader.get_stats() if _loader is not None else None
+    return stats
@@ -0,0 +1,194 @@
+"""Linear-time SQL statement scanning for Governor MCP"""
+
+import re
+from dataclasses import dataclass, field
+
+from .instrumentation import STATS, timer
+
+# Word tokens (optionally dotted, e.g. schema.table) and the punctuation the
+# scanner cares about; everything else is skipped by the search
+TOKEN_PATTERN = re.compile(r"\w+(?:\.\w+)*|[;()']")
+
+# Verbs that start a SQL statement
+STATEMENT_VERBS = frozenset({
+    "select", "insert", "update", "delete", "merge", "replace", "upsert",
+    "create", "alter", "drop", "truncate",
+    "grant", "revoke",
+})
+
+# Keywords followed by a target object name
+_OBJECT_INTRODUCERS = frozenset({"from", "into", "table", "update", "join", "truncate"})
+_OBJECT_NOISE = frozenset({"if", "not", "exists", "only", "table"})
+
+_DDL_VERBS = frozenset({"drop", "truncate", "alter"})
+_DDL_OBJECTS = frozenset({"table", "database", "schema"})
+
+
+@dataclass
+class SqlStatement:
+    """A single SQL statement found by the scanner"""
+    verb: str
+    start: int
+    end: int = 0
+    objects: list[str] = field(default_factory=list)
+    has_where: bool = False
+
+    @property
+    def missing_where(self) -> bool:
+        """True for DELETE/UPDATE statements that affect every row"""
+        return self.verb in ("delete", "update") and not self.has_where
+
+    def to_dict(self) -> dict:
+        return {
+            "verb": self.verb,
+            "objects": self.objects,
+            "has_where": self.has_where,
+            "missing_where": self.missing_where,
+        }
+
+
+@dataclass
+class SqlScan:
+    """Result of scanning text for SQL statements"""
+    statements: list[SqlStatement] = field(default_factory=list)
+
+    # Statement shapes that mark the text as a database operation:
+    # "ddl" (DROP/TRUNCATE/ALTER TABLE|DATABASE|SCHEMA), "delete" (DELETE FROM x),
+    # "write" (INSERT/UPDATE INTO, UPDATE x SET) and "select" (SELECT ... FROM x,
+    # with at least one column or expression before FROM)
+    shapes: set[str] = field(default_factory=set)
+
+    @property
+    def is_database(self) -> bool:
+        """True if the text contains a recognizable SQL statement"""
+        return bool(self.shapes)
+
+    @property
+    def is_read_only(self) -> bool:
+        """True if every recognized statement only reads data"""
+        return self.shapes == {"select"}
+
+    @property
+    def verbs(self) -> list[str]:
+        """Statement verbs in order of first appearance"""
+        return list(dict.fromkeys(statement.verb for statement in self.statements))
+
+    @property
+    def missing_where(self) -> bool:
+        """True if any DELETE/UPDATE statement has no WHERE clause"""
+        return any(statement.missing_where for statement in self.statements)
+
+
+def scan_sql(text: str) -> SqlScan:
+    """
+    Split text into SQL statements and detect their shape in one pass.
+
+    The scanner never backtracks: it visits each token once, skips
+    single-quoted literals inside statements with str.find, and tracks only
+    the previous few tokens. Quotes outside a statement are treated as
+    separators, so SQL embedded in shell commands (psql -c "...") is found.
+
+    Args:
+        text: Operation text that may contain SQL
+
+    Returns:
+        SqlScan with statements and detected shapes
+    """
+    started = timer() if STATS.enabled else 0.0
+    result = SqlScan()
+    statements = result.statements
+    shapes = result.shapes
+    search = TOKEN_PATTERN.search
+
+    current: SqlStatement | None = None
+    depth = 0
+    saw_select = False
+    # SELECT ... FROM needs something to select: "select from x" is prose
+    select_columns = False
+    prev = prev2 = ""
+    prev_end = 0
+    expect_object = False
+    pos = 0
+    length = len(text)
+
+    while pos < length:
+        match = search(text, pos)
+        if match is None:
+            break
+        token = match.group()
+        pos = match.end()
+
+        if token == "'":
+            if current is not None:
+                # Skip a SQL string literal ('' is an escaped quote)
+                while True:
+                    close = text.find("'", pos)
+                    if close == -1:
+                        pos = length
+                        break
+                    pos = close + 1
+                    if pos < length and text[pos] == "'":
+                        pos += 1
+                        continue
+                    break
+            continue
+
+        if token == ";":
+            if current is not None:
+                current.end = match.start()
+                current = None
+            depth = 0
+            saw_select = select_columns = False
+            prev = prev2 = ""
+            expect_object = False
+            continue
+
+        if token == "(":
+            depth += 1
+            continue
+        if token == ")":
+            depth = max(0, depth - 1)
+            continue
+
+        word = token.lower()
+
+        if word in STATEMENT_VERBS and current is None:
+            current = SqlStatement(verb=word, start=match.start())
+            statements.append(current)
+
+        if current is not None:
+            if expect_object and word not in _OBJECT_NOISE:
+                current.objects.append(token)
+                expect_object = False
+            if word in _OBJECT_INTRODUCERS:
+                expect_object = True
+            if word == "where" and depth == 0:
+                current.has_where = True
+
+        # Shape detection over consecutive tokens
+        if word == "select":
+            saw_select = True
+            select_columns = False
+        elif prev == "select":
+            # Columns are a word token or skipped punctuation such as "*"
+            select_columns = word != "from" or bool(text[prev_end:match.start()].strip())
+        if prev in _DDL_VERBS and word in _DDL_OBJECTS:
+            shapes.add("ddl")
+        elif prev in ("insert", "update") and word == "into":
+            shapes.add("write")
+        elif prev2 == "delete" and prev == "from":
+            shapes.add("delete")
+        elif prev2 == "update" and word == "set":
+            shapes.add("write")
+        elif prev == "from" and saw_select and select_columns and prev2 != "delete":
+            shapes.add("select")
+
+        prev2, prev = prev, word
+        prev_end = pos
+
+    if current is not None:
+        current.end = length
+    if STATS.enabled:
+        STATS.record_family("sql", timer() - started)
+        STATS.record_hits("sql", shapes)
+    return result
@@ -0,0 +1,177 @@
+"""Per-statement classification of multi-statement SQL scripts"""
+
+import re
+from dataclasses import dataclass
+
+from .action_classifier import ActionClassifier, ActionType, ScopeType
+from .features import OperationFeatures
+from .instrumentation import STATS, timer
+from .resource_classifier import ResourceClassifier, ResourceType
+from .rules import RuleSet, get_rule_set
+from .sql import SqlScan, scan_sql
+
+# Scripts longer than this are not split; the whole-text verdict applies
+MAX_SCRIPT_CHARS = 1024 * 1024
+
+# Distinct statement shapes remembered per classifier
+SHAPE_CACHE_SIZE = 2048
+
+# Numeric literals; identifiers such as c1 have no word boundary before
+# the digit and are left alone
+NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+
+# A parenthesized list of masked literals, e.g. one VALUES row; every
+# alternative starts with a different character, so matching is linear
+VALUE_TUPLE = re.compile(r"\((?:[\s,?]|null|true|false|default)*\)", re.IGNORECASE)
+
+# Consecutive masked rows of a multi-row VALUES list
+TUPLE_RUN = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+
+
+@dataclass(frozen=True)
+class StatementVerdict:
+    """Classification of one SQL statement of a script"""
+    index: int
+    verb: str
+    start: int
+    end: int
+    shape: str
+    resource_type: ResourceType
+    resource_score: float
+    action_type: ActionType
+    action_multiplier: float
+    scope_type: ScopeType
+    scope_multiplier: float
+
+    @property
+    def risk_score(self) -> float:
+        return self.resource_score * self.action_multiplier * self.scope_multiplier
+
+
+def statement_shape(text: str) -> str:
+    """
+    Reduce a statement to its shape by masking literals.
+
+    String and numeric literals become "?", and a VALUES list of any number
+    of literal rows becomes a single "(?)", so statements that differ only
+    in their data share a shape. Single-quoted literals are skipped with
+    str.find ('' is an escaped quote), keeping the pass linear.
+
+    Args:
+        text: One SQL statement
+
+    Returns:
+        The statement with literals masked
+    """
+    parts = []
+    pos = 0
+    length = len(text)
+    while True:
+        quote = text.find("'", pos)
+        if quote == -1:
+            parts.append(text[pos:])
+            break
+        parts.append(text[pos:quote])
+        parts.append("?")
+        pos = quote + 1
+        while True:
+            close = text.find("'", pos)
+            if close == -1:
+                pos = length
+                break
+            pos = close + 1
+            if pos < length and text[pos] == "'":
+                pos += 1
+                continue
+            break
+    shape = NUMBER_LITERAL.sub("?", "".join(parts))
+    shape = VALUE_TUPLE.sub("(?)", shape)
+    return TUPLE_RUN.sub("(?)", shape).strip()
+
+
+class StatementClassifier:
+    """
+    Splits SQL scripts into statements and classifies each one.
+
+    Statements are found by the linear SQL scanner. Each statement is
+    classified by its shape (see statement_shape) with the regular resource,
+    action and scope classifiers, and shapes are memoized, so a script of
+    thousands of INSERTs that differ only in their values costs one
+    classification per distinct shape.
+    """
+
+    def __init__(
+        self,
+        resource_classifier: ResourceClassifier | None = None,
+        action_classifier: ActionClassifier | None = None,
+        cache_size: int = SHAPE_CACHE_SIZE,
+    ):
+        self.resource_classifier = resource_classifier or ResourceClassifier()
+        self.action_classifier = action_classifier or ActionClassifier()
+        self.cache_size = cache_size
+        self._shapes: dict[tuple[str, str, int], tuple] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def classify(
+        self,
+        operation: str,
+        context: str = "",
+        rules: RuleSet | None = None,
+        scan: SqlScan | None = None,
+    ) -> list[StatementVerdict]:
+        """
+        Classify every statement of a multi-statement SQL script.
+
+        Args:
+            operation: Operation text that may contain SQL statements
+            context: Additional context applied to every statement
+            rules: Rule set to classify with (default: the active rules)
+            scan: Existing scan of exactly this operation text, to avoid
+                scanning it again
+
+        Returns:
+            One verdict per statement in script order, or an empty list if
+            the operation has fewer than two statements or is longer than
+            MAX_SCRIPT_CHARS
+        """
+        if len(operation) > MAX_SCRIPT_CHARS:
+            return []
+        started = timer() if STATS.enabled else 0.0
+        statements = (scan or scan_sql(operation)).statements
+        if len(statements) < 2:
+            return []
+
+        rules = rules or get_rule_set()
+        verdicts = []
+        for index, statement in enumerate(statements):
+            shape = statement_shape(operation[statement.start:statement.end])
+            key = (shape, context, rules.version)
+            classification = self._shapes.get(key)
+            if classification is None:
+                self.misses += 1
+                classification = self._classify_shape(shape, context, rules)
+                if len(self._shapes) >= self.cache_size:
+                    self._shapes.clear()
+                self._shapes[key] = classification
+            else:
+                self.hits += 1
+            verdicts.append(StatementVerdict(
+                index, statement.verb, statement.start, statement.end, shape, *classification
+            ))
+
+        if STATS.enabled:
+            STATS.record_family("statements", timer() - started)
+        return verdicts
+
+    def _classify_shape(self, shape: str, context: str, rules: RuleSet) -> tuple:
+        """Classify one statement shape with the regular classifiers"""
+        features = OperationFeatures(shape, context, rules)
+        resource_type, resource_score = self.resource_classifier.classify_features(features)
+        action_type, action_multiplier = self.action_classifier.classify_action_features(features)
+        scope_type, scope_multiplier = self.action_classifier.classify_scope_features(features)
+        return resource_type, resource_score, action_type, action_multiplier, scope_type, scope_multiplier
+
+    def get_stats(self) -> dict[str, int]:
+        """Get shape cache statistics"""
+        return {"shapes": len(self._shapes), "hits": self.hits, "misses": self.misses}
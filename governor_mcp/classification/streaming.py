@@ -0,0 +1,338 @@
+"""Chunked streaming classification for very large operations"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from .action_classifier import (
+    ACTION_MULTIPLIERS,
+    ACTION_PRECEDENCE,
+    SCOPE_MULTIPLIERS,
+    SCOPE_PRECEDENCE,
+    ActionType,
+    ScopeType,
+)
+from .features import URL_PATTERN
+from .hosts import url_host
+from .resource_classifier import RESOURCE_RISK_SCORES, ResourceType
+from .rules import RuleSet, get_rule_set
+from .sql import scan_sql
+
+# Inputs longer than this (operation + context) are classified in chunks
+STREAMING_THRESHOLD = 64 * 1024
+
+DEFAULT_CHUNK_SIZE = 16 * 1024
+
+# Characters re-scanned at the start of each chunk so that matches shorter
+# than the overlap are never split across a chunk boundary
+DEFAULT_OVERLAP = 512
+
+# Hard limit on characters scanned per input; the rest is not classified
+DEFAULT_MAX_SCAN_CHARS = 1024 * 1024
+
+
+def _resource_checks(rules: RuleSet) -> list:
+    """Resource families in order of risk (highest first)"""
+    return [
+        (ResourceType.SYSTEM_COMMAND, rules.system_command.matches),
+        (ResourceType.DATABASE, lambda window: rules.database.matches(window) or scan_sql(window).is_database),
+        (ResourceType.SENSITIVE_FILE, rules.sensitive_file.matches),
+        (ResourceType.EXTERNAL_API, rules.api.matches),
+    ]
+
+
+@dataclass
+class StreamingResult:
+    """Classification of a large input scanned in chunks"""
+    resource_type: ResourceType
+    action_type: ActionType
+    scope_type: ScopeType
+    chars_scanned: int
+    total_chars: int
+    chunks: int
+    stopped_early: bool
+    truncated: bool
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "chars_scanned": self.chars_scanned,
+            "total_chars": self.total_chars,
+            "chunks": self.chunks,
+            "stopped_early": self.stopped_early,
+            "truncated": self.truncated,
+        }
+
+
+class StreamingState:
+    """
+    Running verdict of a chunked scan.
+
+    Resource, action and scope only ever move towards higher risk as
+    windows are folded in, so the state after N windows is a valid verdict
+    for the text seen so far.
+    """
+
+    def __init__(self, rules: RuleSet | None = None):
+        self.rules = rules or get_rule_set()
+        self._resource_checks = _resource_checks(self.rules)
+        self.resource_rank = len(self._resource_checks)  # index into checks; len == none yet
+        self.file_hit = False
+        self.action_hits: set = set()
+        self.scope_hits: set = set()
+        self.read_only = False
+        self.sql_shapes: set[str] = set()
+        # Resource types of URL hosts found in the configured host trie, and
+        # whether a URL outside the trie was seen
+        self.host_types: set[ResourceType] = set()
+        self.unknown_host = False
+
+    def update(self, window: str, op_window: str | None = None) -> None:
+        """
+        Fold one window of text into the running verdict.
+
+        Args:
+            window: Text to scan for resource and scope
+            op_window: The part of the window that is operation text (and
+                so counts towards the action), or None if there is none
+        """
+        automaton = self.rules.automaton
+
+        # Resource: only families riskier than the current best
+        for rank in range(self.resource_rank):
+            if self._resource_checks[rank][1](window):
+                self.resource_rank = rank
+                break
+
+        if self.rules.hosts:
+            self._update_hosts(window)
+
+        hits = automaton.scan(window)
+        self.scope_hits.update(family for family in hits if family in SCOPE_MULTIPLIERS)
+        if ResourceType.LOCAL_FILE in hits:
+            self.file_hit = True
+
+        if op_window:
+            op_hits = hits if len(op_window) == len(window) else automaton.scan(op_window)
+            self.action_hits.update(family for family in op_hits if family in ACTION_MULTIPLIERS)
+            if not self.read_only and self.rules.read_only.matches(op_window):
+                self.read_only = True
+            self.sql_shapes |= scan_sql(op_window).shapes
+
+    def _update_hosts(self, window: str) -> None:
+        """Look up the hosts of the URLs in a window in the host trie"""
+        hosts = self.rules.hosts
+        for url in URL_PATTERN.findall(window):
+            host = url_host(url)
+            host_type = hosts.lookup(host) if host else None
+            if host_type is None:
+                self.unknown_host = True
+            else:
+                self.host_types.add(host_type)
+
+    @property
+    def saturated(self) -> bool:
+        """True once the highest possible combination has been reached"""
+        return (
+            self.resource_rank == 0
+            and ActionType.EXECUTE in self.action_hits
+            and ScopeType.SYSTEM in self.scope_hits
+        )
+
+    @property
+    def resource_type(self) -> ResourceType:
+        # Same precedence as ResourceClassifier: configured hosts override
+        # the API patterns, and the riskier of hosts and the other families wins
+        pattern_type = None
+        if self.resource_rank < len(self._resource_checks):
+            pattern_type = self._resource_checks[self.resource_rank][0]
+        if self.host_types:
+            candidates = set(self.host_types)
+            if pattern_type is not None and (pattern_type != ResourceType.EXTERNAL_API or self.unknown_host):
+                candidates.add(pattern_type)
+            return max(candidates, key=RESOURCE_RISK_SCORES.__getitem__)
+        if pattern_type is not None:
+            return pattern_type
+        elif self.file_hit:
+            return ResourceType.LOCAL_FILE
+        return ResourceType.MEMORY
+
+    @property
+    def action_type(self) -> ActionType:
+        action_type = next(
+            (action for action in ACTION_PRECEDENCE[:-1] if action in self.action_hits),
+            None,
+        )
+        if action_type is not None:
+            return action_type
+        if self.read_only or self.sql_shapes == {"select"} or ActionType.READ in self.action_hits:
+            return ActionType.READ
+        return ActionType.WRITE
+
+    @property
+    def scope_type(self) -> ScopeType:
+        return next(
+            (scope for scope in SCOPE_PRECEDENCE if scope in self.scope_hits),
+            ScopeType.SINGLE,
+        )
+
+    def result(self, **scan: Any) -> StreamingResult:
+        """Build a StreamingResult from the current verdict and scan statistics"""
+        return StreamingResult(
+            resource_type=self.resource_type,
+            action_type=self.action_type,
+            scope_type=self.scope_type,
+            **scan,
+        )
+
+
+class IncrementalClassifier:
+    """
+    Classifies an operation that arrives in pieces.
+
+    Each piece is scanned together with the last ``overlap`` characters of
+    the previous one, so a call to feed() costs time proportional to the
+    piece alone, and matches shorter than the overlap are never missed at
+    piece boundaries. Like StreamingClassifier, at most ``max_scan_chars``
+    characters of operation text are scanned; the result is marked
+    truncated when more were fed.
+    """
+
+    def __init__(
+        self,
+        context: str = "",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        overlap: int = DEFAULT_OVERLAP,
+        rules: RuleSet | None = None,
+        max_scan_chars: int = DEFAULT_MAX_SCAN_CHARS,
+    ):
+        if chunk_size <= overlap:
+            raise ValueError("chunk_size must be larger than overlap")
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.max_scan_chars = max_scan_chars
+        self.state = StreamingState(rules)
+        self.chars_scanned = 0
+        self.total_chars = 0
+        self.chunks = 0
+        self._tail = ""
+
+        # Context counts towards resource and scope, never the action
+        context = context.strip()
+        for start in range(0, len(context), chunk_size):
+            window_start = max(0, start - overlap)
+            self.state.update(context[window_start:start + chunk_size])
+
+    def feed(self, text: str) -> StreamingResult:
+        """
+        Scan the next piece of operation text.
+
+        Args:
+            text: Operation text following everything fed so far
+
+        Returns:
+            StreamingResult for all text fed so far
+        """
+        self.total_chars += len(text)
+        text = text[:self.remaining]
+        for start in range(0, len(text), self.chunk_size):
+            window = self._tail + text[start:start + self.chunk_size]
+            self.state.update(window, window)
+            self._tail = window[-self.overlap:]
+            self.chunks += 1
+        self.chars_scanned += len(text)
+        return self.result()
+
+    @property
+    def remaining(self) -> int:
+        """Characters that can still be scanned before the limit"""
+        return max(0, self.max_scan_chars - self.chars_scanned)
+
+    def result(self) -> StreamingResult:
+        """Get the verdict for all text fed so far"""
+        return self.state.result(
+            chars_scanned=self.chars_scanned,
+            total_chars=self.total_chars,
+            chunks=self.chunks,
+            stopped_early=False,
+            truncated=self.total_chars > self.chars_scanned,
+        )
+
+
+class StreamingClassifier:
+    """
+    Classifies operations in fixed-size chunks with bounded work per chunk.
+
+    Resource, action and scope are accumulated as running maxima, and the
+    scan stops as soon as the highest possible combination is reached.
+    Unlike the one-shot classifiers, a read-only match does not override
+    stronger action keywords found elsewhere: a `cat` late in a long script
+    cannot lower a verdict already established by earlier chunks.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        overlap: int = DEFAULT_OVERLAP,
+        max_scan_chars: int = DEFAULT_MAX_SCAN_CHARS,
+    ):
+        if chunk_size <= overlap:
+            raise ValueError("chunk_size must be larger than overlap")
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.max_scan_chars = max_scan_chars
+
+    def classify(self, operation: str, context: str = "", rules: RuleSet | None = None) -> StreamingResult:
+        """
+        Classify an operation by walking it in overlapping chunks.
+
+        Args:
+            operation: The operation description or command
+            context: Additional context (file paths, URLs, etc.)
+            rules: Rule set to classify with; defaults to the active one
+
+        Returns:
+            StreamingResult with the running verdict and scan statistics
+        """
+        combined = f"{operation} {context}"
+        stripped = combined.lstrip()
+        # Operation text ends here within the stripped combined string
+        operation_end = max(0, len(operation) - (len(combined) - len(stripped)))
+        combined = stripped.rstrip()
+        total = len(combined)
+        limit = min(total, self.max_scan_chars)
+        # Pin the rules so a reload mid-scan cannot mix rule sets
+        state = StreamingState(rules or get_rule_set())
+
+        start = 0
+        chunks = 0
+        stopped_early = False
+        while start < limit:
+            end = min(start + self.chunk_size, limit)
+            window_start = max(0, start - self.overlap)
+            window = combined[window_start:end]
+            chunks += 1
+
+            # Action: operation text only
+            op_window = window[:operation_end - window_start] if window_start < operation_end else None
+            state.update(window, op_window)
+
+            start = end
+            if state.saturated:
+                stopped_early = start < total
+                break
+
+        return state.result(
+            chars_scanned=start,
+            total_chars=total,
+            chunks=chunks,
+            stopped_early=stopped_early,
+            truncated=not stopped_early and start < total,
+        )
+
+    @staticmethod
+    def scores(result: StreamingResult) -> tuple[float, float, float]:
+        """Get (resource_score, action_multiplier, scope_multiplier) for a result"""
+        return (
+            RESOURCE_RISK_SCORES[result.resource_type],
+            ACTION_MULTIPLIERS[result.action_type],
+            SCOPE_MULTIPLIERS[result.scope_type],
+        )
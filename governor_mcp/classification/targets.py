@@ -0,0 +1,341 @@
+"""Structured context: target lists classified through a path prefix trie"""
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Hashable, Iterable
+
+from .action_classifier import ActionClassifier, ScopeType, SCOPE_MULTIPLIERS
+from .features import OperationFeatures
+from .instrumentation import STATS, timer
+from .resource_classifier import RESOURCE_RISK_SCORES, ResourceClassifier, ResourceType
+from .rules import RuleSet, get_rule_set
+from .sql import STATEMENT_VERBS, scan_sql
+
+# Path components whose keyword hits are remembered per classifier
+COMPONENT_CACHE_SIZE = 8192
+
+# Path separators; components between them are scanned for keywords once
+PATH_SEPARATORS = ("/", "\\")
+_SEPARATOR = re.compile(r"[/\\]+")
+
+# URL targets (and targets spanning lines) are classified one by one with
+# the full resource classifier, since host rules apply to them
+_URL_SCHEME = re.compile(r"://")
+_WHITESPACE = re.compile(r"\s")
+_LINE_BREAK = re.compile(r"[\r\n]")
+
+# SQL statements need one of these verbs; only lines holding one are scanned
+_SQL_VERB = re.compile(r"\b(?:" + "|".join(sorted(STATEMENT_VERBS)) + r")\b", re.IGNORECASE)
+
+# Pattern families checked across all other targets at once, in the order
+# (and risk) in which the resource classifier checks them
+FAMILY_ORDER = (
+    (ResourceType.SYSTEM_COMMAND, "system_command"),
+    (ResourceType.DATABASE, "database"),
+    (ResourceType.SENSITIVE_FILE, "sensitive_file"),
+    (ResourceType.EXTERNAL_API, "api"),
+)
+
+Hits = dict[Hashable, frozenset[str]]
+
+
+def dedupe_targets(targets: Iterable[str]) -> tuple[list[str], int]:
+    """
+    Strip and deduplicate context targets, keeping first occurrences.
+
+    Returns:
+        Tuple of (unique non-empty targets in input order, number of
+        duplicates dropped)
+    """
+    seen: dict[str, None] = {}
+    count = 0
+    for target in targets:
+        target = target.strip()
+        if target:
+            count += 1
+            seen[target] = None
+    return list(seen), count - len(seen)
+
+
+def _is_path(target: str) -> bool:
+    """True for targets that are split into path components"""
+    return (
+        any(separator in target for separator in PATH_SEPARATORS)
+        and not _URL_SCHEME.search(target)
+        and not _WHITESPACE.search(target)
+    )
+
+
+def _merge(first: Hits, second: Hits) -> Hits:
+    """Union of two keyword hit maps"""
+    if not second:
+        return first
+    if not first:
+        return second
+    merged = dict(first)
+    for family, keywords in second.items():
+        merged[family] = merged[family] | keywords if family in merged else keywords
+    return merged
+
+
+class _Node:
+    """Trie node: one path component with the keyword hits of its prefix"""
+    __slots__ = ("children", "hits")
+
+    def __init__(self, hits: Hits):
+        self.children: dict[str, "_Node"] = {}
+        self.hits = hits
+
+
+class PathTrie:
+    """
+    Prefix trie over path components.
+
+    Each node holds the keyword hits of its whole prefix, computed from its
+    parent's hits and its own component when the node is created, so a
+    directory shared by many paths is scanned once however many files
+    below it are listed.
+    """
+
+    def __init__(self, component_hits):
+        self._component_hits = component_hits
+        self._root = _Node({})
+        self.nodes = 0
+
+    def insert(self, path: str) -> Hits:
+        """
+        Add a path and get the keyword hits of all of its components.
+
+        Separators themselves are not included; callers add their hits.
+        """
+        node = self._root
+        for component in _SEPARATOR.split(path):
+            if not component:
+                continue
+            child = node.children.get(component)
+            if child is None:
+                child = node.children[component] = _Node(_merge(node.hits, self._component_hits(component)))
+                self.nodes += 1
+            node = child
+        return node.hits
+
+
+@dataclass
+class TargetScan:
+    """Classification of the targets of a structured context"""
+    targets: int
+    duplicates: int
+    # Trie nodes, i.e. distinct path components by position
+    components: int
+    resource_type: ResourceType
+    resource_score: float
+    scope_type: ScopeType
+    scope_multiplier: float
+    # Highest-risk target (the first one at that level), None if no target
+    # touches any resource
+    max_target: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.targets,
+            "duplicates": self.duplicates,
+            "components": self.components,
+            "max_target": self.max_target,
+            "resource_type": self.resource_type.value,
+            "scope": self.scope_type.value,
+        }
+
+
+class TargetClassifier:
+    """
+    Classifies a list of context targets (paths, URLs, hosts, names).
+
+    Targets are deduplicated, and paths are inserted into a PathTrie so
+    keyword scanning costs one automaton pass per distinct component rather
+    than per character of every path. The resource type is that of the
+    highest-risk target: each pattern family is searched once across all
+    targets (one per line) and only the lines it hits are confirmed one by
+    one, so the common case of many ordinary paths never runs the rules
+    per target. Scope comes from the keywords of all targets together, and
+    more than one target is at least MULTIPLE.
+    """
+
+    def __init__(
+        self,
+        resource_classifier: ResourceClassifier | None = None,
+        action_classifier: ActionClassifier | None = None,
+        cache_size: int = COMPONENT_CACHE_SIZE,
+    ):
+        self.resource_classifier = resource_classifier or ResourceClassifier()
+        self.action_classifier = action_classifier or ActionClassifier()
+        self.cache_size = cache_size
+        self._components: dict[tuple[str, int], Hits] = {}
+        # Per rule set version: line-wise family filters and whether paths
+        # may be split into components
+        self._prepared: dict[int, tuple[dict[str, re.Pattern], bool]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _keyword_hits(self, text: str, rules: RuleSet) -> Hits:
+        """Keyword hits of a component or whole target, memoized"""
+        key = (text, rules.version)
+        hits = self._components.get(key)
+        if hits is None:
+            self.misses += 1
+            hits = {family: frozenset(found) for family, found in rules.automaton.scan(text).items()}
+            if len(self._components) >= self.cache_size:
+                self._components.clear()
+            self._components[key] = hits
+        else:
+            self.hits += 1
+        return hits
+
+    def _prepare(self, rules: RuleSet) -> tuple[dict[str, re.Pattern], bool]:
+        """
+        Build the per-rule-set helpers.
+
+        Family filters are the families' alternations in MULTILINE mode, so
+        "$" rules match at the end of every line of the joined targets; a
+        filter hit is only a candidate and is confirmed on its own line.
+        Paths are split only if no keyword other than a separator contains
+        one, or splitting could hide a match.
+        """
+        prepared = self._prepared.get(rules.version)
+        if prepared is None:
+            filters = {}
+            for _, family in FAMILY_ORDER:
+                compiled = getattr(rules, family).compiled
+                filters[family] = re.compile(compiled.pattern, compiled.flags | re.MULTILINE)
+            splittable = not any(
+                separator in keyword and keyword != separator
+                for keywords in rules.automaton.families.values()
+                for keyword in keywords
+                for separator in PATH_SEPARATORS
+            )
+            prepared = (filters, splittable)
+            # Only the active rule set is kept
+            self._prepared = {rules.version: prepared}
+        return prepared
+
+    def _first_match(self, family: str, joined: str, starts: list[int], lines: list[str], rules: RuleSet) -> int | None:
+        """Index of the first line whose target matches a pattern family"""
+        pattern_set = getattr(rules, family)
+        search = self._prepare(rules)[0][family].search
+        pos = 0
+        while (match := search(joined, pos)) is not None:
+            index = bisect_right(starts, match.start()) - 1
+            if pattern_set.matches(lines[index]):
+                return index
+            if index + 1 >= len(starts):
+                return None
+            pos = starts[index + 1]
+        return None
+
+    @staticmethod
+    def _first_sql(joined: str, starts: list[int], lines: list[str]) -> int | None:
+        """Index of the first line holding a SQL statement"""
+        checked = -1
+        for match in _SQL_VERB.finditer(joined):
+            index = bisect_right(starts, match.start()) - 1
+            if index > checked:
+                checked = index
+                if scan_sql(lines[index]).is_database:
+                    return index
+        return None
+
+    def classify(self, targets: Iterable[str], rules: RuleSet | None = None) -> TargetScan:
+        """
+        Classify context targets.
+
+        Args:
+            targets: Paths, URLs and other targets, in any order and with
+                duplicates
+            rules: Rule set to classify with (default: the active rules)
+
+        Returns:
+            TargetScan with the highest-risk resource type and target and
+            the combined scope
+        """
+        started = timer() if STATS.enabled else 0.0
+        rules = rules or get_rule_set()
+        unique, duplicates = dedupe_targets(targets)
+        _, splittable = self._prepare(rules)
+        trie = PathTrie(lambda component: self._keyword_hits(component, rules))
+
+        # Keyword hits per target, from the trie for paths. Targets with
+        # URLs or line breaks get the full resource classifier; the rest are
+        # checked together, one per line.
+        separator_hits = {separator: self._keyword_hits(separator, rules) for separator in PATH_SEPARATORS}
+        target_hits: list[Hits] = []
+        lines: list[str] = []
+        max_type, max_target = ResourceType.MEMORY, None
+        for target in unique:
+            if _URL_SCHEME.search(target) or _LINE_BREAK.search(target):
+                hits = self._keyword_hits(target, rules)
+                features = OperationFeatures(target, "", rules)
+                features.operation_hits = {family: set(found) for family, found in hits.items()}
+                resource_type, _ = self.resource_classifier.classify_features(features)
+                if RESOURCE_RISK_SCORES[resource_type] > RESOURCE_RISK_SCORES[max_type]:
+                    max_type, max_target = resource_type, target
+            elif splittable and _is_path(target):
+                hits = trie.insert(target)
+                for separator, hits_of_separator in separator_hits.items():
+                    if separator in target:
+                        hits = _merge(hits, hits_of_separator)
+                lines.append(target)
+            else:
+                hits = self._keyword_hits(target, rules)
+                lines.append(target)
+            target_hits.append(hits)
+
+        # Every resource check is "does any rule match", so the first family
+        # in risk order that some line matches decides
+        if lines:
+            joined = "\n".join(lines)
+            starts = [0]
+            for line in lines[:-1]:
+                starts.append(starts[-1] + len(line) + 1)
+            for resource_type, family in FAMILY_ORDER:
+                if RESOURCE_RISK_SCORES[resource_type] <= RESOURCE_RISK_SCORES[max_type]:
+                    break
+                index = self._first_match(family, joined, starts, lines, rules)
+                if index is None and resource_type == ResourceType.DATABASE:
+                    index = self._first_sql(joined, starts, lines)
+                if index is not None:
+                    max_type, max_target = resource_type, lines[index]
+                    break
+
+        # Generic file indicators, the lowest resource above memory
+        if RESOURCE_RISK_SCORES[max_type] < RESOURCE_RISK_SCORES[ResourceType.LOCAL_FILE]:
+            for target, hits in zip(unique, target_hits):
+                if ResourceType.LOCAL_FILE in hits:
+                    max_type, max_target = ResourceType.LOCAL_FILE, target
+                    break
+
+        # Leaves under the same directory often share one hits map
+        all_hits: Hits = {}
+        for hits in {id(hits): hits for hits in target_hits}.values():
+            all_hits = _merge(all_hits, hits)
+        scope_features = OperationFeatures("", "", rules)
+        scope_features.combined_hits = {family: set(found) for family, found in all_hits.items()}
+        scope_type, scope_multiplier = self.action_classifier.classify_scope_features(scope_features)
+        if len(unique) > 1 and scope_type == ScopeType.SINGLE:
+            scope_type, scope_multiplier = ScopeType.MULTIPLE, SCOPE_MULTIPLIERS[ScopeType.MULTIPLE]
+
+        if STATS.enabled:
+            STATS.record_family("targets", timer() - started)
+        return TargetScan(
+            targets=len(unique),
+            duplicates=duplicates,
+            components=trie.nodes,
+            resource_type=max_type,
+            resource_score=RESOURCE_RISK_SCORES[max_type],
+            scope_type=scope_type,
+            scope_multiplier=scope_multiplier,
+            max_target=max_target,
+        )
+
+    def get_stats(self) -> dict[str, int]:
+        """Get component cache statistics"""
+        return {"components": len(self._components), "hits": self.hits, "misses": self.misses}
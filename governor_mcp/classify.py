@@ -0,0 +1,218 @@
+"""Offline bulk classification over JSONL: python -m governor_mcp.classify"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import IO, Any, Iterable, Iterator
+
+DEFAULT_CHUNK_SIZE = 500
+
+# Chunks in flight per worker; bounds memory regardless of input size
+MAX_PENDING_PER_WORKER = 2
+
+
+def _init_worker(rules_path: str | None) -> None:
+    """Load rules and warm up the engine once per worker process"""
+    from .classification import configure_rule_pack
+    from .core import get_engine
+
+    if rules_path:
+        configure_rule_pack(rules_path)
+    get_engine().warmup()
+
+
+def _classify_line(line_number: int, line: str, full: bool) -> dict[str, Any]:
+    """Classify one JSONL record into a verdict record"""
+    from .core import get_engine
+    from .tools.assess import _check_context
+
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as e:
+        return {"line": line_number, "error": f"Invalid JSON: {e}"}
+    if isinstance(record, str):
+        record = {"operation": record}
+    if not isinstance(record, dict) or not isinstance(record.get("operation"), str):
+        return {"line": line_number, "error": "Missing 'operation'"}
+
+    # Target lists are classified per target, like the assess tool does
+    context = record.get("context", "")
+    if isinstance(context, list):
+        error = _check_context(context)
+        if error:
+            return {"line": line_number, "error": error}
+    else:
+        context = str(context)
+
+    assessment = get_engine().assessor.assess(
+        record["operation"],
+        str(record.get("description", "")),
+        context,
+    )
+    verdict: dict[str, Any] = {"line": line_number}
+    if "id" in record:
+        verdict["id"] = record["id"]
+    verdict.update({
+        "risk_level": assessment.risk_level.value,
+        "risk_score": assessment.risk_score,
+        "resource_type": assessment.resource_type,
+        "action_type": assessment.action_type,
+        "scope": assessment.scope,
+    })
+    if full:
+        verdict["factors"] = assessment.factors
+        verdict["recommendations"] = assessment.recommendations
+    return verdict
+
+
+def classify_chunk(chunk: list[tuple[int, str]], full: bool = False) -> list[dict[str, Any]]:
+    """
+    Classify a chunk of (line_number, JSONL line) pairs.
+
+    Args:
+        chunk: Input lines with their 1-based line numbers
+        full: Include factors and recommendations in each verdict
+
+    Returns:
+        Verdict records in input order
+    """
+    return [_classify_line(line_number, line, full) for line_number, line in chunk]
+
+
+def _chunks(lines: Iterable[str], chunk_size: int) -> Iterator[list[tuple[int, str]]]:
+    """Group non-blank input lines into numbered chunks"""
+    chunk: list[tuple[int, str]] = []
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        chunk.append((line_number, line))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def classify_stream(
+    lines: Iterable[str],
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    rules_path: str | None = None,
+    full: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """
+    Classify JSONL operations in parallel, yielding verdicts in input order.
+
+    Each input line is a JSON object with "operation" and optional
+    "context" (text or a list of targets), "description" and "id", or a
+    bare JSON string. At most ``workers × MAX_PENDING_PER_WORKER`` chunks
+    are in flight, so memory stays bounded however long the input is.
+
+    Args:
+        lines: JSONL input lines
+        workers: Worker processes (default: CPU count); 0 classifies in-process
+        chunk_size: Lines per task sent to a worker
+        rules_path: Rule pack each worker loads before warming up
+        full: Include factors and recommendations in each verdict
+
+    Yields:
+        Verdict records; records that could not be classified have "error"
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    chunks = _chunks(lines, max(1, chunk_size))
+
+    if workers == 0:
+        _init_worker(rules_path)
+        for chunk in chunks:
+            yield from classify_chunk(chunk, full)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(rules_path,),
+    ) as pool:
+        pending: deque[Future] = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(classify_chunk, chunk, full))
+            if len(pending) >= workers * MAX_PENDING_PER_WORKER:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def run(
+    source: IO[str],
+    sink: IO[str],
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    rules_path: str | None = None,
+    full: bool = False,
+) -> dict[str, Any]:
+    """
+    Stream verdicts for every line of source to sink as JSONL.
+
+    Returns:
+        Summary with record, error and risk level counts, elapsed seconds
+        and throughput
+    """
+    started = time.perf_counter()
+    levels: Counter = Counter()
+    records = errors = 0
+    for verdict in classify_stream(source, workers, chunk_size, rules_path, full):
+        records += 1
+        if "error" in verdict:
+            errors += 1
+        else:
+            levels[verdict["risk_level"]] += 1
+        sink.write(json.dumps(verdict))
+        sink.write("\n")
+    elapsed = time.perf_counter() - started
+    return {
+        "records": records,
+        "errors": errors,
+        "by_risk_level": dict(levels),
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput": round(records / elapsed, 1) if elapsed else None,
+        "workers": workers if workers is not None else os.cpu_count() or 1,
+        "chunk_size": chunk_size,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(
+        prog="python -m governor_mcp.classify",
+        description="Classify JSONL operations with the production classifier",
+    )
+    parser.add_argument("input", nargs="?", default="-", help="JSONL file (default: stdin)")
+    parser.add_argument("--output", "-o", default="-", help="verdict JSONL file (default: stdout)")
+    parser.add_argument("--workers", "-w", type=int, default=None,
+                        help="worker processes (default: CPU count; 0 = in-process)")
+    parser.add_argument("--chunk-size", "-c", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"lines per worker task (default: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--rules", help="rule pack (TOML/JSON) to classify with")
+    parser.add_argument("--full", action="store_true", help="include factors and recommendations")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    sink = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        summary = run(source, sink, args.workers, args.chunk_size, args.rules, args.full)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+
+    print(json.dumps(summary), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,47 @@
 """Core modules for Governor MCP"""
 
-from .risk_assessment import RiskAssessor
+from .risk_assessment import RiskAssessor, Classification
+from .cache import (
+    LRUCache,
+    ClassificationCache,
+    get_classification_cache,
+    invalidate_classification_cache,
+)
+from .scoring import ScoringWeights, score_codes, score_classifications
+from .outcomes import Outcome, OutcomeTable
+from .risk_model import RiskModel, train_model
 from .plan_controller import PlanController
 from .deviation_detector import DeviationDetector
+from .offload import Offloader, assess_operation, assess_operations, detect_deviation, text_size
+from .engine import Engine, get_engine, reset_engine
+from .assessment_stream import AssessmentStream
+from .file_assessment import FileAssessor, FileScan
 
 __all__ = [
     "RiskAssessor",
+    "Classification",
+    "LRUCache",
+    "ClassificationCache",
+    "get_classification_cache",
+    "invalidate_classification_cache",
+    "ScoringWeights",
+    "score_codes",
+    "score_classifications",
+    "Outcome",
+    "OutcomeTable",
+    "RiskModel",
+    "train_model",
     "PlanController",
     "DeviationDetector",
+    "Offloader",
+    "assess_operation",
+    "assess_operations",
+    "detect_deviation",
+    "text_size",
+    "Engine",
+    "get_engine",
+    "reset_engine",
+    "AssessmentStream",
+    "FileAssessor",
+    "FileScan",
 ]
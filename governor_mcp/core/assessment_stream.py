@@ -0,0 +1,112 @@
+"""Incremental assessment of operations that arrive in chunks"""
+
+import uuid
+from datetime import datetime
+from typing import Any
+
+from ..classification import STREAMING_THRESHOLD, IncrementalClassifier, StreamingClassifier
+from ..state import Assessment, RiskLevel
+from .risk_assessment import Classification, RiskAssessor
+
+
+class AssessmentStream:
+    """
+    A long operation assessed while it is being composed.
+
+    Each fed chunk is classified incrementally, so its cost depends only on
+    the chunk's length, and the running verdict is the worst resource,
+    action and scope seen so far. Finalizing turns the stream into a normal
+    Assessment; text up to STREAMING_THRESHOLD is then classified like a
+    governor_assess call, so both give the same verdict.
+
+    Only the first DEFAULT_MAX_SCAN_CHARS characters are scanned and kept;
+    text fed beyond that is counted but dropped, and the verdict is marked
+    truncated (a truncated stream is never LOW once finalized).
+    """
+
+    def __init__(self, assessor: RiskAssessor, context: str = "", description: str = ""):
+        self.id = str(uuid.uuid4())
+        self.assessor = assessor
+        self.context = context
+        self.description = description
+        self.created_at = datetime.now()
+        self.updated_at = self.created_at
+        self._classifier = IncrementalClassifier(context)
+        self._parts: list[str] = []
+
+    @property
+    def chars_fed(self) -> int:
+        return self._classifier.total_chars
+
+    def feed(self, chunk: str) -> dict[str, Any]:
+        """
+        Classify the next chunk of the operation.
+
+        Args:
+            chunk: Operation text following everything fed so far
+
+        Returns:
+            The running verdict (see verdict())
+        """
+        # Keep only the text that is scanned; the rest is counted
+        kept = chunk[:self._classifier.remaining]
+        if kept:
+            self._parts.append(kept)
+        self._classifier.feed(chunk)
+        self.updated_at = datetime.now()
+        return self.verdict()
+
+    def classification(self) -> Classification:
+        """Get the classification of everything fed so far"""
+        result = self._classifier.result()
+        # Short text takes the regular path (read-only overrides, hosts,
+        # per-statement scoring); longer text keeps the incremental scan
+        if not result.truncated and result.total_chars + len(self.context) <= STREAMING_THRESHOLD:
+            return self.assessor.classify("".join(self._parts), self.context)
+        resource_score, action_multiplier, scope_multiplier = StreamingClassifier.scores(result)
+        return Classification(
+            resource_type=result.resource_type,
+            resource_score=resource_score,
+            action_type=result.action_type,
+            action_multiplier=action_multiplier,
+            scope_type=result.scope_type,
+            scope_multiplier=scope_multiplier,
+            scan=result.to_dict(),
+        )
+
+    def verdict(self) -> dict[str, Any]:
+        """
+        Get the running verdict.
+
+        Returns:
+            Dict with the current resource/action/scope, risk score and
+            level, scan statistics, and ``terminate`` set once the input
+            has reached HIGH risk (it can never drop back)
+        """
+        result = self._classifier.result()
+        outcome = self.assessor.outcomes.lookup(result.resource_type, result.action_type, result.scope_type)
+        risk_level = outcome.risk_level
+        # Matches finalize(): unscanned text always needs confirmation
+        if result.truncated and risk_level == RiskLevel.LOW:
+            risk_level = RiskLevel.MEDIUM
+        return {
+            "stream_id": self.id,
+            "resource_type": result.resource_type.value,
+            "action_type": result.action_type.value,
+            "scope": result.scope_type.value,
+            "risk_score": outcome.risk_score,
+            "risk_level": risk_level.value,
+            "chars_scanned": result.chars_scanned,
+            "total_chars": result.total_chars,
+            "truncated": result.truncated,
+            "chunks": result.chunks,
+            "terminate": risk_level == RiskLevel.HIGH,
+        }
+
+    def finalize(self) -> Assessment:
+        """Build the assessment of the complete operation"""
+        return self.assessor.build_assessment(
+            "".join(self._parts),
+            self.description,
+            self.classification(),
+        )
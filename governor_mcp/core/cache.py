@@ -0,0 +1,206 @@
+"""Bounded LRU caching for classification results"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+# Default number of cached classifications
+DEFAULT_CACHE_SIZE = 1024
+
+# Inputs longer than this (operation + context) bypass the cache so that
+# memory stays bounded by maxsize × max_entry_chars
+DEFAULT_MAX_ENTRY_CHARS = 8192
+
+# Stored under a fingerprint key whose masked input classifies differently
+# from the original, so the check is not repeated for every variant
+FINGERPRINT_MISMATCH = object()
+
+
+class LRUCache:
+    """Thread-safe, bounded least-recently-used cache with hit-rate stats"""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = max(0, maxsize)
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get a cached value and mark it as recently used"""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entries if full"""
+        if self._maxsize == 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def resize(self, maxsize: int) -> None:
+        """Change the capacity, evicting entries if it shrinks"""
+        with self._lock:
+            self._maxsize = max(0, maxsize)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self) -> None:
+        """Drop all entries, e.g. after classification rules change"""
+        with self._lock:
+            self._data.clear()
+            self._invalidations += 1
+
+    def reset_stats(self) -> None:
+        """Zero the hit/miss/eviction counters"""
+        with self._lock:
+            self._hits = self._misses = self._evictions = self._invalidations = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache size and hit-rate statistics"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._data),
+                "maxsize": self._maxsize,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "hit_rate": self._hits / lookups if lookups else None,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ClassificationCache(LRUCache):
+    """
+    LRU cache of classification results keyed by (operation, context).
+
+    A second tier keys entries on the literal-stripping fingerprint of the
+    input, so operations that differ only in ids, numbers or quoted values
+    share one entry. Both tiers live in the same LRU; fingerprint lookups
+    are counted separately.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        max_entry_chars: int = DEFAULT_MAX_ENTRY_CHARS,
+    ):
+        super().__init__(maxsize)
+        self.max_entry_chars = max_entry_chars
+        self._fingerprint_hits = 0
+        self._fingerprint_misses = 0
+
+    def make_key(
+        self,
+        operation: str,
+        context: str,
+        rules_version: int = 0,
+    ) -> tuple[str, str, int] | None:
+        """
+        Build the cache key for an input, or None if it should not be cached.
+
+        Every classifier sees the exact operation and context strings, so the
+        key does too; rewriting whitespace or case could change which rules
+        fire and return a verdict for a different input. The rule set version
+        is part of the key so a reloaded rule pack never serves verdicts
+        computed with the previous rules.
+        """
+        if len(operation) + len(context) > self.max_entry_chars:
+            return None
+        return (operation, context, rules_version)
+
+    @staticmethod
+    def make_fingerprint_key(fingerprint: int, rules_version: int = 0) -> tuple[str, int, int]:
+        """
+        Build the fingerprint-tier key for an input.
+
+        Callers only store an entry under this key after checking that the
+        masked input classifies exactly like the original, and only read it
+        for inputs whose masked literals trigger no rules (see
+        classification.fingerprint.literals_inert).
+        """
+        return ("fingerprint", fingerprint, rules_version)
+
+    def get_fingerprint(self, key: Hashable) -> Any | None:
+        """
+        Get a fingerprint-tier entry; counted apart from exact lookups.
+
+        Returns:
+            The cached value, FINGERPRINT_MISMATCH if the fingerprint is
+            known not to be reusable, or None
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._fingerprint_misses += 1
+                return None
+            self._data.move_to_end(key)
+            if value is FINGERPRINT_MISMATCH:
+                self._fingerprint_misses += 1
+            else:
+                self._fingerprint_hits += 1
+            return value
+
+    def reset_stats(self) -> None:
+        """Zero the hit/miss/eviction counters of both tiers"""
+        super().reset_stats()
+        with self._lock:
+            self._fingerprint_hits = self._fingerprint_misses = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache size and hit-rate statistics.
+
+        hits and misses count exact lookups; fingerprint_hits are exact
+        misses served by the fingerprint tier, and effective_hit_rate is the
+        share of lookups answered by either tier.
+        """
+        stats = super().get_stats()
+        with self._lock:
+            lookups = stats["hits"] + stats["misses"]
+            stats["fingerprint_hits"] = self._fingerprint_hits
+            stats["fingerprint_misses"] = self._fingerprint_misses
+            stats["effective_hit_rate"] = (
+                (stats["hits"] + self._fingerprint_hits) / lookups if lookups else None
+            )
+        return stats
+
+
+# Global classification cache instance
+_classification_cache: ClassificationCache | None = None
+
+
+def get_classification_cache() -> ClassificationCache:
+    """Get or create the global classification cache"""
+    global _classification_cache
+    if _classification_cache is None:
+        _classification_cache = ClassificationCache()
+    return _classification_cache
+
+
+def invalidate_classification_cache() -> None:
+    """Invalidate cached classifications, e.g. after patterns change"""
+    get_classification_cache().invalidate()
@@ -0,0 +1,221 @@
+"""Process-wide engine components shared by the tool layer"""
+
+import json
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any
+
+from ..classification import get_rule_set
+from ..classification.instrumentation import STATS
+from .assessment_stream import AssessmentStream
+from .deviation_detector import DeviationDetector
+from .file_assessment import FileAssessor
+from .offload import Offloader
+from .plan_controller import PlanController
+from .risk_assessment import RiskAssessor
+from .risk_model import MODEL_MODE_ENV, MODEL_PATH_ENV, RiskModel
+
+# Open assessment streams kept per process; the least recently used stream
+# is dropped when a new one would exceed the limit
+MAX_OPEN_STREAMS = 64
+
+# One response in this many per tool and mode is serialized to measure its
+# size (every response while rule instrumentation is enabled)
+RESPONSE_SAMPLE_INTERVAL = 16
+
+# Operations assessed during warmup; together they exercise every pattern
+# family, the keyword automaton, the SQL scanner, URL extraction and every
+# risk level
+WARMUP_OPERATIONS = [
+    ("ls -la", ""),
+    ("cat README.md", "./docs/README.md"),
+    ("write config to settings.json", "/tmp/settings.json"),
+    ("curl -X POST https://api.example.com/v1/items", ""),
+    ("cat ~/.ssh/id_rsa", ".env"),
+    ("psql -c \"DELETE FROM users WHERE id = 1; SELECT * FROM users\"", "postgres://db/app"),
+    ("UPDATE accounts SET active = false", ""),
+    ("sudo rm -rf /var/log/app", "production cluster"),
+    ("deploy all services to production", "kubectl apply -f ./k8s/"),
+]
+
+
+class Engine:
+    """
+    Long-lived assessment components borrowed by every tool call.
+
+    Building classifiers, pattern sets and automata on each call makes the
+    first call of every kind slow; the engine owns one instance of each and
+    warms them up once at server startup.
+    """
+
+    def __init__(self):
+        self.assessor = RiskAssessor()
+        self.plan_controller = PlanController()
+        self.deviation_detector = DeviationDetector()
+        self.file_assessor = FileAssessor(self.assessor)
+        self.offloader = Offloader()
+        self.warmup_ms: float | None = None
+        self.warmed_up_at: datetime | None = None
+        self._streams: OrderedDict[str, AssessmentStream] = OrderedDict()
+        self._response_sizes: dict[str, dict[str, int]] = {}
+        self.model_path: str | None = None
+
+    def open_stream(self, context: str = "", description: str = "") -> AssessmentStream:
+        """Open a new incremental assessment stream"""
+        stream = AssessmentStream(self.assessor, context, description)
+        self._streams[stream.id] = stream
+        while len(self._streams) > MAX_OPEN_STREAMS:
+            self._streams.popitem(last=False)
+        return stream
+
+    def get_stream(self, stream_id: str) -> AssessmentStream | None:
+        """Get an open stream and mark it as recently used"""
+        stream = self._streams.get(stream_id)
+        if stream is not None:
+            self._streams.move_to_end(stream_id)
+        return stream
+
+    def close_stream(self, stream_id: str) -> AssessmentStream | None:
+        """Remove a stream, returning it if it was open"""
+        return self._streams.pop(stream_id, None)
+
+    def configure_model(self, path: str, mode: str = "escalate") -> RiskModel:
+        """
+        Load a trained model and use it as the assessor's secondary scorer.
+
+        Args:
+            path: Model file written by RiskModel.save
+            mode: "escalate" or "blend" (see RiskAssessor.set_model)
+
+        Returns:
+            The loaded model
+
+        Raises:
+            RuntimeError: If NumPy is not installed
+            ValueError: If the file or mode is invalid
+        """
+        model = RiskModel.load(path)
+        self.assessor.set_model(model, mode)
+        self.model_path = path
+        # Worker processes load the model when they start
+        self.offloader.shutdown()
+        return model
+
+    def configure_model_from_env(self) -> RiskModel | None:
+        """Load the model named by GOVERNOR_MODEL_PATH, if set"""
+        path = os.environ.get(MODEL_PATH_ENV)
+        if not path:
+            return None
+        return self.configure_model(path, os.environ.get(MODEL_MODE_ENV, "escalate"))
+
+    def configure_offload_from_env(self) -> Offloader:
+        """Replace the offloader with one configured from GOVERNOR_OFFLOAD_* variables"""
+        offloader = Offloader.from_env()
+        self.offloader.shutdown()
+        self.offloader = offloader
+        return offloader
+
+    def record_response(self, tool: str, response: dict[str, Any], compact: bool = False) -> int | None:
+        """
+        Count a tool response and measure the size of a sample of them.
+
+        Serializing a response only to measure it costs about as much as
+        building it, so one call in RESPONSE_SAMPLE_INTERVAL per tool and
+        mode is measured, starting with the first, and every call while
+        rule instrumentation is enabled.
+
+        Args:
+            tool: Tool that produced the response
+            response: JSON-serializable response
+            compact: Whether the response was built in compact mode
+
+        Returns:
+            Response size in bytes, or None if this call was not measured
+        """
+        key = f"{tool}.compact" if compact else tool
+        sizes = self._response_sizes.get(key)
+        if sizes is None:
+            sizes = self._response_sizes[key] = {"calls": 0, "measured": 0, "bytes": 0, "max_bytes": 0}
+        sizes["calls"] += 1
+        if (sizes["calls"] - 1) % RESPONSE_SAMPLE_INTERVAL and not STATS.enabled:
+            return None
+        size = len(json.dumps(response, default=str).encode("utf-8"))
+        sizes["measured"] += 1
+        sizes["bytes"] += size
+        if size > sizes["max_bytes"]:
+            sizes["max_bytes"] = size
+        return size
+
+    def warmup(self) -> float:
+        """
+        Compile all rules and exercise every classification path once.
+
+        Returns:
+            Warmup time in milliseconds
+        """
+        started = time.perf_counter()
+
+        # Compile pattern sets, per-rule regexes and the keyword automaton
+        rules = get_rule_set()
+        for pattern_set in rules.pattern_sets:
+            pattern_set.precompile()
+        for operation, context in WARMUP_OPERATIONS:
+            self.assessor.assess(operation, "", context)
+
+        # Warmup entries stay cached but must not skew hit-rate statistics
+        self.assessor.cache.reset_stats()
+
+        self.warmup_ms = round((time.perf_counter() - started) * 1000, 3)
+        self.warmed_up_at = datetime.now()
+        return self.warmup_ms
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get warmup, cache, model, offload and response size statistics"""
+        return {
+            "warmed_up": self.warmed_up_at is not None,
+            "warmup_ms": self.warmup_ms,
+            "warmed_up_at": self.warmed_up_at.isoformat() if self.warmed_up_at else None,
+            "rules_version": get_rule_set().version,
+            "open_streams": len(self._streams),
+            "file_cache": self.file_assessor.get_stats(),
+            "statement_shapes": self.assessor.statement_classifier.get_stats(),
+            "target_components": self.assessor.target_classifier.get_stats(),
+            "offload": self.offloader.get_stats(),
+            "model": {
+                "path": self.model_path,
+                "mode": self.assessor.model_mode,
+                "n_features": self.assessor.model.n_features,
+                "trained_on": self.assessor.model.trained_on,
+                **self.assessor.get_model_stats(),
+            } if self.assessor.model is not None else None,
+            "response_bytes": {
+                key: {
+                    **sizes,
+                    "mean_bytes": round(sizes["bytes"] / sizes["measured"], 1) if sizes["measured"] else None,
+                }
+                for key, sizes in sorted(self._response_sizes.items())
+            },
+        }
+
+
+# Global engine instance
+_engine: Engine | None = None
+
+
+def get_engine() -> Engine:
+    """Get or create the global engine"""
+    global _engine
+    if _engine is None:
+        _engine = Engine()
+    return _engine
+
+
+def reset_engine() -> Engine:
+    """Reset the global engine"""
+    global _engine
+    if _engine is not None:
+        _engine.offloader.shutdown()
+    _engine = Engine()
+    return _engine
@@ -0,0 +1,362 @@
+"""Memory-mapped assessment of script files, line by line or statement by statement"""
+
+import codecs
+import mmap
+import os
+import re
+import stat
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Iterator
+
+from ..classification import (
+    IncrementalClassifier,
+    StreamingClassifier,
+    STREAMING_THRESHOLD,
+    get_rule_set,
+)
+from ..state import RiskLevel
+from .cache import ClassificationCache, LRUCache
+from .outcomes import Outcome
+from .risk_assessment import Classification, RiskAssessor
+from .scoring import LEVEL_ORDER
+
+# Unit modes: "lines" classifies each shell line (joining backslash
+# continuations), "statements" classifies each ;-terminated SQL statement
+FILE_MODES = ("auto", "lines", "statements")
+
+# File suffixes assessed statement by statement in "auto" mode
+STATEMENT_SUFFIXES = (".sql", ".psql", ".pgsql", ".mysql")
+
+# Assessed files remembered per process, keyed by path and file identity
+FILE_CACHE_SIZE = 128
+
+# Classifications of individual units; repeated lines are classified once.
+# Kept apart from the global cache so one large file cannot evict the
+# entries of ordinary assessments
+UNIT_CACHE_SIZE = 4096
+
+# Units up to this size are memoized by their bytes within a scan
+MAX_MEMO_UNIT_BYTES = 1024
+
+# Non-LOW units reported individually; the rest are only counted
+MAX_HEATMAP_ENTRIES = 500
+
+# Bytes decoded at a time for units above STREAMING_THRESHOLD
+UNIT_CHUNK_BYTES = 16 * 1024
+
+
+@dataclass
+class FileScan:
+    """Per-unit classification of a script file"""
+    path: str
+    size: int
+    mode: str
+    lines: int
+    units: int
+    # Classification of the highest-risk unit (of the empty text if no units)
+    classification: Classification
+    max_line: int | None = None
+    by_risk_level: dict[str, int] = field(default_factory=dict)
+    # Non-LOW units in file order: line, end_line (multi-line units only),
+    # risk_level and risk_score
+    heatmap: list[dict[str, Any]] = field(default_factory=list)
+    heatmap_truncated: bool = False
+    elapsed_ms: float = 0.0
+    cached: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "path": self.path,
+            "size": self.size,
+            "mode": self.mode,
+            "lines": self.lines,
+            "units": self.units,
+            "max_line": self.max_line,
+            "by_risk_level": self.by_risk_level,
+            "heatmap": self.heatmap,
+            "heatmap_truncated": self.heatmap_truncated,
+            "elapsed_ms": self.elapsed_ms,
+            "cached": self.cached,
+        }
+
+
+def resolve_mode(path: str, mode: str = "auto") -> str:
+    """Get the unit mode for a file, resolving "auto" from its suffix"""
+    if mode not in FILE_MODES:
+        raise ValueError(f"Invalid mode: {mode}. Must be one of: {', '.join(FILE_MODES)}")
+    if mode != "auto":
+        return mode
+    return "statements" if path.lower().endswith(STATEMENT_SUFFIXES) else "lines"
+
+
+# Byte patterns searched directly in the map, so no line is copied to be
+# inspected
+_NON_SPACE = re.compile(rb"\S")
+_CONTINUATION = re.compile(rb"\\\r?\Z")
+_STATEMENT_END = re.compile(rb";\s*\Z")
+# Outside a string literal, a quote opens one and -- starts a comment
+_QUOTE_OR_COMMENT = re.compile(rb"'|--")
+
+
+def _count(data: mmap.mmap | bytes, byte: bytes, start: int = 0, end: int | None = None) -> int:
+    """Count occurrences of a single byte in a span, a chunk at a time"""
+    end = len(data) if end is None else end
+    return sum(
+        data[position:min(end, position + UNIT_CHUNK_BYTES)].count(byte)
+        for position in range(start, end, UNIT_CHUNK_BYTES)
+    )
+
+
+def _line_spans(data: mmap.mmap | bytes) -> Iterator[tuple[int, int, int]]:
+    """Yield (line_number, start, end) for every line, without the newline"""
+    size = len(data)
+    start = 0
+    line_number = 0
+    while start < size:
+        line_number += 1
+        end = data.find(b"\n", start)
+        if end == -1:
+            end = size
+        yield line_number, start, end
+        start = end + 1
+
+
+def _line_units(data: mmap.mmap | bytes) -> Iterator[tuple[int, int, int, int]]:
+    """
+    Yield (first_line, last_line, start, end) for each shell command.
+
+    Blank lines and # comments are skipped; lines ending in a backslash
+    continue onto the next line.
+    """
+    unit_start = None
+    first_line = last_line = 0
+    for line_number, start, end in _line_spans(data):
+        if unit_start is None:
+            first = _NON_SPACE.search(data, start, end)
+            if first is None or first.group() == b"#":
+                continue
+            unit_start, first_line = start, line_number
+        last_line = line_number
+        if _CONTINUATION.search(data, max(start, end - 2), end):
+            continue
+        yield first_line, last_line, unit_start, end
+        unit_start = None
+    if unit_start is not None:
+        yield first_line, last_line, unit_start, len(data)
+
+
+def _sql_line_code(data: mmap.mmap | bytes, start: int, end: int, in_string: bool) -> tuple[int, bool]:
+    """
+    Find where the code of a SQL line ends and whether a string stays open.
+
+    Quotes inside a -- comment tail are not counted, and a doubled quote
+    ('') inside a literal closes and reopens it, which leaves it open.
+
+    Returns:
+        Tuple of (end of the code before any -- comment, whether the line
+        ends inside a string literal)
+    """
+    position = start
+    while True:
+        if in_string:
+            close = data.find(b"'", position, end)
+            if close == -1:
+                return end, True
+            in_string = False
+            position = close + 1
+            continue
+        match = _QUOTE_OR_COMMENT.search(data, position, end)
+        if match is None:
+            return end, False
+        if match.group() == b"--":
+            return match.start(), False
+        in_string = True
+        position = match.end()
+
+
+def _statement_units(data: mmap.mmap | bytes) -> Iterator[tuple[int, int, int, int]]:
+    """
+    Yield (first_line, last_line, start, end) for each SQL statement.
+
+    A statement ends at a line whose last non-blank character outside a
+    string literal and a trailing -- comment is ';'. Blank lines and --
+    comments between statements are skipped.
+    """
+    unit_start = None
+    first_line = last_line = 0
+    in_string = False
+    for line_number, start, end in _line_spans(data):
+        if unit_start is None:
+            first = _NON_SPACE.search(data, start, end)
+            if first is None or data[first.start():first.start() + 2] == b"--":
+                continue
+            unit_start, first_line = start, line_number
+        last_line = line_number
+        # Quotes and dashes are ASCII, so scanning bytes is safe for UTF-8
+        code_end, in_string = _sql_line_code(data, start, end, in_string)
+        if not in_string and _STATEMENT_END.search(data, start, code_end):
+            yield first_line, last_line, unit_start, end
+            unit_start = None
+    if unit_start is not None:
+        yield first_line, last_line, unit_start, len(data)
+
+
+class FileAssessor:
+    """
+    Classifies script files unit by unit through a read-only memory map.
+
+    Only one unit is decoded at a time, and units longer than
+    STREAMING_THRESHOLD are fed to an IncrementalClassifier in fixed-size
+    chunks straight from the map, so memory stays bounded however large
+    the file is. Results are cached by path, inode, mtime and size.
+    """
+
+    def __init__(
+        self,
+        assessor: RiskAssessor,
+        cache_size: int = FILE_CACHE_SIZE,
+        unit_cache_size: int = UNIT_CACHE_SIZE,
+    ):
+        self.assessor = assessor
+        self.cache = LRUCache(cache_size)
+        # Classification only; scores always come from assessor.outcomes
+        self._unit_assessor = RiskAssessor(cache=ClassificationCache(maxsize=unit_cache_size))
+
+    def scan(self, path: str, context: str = "", mode: str = "auto") -> FileScan:
+        """
+        Classify every unit of a file.
+
+        Args:
+            path: Path of a local regular file
+            context: Additional context applied to every unit
+            mode: "lines", "statements", or "auto" (statements for .sql files)
+
+        Returns:
+            FileScan with the highest-risk classification and heatmap
+
+        Raises:
+            ValueError: If the mode is invalid or path is not a regular file
+            OSError: If the file cannot be read
+        """
+        path = os.path.realpath(os.path.expanduser(path))
+        mode = resolve_mode(path, mode)
+        info = os.stat(path)
+        if not stat.S_ISREG(info.st_mode):
+            raise ValueError(f"Not a regular file: {path}")
+
+        rules = get_rule_set()
+        outcomes = self.assessor.outcomes
+        key = (
+            path, info.st_dev, info.st_ino, info.st_mtime_ns, info.st_size,
+            mode, context, rules.version, outcomes,
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            return replace(cached, cached=True)
+
+        started = time.perf_counter()
+        with open(path, "rb") as f:
+            if info.st_size == 0:
+                result = self._scan_data(b"", path, mode, context)
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    result = self._scan_data(data, path, mode, context)
+        result.elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
+
+        self.cache.put(key, result)
+        return result
+
+    def _scan_data(self, data: mmap.mmap | bytes, path: str, mode: str, context: str) -> FileScan:
+        """Classify the units of mapped file data"""
+        outcomes = self.assessor.outcomes
+        units = _statement_units(data) if mode == "statements" else _line_units(data)
+
+        # Scripts repeat the same short lines; each distinct one is classified
+        # and scored once per scan
+        seen: dict[bytes, tuple[Classification, Outcome]] = {}
+
+        by_risk_level = {level: 0 for level in RiskLevel}
+        heatmap: list[dict[str, Any]] = []
+        heatmap_truncated = False
+        worst: Classification | None = None
+        worst_rank = (-1, -1.0)
+        max_line = None
+        count = 0
+        for first_line, last_line, start, end in units:
+            count += 1
+            raw = data[start:end] if end - start <= MAX_MEMO_UNIT_BYTES else None
+            memo = seen.get(raw) if raw is not None else None
+            if memo is None:
+                classification = self._classify_unit(data, start, end, context)
+                outcome = outcomes.lookup(
+                    classification.resource_type,
+                    classification.action_type,
+                    classification.scope_type,
+                )
+                if raw is not None and len(seen) < UNIT_CACHE_SIZE:
+                    seen[raw] = (classification, outcome)
+            else:
+                classification, outcome = memo
+            risk_level = outcome.risk_level
+            # Same floor as build_assessment: unscanned text needs confirmation
+            if risk_level is RiskLevel.LOW and classification.scan and classification.scan["truncated"]:
+                risk_level = RiskLevel.MEDIUM
+            by_risk_level[risk_level] += 1
+            rank = (LEVEL_ORDER.index(risk_level), outcome.risk_score)
+            if rank > worst_rank:
+                worst, worst_rank, max_line = classification, rank, first_line
+            if risk_level is RiskLevel.LOW:
+                continue
+            if len(heatmap) >= MAX_HEATMAP_ENTRIES:
+                heatmap_truncated = True
+                continue
+            entry: dict[str, Any] = {"line": first_line}
+            if last_line != first_line:
+                entry["end_line"] = last_line
+            entry["risk_level"] = risk_level.value
+            entry["risk_score"] = outcome.risk_score
+            heatmap.append(entry)
+
+        return FileScan(
+            path=path,
+            size=len(data),
+            mode=mode,
+            lines=_count(data, b"\n") + (1 if len(data) and data[-1:] != b"\n" else 0),
+            units=count,
+            classification=worst or self._unit_assessor.classify("", context),
+            max_line=max_line,
+            by_risk_level={level.value: units for level, units in by_risk_level.items()},
+            heatmap=heatmap,
+            heatmap_truncated=heatmap_truncated,
+        )
+
+    def _classify_unit(self, data: mmap.mmap | bytes, start: int, end: int, context: str) -> Classification:
+        """Classify one unit, streaming it from the map if it is large"""
+        if end - start <= STREAMING_THRESHOLD:
+            text = data[start:end].decode("utf-8", errors="replace")
+            return self._unit_assessor.classify(text, context)
+
+        classifier = IncrementalClassifier(context)
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        for position in range(start, end, UNIT_CHUNK_BYTES):
+            chunk_end = min(end, position + UNIT_CHUNK_BYTES)
+            classifier.feed(decoder.decode(data[position:chunk_end], final=chunk_end == end))
+        result = classifier.result()
+        resource_score, action_multiplier, scope_multiplier = StreamingClassifier.scores(result)
+        return Classification(
+            resource_type=result.resource_type,
+            resource_score=resource_score,
+            action_type=result.action_type,
+            action_multiplier=action_multiplier,
+            scope_type=result.scope_type,
+            scope_multiplier=scope_multiplier,
+            scan=result.to_dict(),
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get file and unit cache statistics"""
+        return {
+            "files": self.cache.get_stats(),
+            "units": self._unit_assessor.cache.get_stats(),
+        }
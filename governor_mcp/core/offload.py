@@ -0,0 +1,315 @@
+"""Size-aware execution of CPU-heavy work off the asyncio event loop"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+from ..classification.instrumentation import STATS
+from ..state import Assessment, PlanStep
+from .deviation_detector import DeviationReport
+
+T = TypeVar("T")
+
+OFFLOAD_THRESHOLD_ENV = "GOVERNOR_OFFLOAD_THRESHOLD"
+OFFLOAD_AUDIT_THRESHOLD_ENV = "GOVERNOR_OFFLOAD_AUDIT_THRESHOLD"
+OFFLOAD_WORKERS_ENV = "GOVERNOR_OFFLOAD_WORKERS"
+OFFLOAD_MODE_ENV = "GOVERNOR_OFFLOAD_MODE"
+
+# Inputs of at least this many characters (operation, description and
+# context together) are assessed or compared off the event loop; smaller
+# ones take well under a millisecond and run inline
+DEFAULT_THRESHOLD = 16384
+
+# Audit queries over at least this many entries run off the event loop
+DEFAULT_AUDIT_THRESHOLD = 5000
+
+# Workers per pool; offloaded calls beyond this wait in the pool's queue
+DEFAULT_WORKERS = 2
+
+# "thread" keeps everything in-process. "process" runs assessments and
+# deviation checks in worker processes, so the event loop never competes
+# with them for the interpreter lock, but those calls are invisible to the
+# server's rule instrumentation, classification cache and model statistics.
+# Audit queries always use threads, since they read the in-process audit
+# log.
+OFFLOAD_MODES = ("thread", "process")
+DEFAULT_MODE = "thread"
+
+# Kinds of work measured in audit entries rather than characters
+_AUDIT_KINDS = frozenset({"history"})
+
+# Kinds of work that may run in a worker process
+_PROCESS_KINDS = frozenset({"assess", "detect"})
+
+
+def text_size(*parts: str | list[str] | None) -> int:
+    """Size of some text inputs in characters (lists count every item)"""
+    size = 0
+    for part in parts:
+        if isinstance(part, str):
+            size += len(part)
+        elif part:
+            size += sum(len(item) for item in part)
+    return size
+
+
+# Entry points for offloaded work. They reach the engine through
+# get_engine(), so they run unchanged inline, in a thread of the server
+# process, or in a worker process with its own engine.
+
+def assess_operation(operation: str, description: str, context: str | list[str]) -> Assessment:
+    """Assess one operation with the engine of the current process"""
+    from .engine import get_engine
+
+    return get_engine().assessor.assess(operation, description, context)
+
+
+def assess_operations(operations: list[tuple[str, str, str | list[str]]]) -> list[Assessment]:
+    """Assess a batch of operations with the engine of the current process"""
+    from .engine import get_engine
+
+    return get_engine().assessor.assess_many(operations)
+
+
+def detect_deviation(step: PlanStep, actual_operation: str, actual_outcome: str) -> DeviationReport:
+    """Compare a step with its execution using the engine of the current process"""
+    from .engine import get_engine
+
+    return get_engine().deviation_detector.detect(
+        step=step,
+        actual_operation=actual_operation,
+        actual_outcome=actual_outcome,
+    )
+
+
+def _init_worker(rules_path: str | None, model_path: str | None, model_mode: str) -> None:
+    """Load the server's rules and model and warm up a worker process"""
+    from ..classification import configure_rule_pack
+    from .engine import get_engine
+
+    if rules_path:
+        configure_rule_pack(rules_path)
+    engine = get_engine()
+    if model_path:
+        engine.configure_model(model_path, model_mode)
+    engine.warmup()
+
+
+def _ready() -> bool:
+    """No-op task that makes a worker process start"""
+    return True
+
+
+class _Pool:
+    """One executor with its in-flight and queue depth counters"""
+
+    def __init__(self, executor: Executor, workers: int):
+        self.executor = executor
+        self.workers = workers
+        self.in_flight = 0
+        self.peak_queue_depth = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Offloaded calls waiting for a free worker"""
+        return max(0, self.in_flight - self.workers)
+
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "workers": self.workers,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self.peak_queue_depth,
+        }
+
+
+class Offloader:
+    """
+    Runs tool work inline or in a bounded worker pool depending on size.
+
+    Every tool handler is a coroutine on one event loop, so a synchronous
+    assessment of a megabyte-sized script stalls every other client until
+    it finishes. Work at or above the cutoff is submitted to a pool and
+    awaited instead, and the loop keeps serving small calls meanwhile.
+    Small work stays inline, where the hop to a worker would cost more
+    than the work itself.
+
+    Thread mode (the default) keeps all work in the server process. In
+    process mode, assessments and deviation checks run in worker processes
+    with their own engine, started with the server's rule pack and model;
+    their results are plain dataclasses that the caller stores in the
+    session and audit log as usual. Worker processes keep their own
+    caches and statistics, so while rule instrumentation is enabled those
+    calls go to the thread pool instead and are recorded like any other.
+    Audit queries read the in-process log and always run in a thread.
+    """
+
+    def __init__(
+        self,
+        threshold: int = DEFAULT_THRESHOLD,
+        audit_threshold: int = DEFAULT_AUDIT_THRESHOLD,
+        workers: int = DEFAULT_WORKERS,
+        mode: str = DEFAULT_MODE,
+    ):
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        if mode not in OFFLOAD_MODES:
+            raise ValueError(f"Unknown offload mode: {mode!r} (expected one of {', '.join(OFFLOAD_MODES)})")
+        self.threshold = threshold
+        self.audit_threshold = audit_threshold
+        self.workers = workers
+        self.mode = mode
+        self._pools: dict[str, _Pool] = {}
+        self._counts: dict[str, dict[str, Any]] = {}
+
+    @classmethod
+    def from_env(cls) -> "Offloader":
+        """
+        Create an offloader configured from the environment.
+
+        GOVERNOR_OFFLOAD_THRESHOLD sets the cutoff in characters (0 offloads
+        everything), GOVERNOR_OFFLOAD_AUDIT_THRESHOLD the cutoff in audit
+        entries, GOVERNOR_OFFLOAD_WORKERS the workers per pool and
+        GOVERNOR_OFFLOAD_MODE "thread" or "process".
+
+        Raises:
+            ValueError: If a variable is malformed or out of range
+        """
+        return cls(
+            threshold=_int_env(OFFLOAD_THRESHOLD_ENV, DEFAULT_THRESHOLD),
+            audit_threshold=_int_env(OFFLOAD_AUDIT_THRESHOLD_ENV, DEFAULT_AUDIT_THRESHOLD),
+            workers=_int_env(OFFLOAD_WORKERS_ENV, DEFAULT_WORKERS),
+            mode=os.environ.get(OFFLOAD_MODE_ENV, "").strip().lower() or DEFAULT_MODE,
+        )
+
+    def should_offload(self, kind: str, size: int) -> bool:
+        """Check whether work of a kind and size goes to a pool"""
+        threshold = self.audit_threshold if kind in _AUDIT_KINDS else self.threshold
+        return size >= threshold
+
+    def _pool_name(self, kind: str) -> str:
+        """Pool for a kind of work; threads while instrumentation records"""
+        if self.mode == "process" and kind in _PROCESS_KINDS and not STATS.enabled:
+            return "process"
+        return "thread"
+
+    def _get_pool(self, name: str) -> _Pool:
+        """Get a pool, starting it on first use"""
+        pool = self._pools.get(name)
+        if pool is None:
+            if name == "process":
+                from ..classification.rules import get_rule_pack_loader
+                from .engine import get_engine
+
+                engine = get_engine()
+                loader = get_rule_pack_loader()
+                executor: Executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    # Workers must not inherit the server's threads and locks
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(loader.path if loader else None, engine.model_path, engine.assessor.model_mode),
+                )
+            else:
+                executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="governor-offload")
+            pool = self._pools[name] = _Pool(executor, self.workers)
+        return pool
+
+    def start(self) -> None:
+        """
+        Start the worker pools now instead of on the first large call.
+
+        Worker processes load the rules and warm up once; starting them at
+        server startup keeps that out of the first offloaded call.
+        """
+        self._get_pool("thread")
+        if self.mode == "process":
+            pool = self._get_pool("process")
+            for _ in range(self.workers):
+                pool.executor.submit(_ready)
+
+    async def run(self, kind: str, size: int, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a function inline or in a pool, depending on the input size.
+
+        Args:
+            kind: Kind of work: "assess" and "detect" (sized in characters,
+                may run in a worker process) or "history" (sized in audit
+                entries, runs in a thread)
+            size: Input size
+            func: Synchronous function to call; for "assess" and "detect" a
+                module-level function, so it can be sent to a process
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The function's result (exceptions propagate to the caller)
+        """
+        counts = self._counts.get(kind)
+        if counts is None:
+            counts = self._counts[kind] = {"inline": 0, "offloaded": 0, "offloaded_ms": 0.0, "max_size": 0}
+        if size > counts["max_size"]:
+            counts["max_size"] = size
+
+        if not self.should_offload(kind, size):
+            counts["inline"] += 1
+            return func(*args, **kwargs)
+
+        counts["offloaded"] += 1
+        name = self._pool_name(kind)
+        pool = self._get_pool(name)
+        pool.in_flight += 1
+        if pool.queue_depth > pool.peak_queue_depth:
+            pool.peak_queue_depth = pool.queue_depth
+        started = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool.executor, partial(func, *args, **kwargs))
+        except BrokenProcessPool:
+            # A worker died; start a fresh pool for the next call
+            if self._pools.get(name) is pool:
+                del self._pools[name]
+                pool.executor.shutdown(wait=False)
+            raise
+        finally:
+            pool.in_flight -= 1
+            counts["offloaded_ms"] += (time.perf_counter() - started) * 1000
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the worker pools; they are restarted by the next offloaded call"""
+        pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            pool.executor.shutdown(wait=wait, cancel_futures=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get the cutoffs, pool queue depths and per-kind offload counts"""
+        return {
+            "mode": self.mode,
+            "threshold": self.threshold,
+            "audit_threshold": self.audit_threshold,
+            "workers": self.workers,
+            "queue_depth": sum(pool.queue_depth for pool in self._pools.values()),
+            "pools": {name: pool.get_stats() for name, pool in sorted(self._pools.items())},
+            "by_kind": {
+                kind: {**counts, "offloaded_ms": round(counts["offloaded_ms"], 3)}
+                for kind, counts in sorted(self._counts.items())
+            },
+        }
+
+
+def _int_env(name: str, default: int) -> int:
+    """Read a non-negative integer environment variable"""
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {raw!r}") from None
+    if value < 0:
+        raise ValueError(f"{name} must not be negative, got {value}")
+    return value
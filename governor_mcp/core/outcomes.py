@@ -0,0 +1,137 @@
+"""Precomputed assessment outcomes for every classification combination"""
+
+from dataclasses import dataclass
+from itertools import product
+from typing import Any
+
+from ..classification import ActionClassifier, ActionType, ResourceClassifier, ResourceType, ScopeType
+from ..state import RiskLevel
+from .scoring import ACTION_ORDER, LEVEL_ORDER, RESOURCE_ORDER, SCOPE_ORDER, ScoringWeights
+
+
+@dataclass(frozen=True)
+class Outcome:
+    """Score, level, factors and recommendations for one classification"""
+    risk_score: float
+    risk_level: RiskLevel
+    # Shared template; use factors_copy() for a per-assessment dict
+    factors: dict[str, Any]
+    recommendations: tuple[str, ...]
+
+    def factors_copy(self) -> dict[str, Any]:
+        """Get a copy of the factors that callers may modify"""
+        return {
+            key: dict(value) if isinstance(value, dict) else value
+            for key, value in self.factors.items()
+        }
+
+
+def generate_recommendations(
+    risk_level: RiskLevel,
+    resource_type: ResourceType,
+    action_type: ActionType,
+    scope_type: ScopeType,
+) -> list[str]:
+    """Generate recommendations based on assessment"""
+    recommendations = []
+
+    if risk_level == RiskLevel.LOW:
+        recommendations.append("Operation can proceed without additional approval")
+        return recommendations
+
+    if risk_level == RiskLevel.MEDIUM:
+        recommendations.append("User confirmation required before proceeding")
+
+        if resource_type == ResourceType.EXTERNAL_API:
+            recommendations.append("Verify API endpoint and credentials are correct")
+
+        if action_type == ActionType.WRITE:
+            recommendations.append("Consider creating a backup before modification")
+
+    if risk_level == RiskLevel.HIGH:
+        recommendations.append("Create a structured execution plan with step-by-step approval")
+        recommendations.append("Document rollback procedures for each step")
+
+        if resource_type == ResourceType.DATABASE:
+            recommendations.append("Ensure database backup exists before proceeding")
+            recommendations.append("Consider running in a transaction with rollback capability")
+
+        if resource_type == ResourceType.SENSITIVE_FILE:
+            recommendations.append("Verify credential handling follows security best practices")
+            recommendations.append("Ensure sensitive data is not logged or exposed")
+
+        if resource_type == ResourceType.SYSTEM_COMMAND:
+            recommendations.append("Review command for unintended side effects")
+            recommendations.append("Consider running in isolated/sandboxed environment first")
+
+        if action_type == ActionType.DELETE:
+            recommendations.append("Confirm deletion targets are correct")
+            recommendations.append("Verify backup exists before deletion")
+
+        if scope_type == ScopeType.SYSTEM:
+            recommendations.append("Assess impact on dependent systems")
+            recommendations.append("Consider staged rollout if possible")
+
+    return recommendations
+
+
+class OutcomeTable:
+    """
+    Immutable table of assessment outcomes for all 6 × 4 × 4 classifications.
+
+    Built once per set of weights and thresholds, so an assessment is a
+    classification plus one dictionary lookup. Build a new table whenever
+    the weights or thresholds change.
+    """
+
+    def __init__(self, weights: ScoringWeights | None = None):
+        self.weights = weights or ScoringWeights()
+        resource_classifier = ResourceClassifier()
+        action_classifier = ActionClassifier()
+
+        outcomes: dict[tuple[ResourceType, ActionType, ScopeType], Outcome] = {}
+        for resource_type, action_type, scope_type in product(RESOURCE_ORDER, ACTION_ORDER, SCOPE_ORDER):
+            resource_score = self.weights.resource_scores[resource_type]
+            action_multiplier = self.weights.action_multipliers[action_type]
+            scope_multiplier = self.weights.scope_multipliers[scope_type]
+            risk_score = resource_score * action_multiplier * scope_multiplier
+            risk_level = LEVEL_ORDER[self.weights.level_code(risk_score)]
+            factors = {
+                "resource": {
+                    "type": resource_type.value,
+                    "base_score": resource_score,
+                    "description": resource_classifier.get_resource_description(resource_type),
+                },
+                "action": {
+                    "type": action_type.value,
+                    "multiplier": action_multiplier,
+                    "description": action_classifier.get_action_description(action_type),
+                },
+                "scope": {
+                    "type": scope_type.value,
+                    "multiplier": scope_multiplier,
+                    "description": action_classifier.get_scope_description(scope_type),
+                },
+                "calculation": f"{resource_score} × {action_multiplier} × {scope_multiplier} = {risk_score}",
+            }
+            outcomes[(resource_type, action_type, scope_type)] = Outcome(
+                risk_score=risk_score,
+                risk_level=risk_level,
+                factors=factors,
+                recommendations=tuple(
+                    generate_recommendations(risk_level, resource_type, action_type, scope_type)
+                ),
+            )
+        self._outcomes = outcomes
+
+    def lookup(
+        self,
+        resource_type: ResourceType,
+        action_type: ActionType,
+        scope_type: ScopeType,
+    ) -> Outcome:
+        """Get the precomputed outcome of a classification"""
+        return self._outcomes[(resource_type, action_type, scope_type)]
+
+    def __len__(self) -> int:
+        return len(self._outcomes)
@@ -13,14 +13,16 @@ from ..state import (
     Approval,
     RiskLevel,
 )
-from ..state.session import get_session
+from ..state.session import SessionManager, get_session
 
 
 class PlanController:
     """Manages the lifecycle of execution plans for high-risk operations"""
 
-    def __init__(self):
-        self._session = get_session()
+    @property
+    def _session(self) -> SessionManager:
+        # Looked up on use so a long-lived controller follows reset_session()
+        return get_session()
 
     def create_plan(
         self,
@@ -1,7 +1,10 @@
 """Risk assessment engine for Governor MCP"""
 
+import hashlib
+import threading
 import uuid
-from typing import Any
+from dataclasses import dataclass, replace
+from typing import Any, Iterable
 
 from ..classification import (
     ResourceClassifier,
@@ -9,27 +12,378 @@ from ..classification import (
     ResourceType,
     ActionType,
     ScopeType,
+    StreamingClassifier,
+    STREAMING_THRESHOLD,
+    OperationFeatures,
+    StatementClassifier,
+    StatementVerdict,
+    TargetClassifier,
+    RuleSet,
+    dedupe_targets,
+    fingerprint,
+    get_rule_set,
+    literals_inert,
 )
+from ..classification.instrumentation import STATS
 from ..state import Assessment, RiskLevel
+from .cache import FINGERPRINT_MISMATCH, ClassificationCache, get_classification_cache
+from .outcomes import OutcomeTable, generate_recommendations
+from .risk_model import (
+    DEFAULT_BLEND_WEIGHT,
+    DEFAULT_THRESHOLD,
+    MODEL_MODES,
+    RiskModel,
+    looks_like_prose,
+)
+from .scoring import LEVEL_ORDER, ScoringWeights, score_classifications
 
 
 # Risk thresholds
 LOW_THRESHOLD = 3.0
 MEDIUM_THRESHOLD = 8.0
 
+# Statement shapes listed per assessment, and characters shown of each
+MAX_STATEMENT_SHAPES = 20
+MAX_SHAPE_CHARS = 120
+
+
+@dataclass(frozen=True)
+class Classification:
+    """Resource, action and scope classification of an operation"""
+    resource_type: ResourceType
+    resource_score: float
+    action_type: ActionType
+    action_multiplier: float
+    scope_type: ScopeType
+    scope_multiplier: float
+    # Chunked-scan statistics for inputs above STREAMING_THRESHOLD
+    scan: dict[str, Any] | None = None
+    # Per-statement verdicts of multi-statement SQL scripts
+    statements: tuple[StatementVerdict, ...] | None = None
+    # Literal-stripping fingerprint of operation and context (hex); not set
+    # for inputs too large to cache
+    fingerprint: str | None = None
+    # Summary of a structured (list) context, see TargetScan.to_dict
+    targets: dict[str, Any] | None = None
+
 
 class RiskAssessor:
     """Assesses risk levels for operations based on composite scoring"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache: ClassificationCache | None = None,
+        weights: ScoringWeights | None = None,
+    ):
         self.resource_classifier = ResourceClassifier()
         self.action_classifier = ActionClassifier()
+        self.streaming_classifier = StreamingClassifier()
+        self.statement_classifier = StatementClassifier(self.resource_classifier, self.action_classifier)
+        self.target_classifier = TargetClassifier(self.resource_classifier, self.action_classifier)
+        self.cache = cache if cache is not None else get_classification_cache()
+        self.set_weights(weights)
+        self.model: RiskModel | None = None
+        self.model_mode = "escalate"
+        self.model_threshold = DEFAULT_THRESHOLD
+        self.model_blend_weight = DEFAULT_BLEND_WEIGHT
+        # Updated from Offloader worker threads
+        self._model_stats_lock = threading.Lock()
+        self.model_stats = {"predictions": 0, "changed": 0}
+
+    def set_weights(self, weights: ScoringWeights | None = None) -> None:
+        """
+        Change score tables or thresholds and rebuild the outcome table.
+
+        Args:
+            weights: New ScoringWeights; None restores the defaults
+        """
+        # Built completely before the swap so concurrent assessments see
+        # either the old table or the new one
+        self.outcomes = OutcomeTable(weights)
+        self.weights = self.outcomes.weights
+
+    def set_model(
+        self,
+        model: RiskModel | None,
+        mode: str = "escalate",
+        threshold: float = DEFAULT_THRESHOLD,
+        blend_weight: float = DEFAULT_BLEND_WEIGHT,
+    ) -> None:
+        """
+        Use a secondary model on prose operations.
+
+        Args:
+            model: Trained RiskModel; None turns the model off
+            mode: "escalate" raises the level when the model predicts a
+                higher one with at least threshold confidence; "blend" takes
+                the most likely level of (1 - blend_weight) × rule level +
+                blend_weight × model probabilities, but never one below the
+                rule level
+            threshold: Minimum confidence for "escalate"
+            blend_weight: Model share for "blend"
+        """
+        if mode not in MODEL_MODES:
+            raise ValueError(f"Invalid model mode: {mode}. Must be one of: {', '.join(MODEL_MODES)}")
+        self.model = model
+        self.model_mode = mode
+        self.model_threshold = threshold
+        self.model_blend_weight = blend_weight
+        with self._model_stats_lock:
+            self.model_stats = {"predictions": 0, "changed": 0}
+
+    def get_model_stats(self) -> dict[str, int]:
+        """Get the model prediction counters"""
+        with self._model_stats_lock:
+            return dict(self.model_stats)
+
+    def predict_levels(self, operations: list[str]) -> list[Any | None]:
+        """
+        Get model level probabilities for the prose operations of a batch.
+
+        Returns:
+            Per operation, LEVEL_ORDER probabilities or None when no model
+            is set or the operation is not prose
+        """
+        predictions: list[Any | None] = [None] * len(operations)
+        model = self.model
+        if model is None:
+            return predictions
+        prose = [i for i, operation in enumerate(operations) if looks_like_prose(operation)]
+        if prose:
+            probabilities = model.predict_proba([operations[i] for i in prose])
+            for row, i in enumerate(prose):
+                predictions[i] = probabilities[row]
+            with self._model_stats_lock:
+                self.model_stats["predictions"] += len(prose)
+        return predictions
+
+    def _apply_model(self, risk_level: RiskLevel, probabilities: Any) -> tuple[RiskLevel, dict[str, Any]]:
+        """Combine a rule-based level with model probabilities"""
+        current = LEVEL_ORDER.index(risk_level)
+        predicted = int(probabilities.argmax())
+        confidence = float(probabilities[predicted])
+        if self.model_mode == "blend":
+            mixed = probabilities * self.model_blend_weight
+            mixed[current] += 1 - self.model_blend_weight
+            # The model may add approval requirements but never remove them,
+            # so the blend is floored at the rule level
+            code = max(int(mixed.argmax()), current)
+        elif predicted > current and confidence >= self.model_threshold:
+            code = predicted
+        else:
+            code = current
+        if code != current:
+            with self._model_stats_lock:
+                self.model_stats["changed"] += 1
+        return LEVEL_ORDER[code], {
+            "level": LEVEL_ORDER[predicted].value,
+            "confidence": round(confidence, 3),
+            "mode": self.model_mode,
+            "changed_level": code != current,
+        }
+
+    def classify(self, operation: str, context: str = "") -> Classification:
+        """
+        Classify an operation's resource, action and scope.
+
+        Results are memoized in the classification cache; assessments built
+        from a cached classification still get their own id and timestamp.
+        Inputs that differ from a cached one only in masked literals
+        (numbers, ids, hashes, plain quoted strings, temp paths) are served
+        by its fingerprint when their literals cannot trigger any rule.
+
+        While rule instrumentation is enabled the cache is bypassed, so
+        every call records its rule hits and deciding rules and the
+        statistics reflect traffic rather than cache misses.
+
+        Args:
+            operation: The operation to classify
+            context: Additional context (file paths, targets, etc.)
+
+        Returns:
+            Classification with types and their scores/multipliers
+        """
+        # Pin the active rules for this classification
+        rules = get_rule_set()
+        if STATS.enabled:
+            return replace(
+                self._classify(operation, context, rules), fingerprint=fingerprint(operation, context).hex
+            )
+        key = self.cache.make_key(operation, context, rules.version)
+        if key is None:
+            return self._classify(operation, context, rules)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        operation_fingerprint = fingerprint(operation, context)
+        fingerprint_key = None
+        masked = operation_fingerprint.literals or operation_fingerprint.context_literals
+        if masked and literals_inert(operation_fingerprint, rules):
+            fingerprint_key = self.cache.make_fingerprint_key(operation_fingerprint.value, rules.version)
+            cached = self.cache.get_fingerprint(fingerprint_key)
+            if cached is FINGERPRINT_MISMATCH:
+                fingerprint_key = None
+            elif cached is not None:
+                return cached
+
+        classification = self._classify(operation, context, rules)
+        if fingerprint_key is not None:
+            # The masked input must classify exactly like this one before
+            # the fingerprint is reused; a placeholder can break a rule
+            # such as kill -9, or a statement's offsets can shift
+            reusable = classification == self._classify(
+                operation_fingerprint.template, operation_fingerprint.context_template, rules
+            )
+        classification = replace(classification, fingerprint=operation_fingerprint.hex)
+        if fingerprint_key is not None:
+            self.cache.put(fingerprint_key, classification if reusable else FINGERPRINT_MISMATCH)
+        self.cache.put(key, classification)
+        return classification
+
+    def classify_targets(self, operation: str, targets: list[str]) -> Classification:
+        """
+        Classify an operation whose context is a list of targets.
+
+        The operation is classified on its own (and cached as usual); the
+        targets are deduplicated and classified by the target classifier,
+        which scans shared path components once. Resource type and scope are
+        the higher of the two, so a list of targets can only raise the
+        verdict.
+
+        Args:
+            operation: The operation to classify
+            targets: File paths, URLs, hosts or other targets
+
+        Returns:
+            Classification with a "targets" summary (count, duplicates,
+            components, max_target, resource_type, scope)
+        """
+        unique, duplicates = dedupe_targets(targets)
+        if not unique:
+            return self.classify(operation)
+        unique.sort()
+        rules = get_rule_set()
+        joined = "\n".join(unique)
+
+        # Keyed on a digest of the target set, so long lists stay cacheable;
+        # bypassed while instrumenting, like classify()
+        key = None if STATS.enabled else self.cache.make_key(operation, "", rules.version)
+        if key is not None:
+            key = ("targets", hashlib.blake2b(joined.encode("utf-8"), digest_size=16).digest(), *key)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return replace(cached, targets={**cached.targets, "duplicates": duplicates})
+
+        base = self.classify(operation)
+        scan = self.target_classifier.classify(unique, rules)
+        classification = replace(base, fingerprint=fingerprint(operation, joined).hex, targets=scan.to_dict())
+        if scan.resource_score > base.resource_score:
+            classification = replace(
+                classification, resource_type=scan.resource_type, resource_score=scan.resource_score
+            )
+        if scan.scope_multiplier > base.scope_multiplier:
+            classification = replace(
+                classification, scope_type=scan.scope_type, scope_multiplier=scan.scope_multiplier
+            )
+        if key is not None:
+            self.cache.put(key, classification)
+        return replace(classification, targets={**classification.targets, "duplicates": duplicates})
+
+    def classify_context(self, operation: str, context: str | list[str] = "") -> Classification:
+        """Classify with a free-form string context or a list of targets"""
+        if isinstance(context, str):
+            return self.classify(operation, context)
+        return self.classify_targets(operation, context)
+
+    def _classify(self, operation: str, context: str, rules: RuleSet) -> Classification:
+        """Classify an operation with the given rules, bypassing the cache"""
+        # Very large inputs are walked in chunks with bounded work
+        if len(operation) + len(context) > STREAMING_THRESHOLD:
+            result = self.streaming_classifier.classify(operation, context, rules)
+            resource_score, action_multiplier, scope_multiplier = self.streaming_classifier.scores(result)
+            statements = []
+            if result.resource_type == ResourceType.DATABASE:
+                statements = self.statement_classifier.classify(operation, context, rules)
+            return self._with_statements(
+                Classification(
+                    resource_type=result.resource_type,
+                    resource_score=resource_score,
+                    action_type=result.action_type,
+                    action_multiplier=action_multiplier,
+                    scope_type=result.scope_type,
+                    scope_multiplier=scope_multiplier,
+                    scan=result.to_dict(),
+                ),
+                statements,
+            )
+
+        # Normalize and tokenize once for all classifiers
+        features = OperationFeatures(operation, context, rules)
+        resource_type, resource_score = self.resource_classifier.classify_features(features)
+        action_type, action_multiplier = self.action_classifier.classify_action_features(features)
+        scope_type, scope_multiplier = self.action_classifier.classify_scope_features(features)
+
+        # Scripts of several statements are also scored statement by statement
+        statements = []
+        scan = features.operation_sql
+        if len(scan.statements) > 1:
+            # Without context the scan covers the stripped operation, whose
+            # offsets differ only if the operation starts with whitespace
+            if not features.context.strip() and operation[:1].isspace():
+                scan = None
+            statements = self.statement_classifier.classify(operation, context, rules, scan)
+
+        return self._with_statements(
+            Classification(
+                resource_type=resource_type,
+                resource_score=resource_score,
+                action_type=action_type,
+                action_multiplier=action_multiplier,
+                scope_type=scope_type,
+                scope_multiplier=scope_multiplier,
+            ),
+            statements,
+        )
+
+    @staticmethod
+    def _with_statements(
+        classification: Classification,
+        statements: list[StatementVerdict],
+    ) -> Classification:
+        """
+        Attach per-statement verdicts to a whole-text classification.
+
+        The riskiest statement replaces the whole-text verdict only when it
+        scores higher, so splitting a script can raise its risk but never
+        lower it.
+        """
+        if not statements:
+            return classification
+        worst = max(statements, key=lambda verdict: verdict.risk_score)
+        whole_score = (
+            classification.resource_score
+            * classification.action_multiplier
+            * classification.scope_multiplier
+        )
+        if worst.risk_score > whole_score:
+            return Classification(
+                resource_type=worst.resource_type,
+                resource_score=worst.resource_score,
+                action_type=worst.action_type,
+                action_multiplier=worst.action_multiplier,
+                scope_type=worst.scope_type,
+                scope_multiplier=worst.scope_multiplier,
+                scan=classification.scan,
+                statements=tuple(statements),
+            )
+        return replace(classification, statements=tuple(statements))
 
     def assess(
         self,
         operation: str,
         description: str = "",
-        context: str = "",
+        context: str | list[str] = "",
     ) -> Assessment:
         """
         Perform a risk assessment on an operation.
@@ -44,50 +398,93 @@ class RiskAssessor:
         Args:
             operation: The operation to assess (command, description, etc.)
             description: Human-readable description of what the operation does
-            context: Additional context (file paths, targets, etc.)
+            context: Additional context (file paths, targets, etc.), as free
+                text or as a list of targets (see classify_targets)
 
         Returns:
             Assessment object with risk classification
         """
-        # Classify resource type
-        resource_type, resource_score = self.resource_classifier.classify(operation, context)
-
-        # Classify action type
-        action_type, action_multiplier = self.action_classifier.classify_action(operation)
-
-        # Classify scope
-        scope_type, scope_multiplier = self.action_classifier.classify_scope(operation, context)
-
-        # Calculate composite risk score
-        risk_score = resource_score * action_multiplier * scope_multiplier
-
-        # Determine risk level
-        risk_level = self._calculate_risk_level(risk_score)
-
-        # Build factors dictionary
-        factors = {
-            "resource": {
-                "type": resource_type.value,
-                "base_score": resource_score,
-                "description": self.resource_classifier.get_resource_description(resource_type),
-            },
-            "action": {
-                "type": action_type.value,
-                "multiplier": action_multiplier,
-                "description": self.action_classifier.get_action_description(action_type),
-            },
-            "scope": {
-                "type": scope_type.value,
-                "multiplier": scope_multiplier,
-                "description": self.action_classifier.get_scope_description(scope_type),
-            },
-            "calculation": f"{resource_score} × {action_multiplier} × {scope_multiplier} = {risk_score}",
-        }
+        # Classify resource, action and scope (memoized)
+        return self.build_assessment(operation, description, self.classify_context(operation, context))
 
-        # Generate recommendations
-        recommendations = self._generate_recommendations(
-            risk_level, resource_type, action_type, scope_type
-        )
+    def assess_many(self, operations: list[tuple[str, str, str | list[str]]]) -> list[Assessment]:
+        """
+        Assess a batch of operations, scoring prose with the model in one call.
+
+        Args:
+            operations: (operation, description, context) tuples
+
+        Returns:
+            Assessments in input order
+        """
+        classifications = [self.classify_context(operation, context) for operation, _, context in operations]
+        predictions = self.predict_levels([operation for operation, _, _ in operations])
+        return [
+            self.build_assessment(operation, description, classification, prediction)
+            for (operation, description, _), classification, prediction
+            in zip(operations, classifications, predictions)
+        ]
+
+    def build_assessment(
+        self,
+        operation: str,
+        description: str,
+        classification: Classification,
+        prediction: Any | None = None,
+    ) -> Assessment:
+        """
+        Build an assessment from an existing classification.
+
+        Args:
+            operation: The assessed operation
+            description: Human-readable description (generated if empty)
+            classification: Resource, action and scope of the operation
+            prediction: Model probabilities from predict_levels; computed
+                here when a model is set and none are given
+
+        Returns:
+            Assessment object with risk classification
+        """
+        resource_type = classification.resource_type
+        action_type = classification.action_type
+        scope_type = classification.scope_type
+
+        # Score, level, factors and recommendations are precomputed
+        outcome = self.outcomes.lookup(resource_type, action_type, scope_type)
+        risk_level = outcome.risk_level
+        recommendations = list(outcome.recommendations)
+        factors = outcome.factors_copy()
+
+        if prediction is None and self.model is not None:
+            prediction = self.predict_levels([operation])[0]
+        if prediction is not None:
+            model_level, factors["model"] = self._apply_model(risk_level, prediction)
+            if model_level != risk_level:
+                risk_level = model_level
+                recommendations = generate_recommendations(risk_level, resource_type, action_type, scope_type)
+                recommendations.append(
+                    f"Risk level set to {risk_level.value} by the secondary model "
+                    f"(rules: {outcome.risk_level.value})"
+                )
+
+        # Unscanned input may hide anything, so it always needs confirmation
+        truncated = bool(classification.scan and classification.scan["truncated"])
+        if truncated and risk_level == RiskLevel.LOW:
+            risk_level = RiskLevel.MEDIUM
+            recommendations = generate_recommendations(risk_level, resource_type, action_type, scope_type)
+
+        if classification.scan:
+            factors["scan"] = classification.scan
+        if classification.statements:
+            factors["statements"] = self._statement_breakdown(classification.statements)
+        if classification.targets:
+            factors["targets"] = classification.targets
+        if truncated:
+            recommendations.append(
+                f"Only the first {classification.scan['chars_scanned']} of "
+                f"{classification.scan['total_chars']} characters were classified; "
+                "review the remainder manually"
+            )
 
         return Assessment(
             id=str(uuid.uuid4()),
@@ -96,20 +493,81 @@ class RiskAssessor:
             resource_type=resource_type.value,
             action_type=action_type.value,
             scope=scope_type.value,
-            risk_score=risk_score,
+            risk_score=outcome.risk_score,
             risk_level=risk_level,
             factors=factors,
             recommendations=recommendations,
+            fingerprint=classification.fingerprint or "",
         )
 
+    def _statement_breakdown(self, statements: tuple[StatementVerdict, ...]) -> dict[str, Any]:
+        """
+        Summarize per-statement verdicts, one entry per statement shape.
+
+        Returns:
+            Dict with the statement count, the index of the riskiest
+            statement and up to MAX_STATEMENT_SHAPES shapes (riskiest first)
+            with their first index, count and score
+        """
+        shapes: dict[str, dict[str, Any]] = {}
+        worst = statements[0]
+        for verdict in statements:
+            entry = shapes.get(verdict.shape)
+            if entry is None:
+                outcome = self.outcomes.lookup(verdict.resource_type, verdict.action_type, verdict.scope_type)
+                entry = shapes[verdict.shape] = {
+                    "statement": verdict.shape[:MAX_SHAPE_CHARS],
+                    "first_index": verdict.index,
+                    "count": 0,
+                    "resource_type": verdict.resource_type.value,
+                    "action_type": verdict.action_type.value,
+                    "scope": verdict.scope_type.value,
+                    "risk_score": outcome.risk_score,
+                    "risk_level": outcome.risk_level.value,
+                }
+            entry["count"] += 1
+            if verdict.risk_score > worst.risk_score:
+                worst = verdict
+        ranked = sorted(shapes.values(), key=lambda entry: -entry["risk_score"])
+        return {
+            "count": len(statements),
+            "max_index": worst.index,
+            "shapes": ranked[:MAX_STATEMENT_SHAPES],
+            "shapes_truncated": len(ranked) > MAX_STATEMENT_SHAPES,
+        }
+
+    def score_many(
+        self,
+        operations: Iterable[tuple[str, str]],
+        weights: ScoringWeights | None = None,
+    ) -> list[tuple[float, RiskLevel]]:
+        """
+        Score many operations without building full assessments.
+
+        Classification goes through the cache; scoring and thresholding run
+        vectorized over the whole batch when NumPy is installed. Pass weights
+        to replay operations under alternative score tables or thresholds.
+
+        Args:
+            operations: Iterable of (operation, context) pairs
+            weights: Alternative ScoringWeights (defaults to the current ones)
+
+        Returns:
+            List of (risk_score, RiskLevel) in input order
+        """
+        classifications = []
+        for operation, context in operations:
+            classification = self.classify(operation, context)
+            classifications.append((
+                classification.resource_type,
+                classification.action_type,
+                classification.scope_type,
+            ))
+        return score_classifications(classifications, weights or self.weights)
+
     def _calculate_risk_level(self, score: float) -> RiskLevel:
         """Determine risk level from score"""
-        if score < LOW_THRESHOLD:
-            return RiskLevel.LOW
-        elif score <= MEDIUM_THRESHOLD:
-            return RiskLevel.MEDIUM
-        else:
-            return RiskLevel.HIGH
+        return LEVEL_ORDER[self.weights.level_code(score)]
 
     def _generate_description(self, operation: str, action_type: ActionType) -> str:
         """Generate a default description for an operation"""
@@ -122,58 +580,13 @@ class RiskAssessor:
         verb = action_verbs.get(action_type, "Performing")
         return f"{verb}: {operation[:100]}{'...' if len(operation) > 100 else ''}"
 
-    def _generate_recommendations(
-        self,
-        risk_level: RiskLevel,
-        resource_type: ResourceType,
-        action_type: ActionType,
-        scope_type: ScopeType,
-    ) -> list[str]:
-        """Generate recommendations based on assessment"""
-        recommendations = []
-
-        if risk_level == RiskLevel.LOW:
-            recommendations.append("Operation can proceed without additional approval")
-            return recommendations
-
-        if risk_level == RiskLevel.MEDIUM:
-            recommendations.append("User confirmation required before proceeding")
-
-            if resource_type == ResourceType.EXTERNAL_API:
-                recommendations.append("Verify API endpoint and credentials are correct")
-
-            if action_type == ActionType.WRITE:
-                recommendations.append("Consider creating a backup before modification")
-
-        if risk_level == RiskLevel.HIGH:
-            recommendations.append("Create a structured execution plan with step-by-step approval")
-            recommendations.append("Document rollback procedures for each step")
-
-            if resource_type == ResourceType.DATABASE:
-                recommendations.append("Ensure database backup exists before proceeding")
-                recommendations.append("Consider running in a transaction with rollback capability")
-
-            if resource_type == ResourceType.SENSITIVE_FILE:
-                recommendations.append("Verify credential handling follows security best practices")
-                recommendations.append("Ensure sensitive data is not logged or exposed")
-
-            if resource_type == ResourceType.SYSTEM_COMMAND:
-                recommendations.append("Review command for unintended side effects")
-                recommendations.append("Consider running in isolated/sandboxed environment first")
-
-            if action_type == ActionType.DELETE:
-                recommendations.append("Confirm deletion targets are correct")
-                recommendations.append("Verify backup exists before deletion")
-
-            if scope_type == ScopeType.SYSTEM:
-                recommendations.append("Assess impact on dependent systems")
-                recommendations.append("Consider staged rollout if possible")
-
-        return recommendations
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Get classification cache size and hit-rate statistics"""
+        return self.cache.get_stats()
 
     def get_thresholds(self) -> dict[str, float]:
         """Get the current risk thresholds"""
         return {
-            "low_max": LOW_THRESHOLD,
-            "medium_max": MEDIUM_THRESHOLD,
+            "low_max": self.weights.low_threshold,
+            "medium_max": self.weights.medium_threshold,
         }
@@ -0,0 +1,290 @@
+"""Hashing-trick linear risk model used as a secondary scorer for prose"""
+
+import json
+import random
+import re
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Iterable, Sequence
+
+from ..state import RiskLevel
+from .scoring import HAS_NUMPY, LEVEL_ORDER, np
+
+MODEL_PATH_ENV = "GOVERNOR_MODEL_PATH"
+MODEL_MODE_ENV = "GOVERNOR_MODEL_MODE"
+
+# How model predictions change a verdict: "escalate" raises the level when
+# the model is confident, "blend" mixes the rule and model level
+# distributions; neither ever lowers the rule level
+MODEL_MODES = ("escalate", "blend")
+
+# Hashed feature space; a power of two so indices are a bit mask
+DEFAULT_N_FEATURES = 2 ** 18
+
+# Minimum model confidence before "escalate" raises a level
+DEFAULT_THRESHOLD = 0.8
+
+# Share of the model in "blend"; above 0.5 a confident model can raise the
+# level against the rules (lower levels are never taken)
+DEFAULT_BLEND_WEIGHT = 0.6
+
+# Words and single punctuation marks; whole words only, so "rm" never
+# matches inside "format"
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+# Shell and SQL syntax that marks an operation as a command, not prose
+_COMMAND_CHARS = re.compile(r"[|;&$`<>=]|://|(?:^|\s)--?\w")
+_MIN_PROSE_WORDS = 3
+
+
+def looks_like_prose(text: str) -> bool:
+    """True for natural-language operations the model is meant for"""
+    if _COMMAND_CHARS.search(text):
+        return False
+    words = text.split()
+    if len(words) < _MIN_PROSE_WORDS:
+        return False
+    alphabetic = sum(1 for word in words if word.strip(".,:!?'\"()").isalpha())
+    return alphabetic * 10 >= len(words) * 7
+
+
+@lru_cache(maxsize=65536)
+def _token_hash(token: str) -> int:
+    """Stable 32-bit hash of a token (str hashes are salted per process)"""
+    return zlib.crc32(token.encode("utf-8"))
+
+
+def _feature_hashes(text: str) -> list[int]:
+    """Hashes of the unigrams and bigrams of a text"""
+    hashes = [_token_hash(token) for token in TOKEN_PATTERN.findall(text.lower())]
+    bigrams = [
+        ((first * 0x9E3779B1) ^ second) & 0xFFFFFFFF
+        for first, second in zip(hashes, hashes[1:])
+    ]
+    return hashes + bigrams
+
+
+def _require_numpy() -> None:
+    if not HAS_NUMPY:
+        raise RuntimeError("NumPy is not installed; install the 'numpy' extra")
+
+
+def vectorize(texts: Sequence[str], n_features: int = DEFAULT_N_FEATURES) -> tuple[Any, Any, Any]:
+    """
+    Hash texts into a sparse matrix in coordinate form.
+
+    Each unigram and bigram maps to one of n_features columns with a sign
+    taken from its hash, and every row is scaled to unit length, so no
+    vocabulary is stored and unseen words cost nothing.
+
+    Args:
+        texts: Texts to vectorize
+        n_features: Number of hashed columns (a power of two)
+
+    Returns:
+        Tuple of (rows, columns, values) NumPy arrays
+    """
+    _require_numpy()
+    return _coordinates([np.asarray(_feature_hashes(text), dtype=np.uint32) for text in texts], n_features)
+
+
+def _coordinates(hashed: Sequence[Any], n_features: int) -> tuple[Any, Any, Any]:
+    """Build (rows, columns, values) from per-text feature hash arrays"""
+    counts = np.asarray([len(hashes) for hashes in hashed], dtype=np.intp)
+    rows = np.repeat(np.arange(len(hashed), dtype=np.intp), counts)
+    hash_array = np.concatenate(hashed) if len(hashed) else np.zeros(0, dtype=np.uint32)
+    columns = (hash_array & np.uint32(n_features - 1)).astype(np.intp)
+    values = np.where(hash_array >> 31, -1.0, 1.0)
+    norms = np.sqrt(np.maximum(counts, 1))
+    return rows, columns, values / norms[rows]
+
+
+def _softmax(scores: Any) -> Any:
+    shifted = np.exp(scores - scores.max(axis=1, keepdims=True))
+    return shifted / shifted.sum(axis=1, keepdims=True)
+
+
+@dataclass
+class RiskModel:
+    """Linear model over hashed n-grams predicting LOW/MEDIUM/HIGH"""
+    weights: Any  # (n_features, 3) float32, columns in LEVEL_ORDER
+    bias: Any  # (3,) float32
+    trained_on: int = 0
+
+    @property
+    def n_features(self) -> int:
+        return int(self.weights.shape[0])
+
+    def predict_proba(self, texts: Sequence[str]) -> Any:
+        """
+        Get level probabilities for a batch of texts.
+
+        Returns:
+            (len(texts), 3) array of probabilities in LEVEL_ORDER
+        """
+        rows, columns, values = vectorize(texts, self.n_features)
+        scores = np.tile(self.bias.astype(np.float64), (len(texts), 1))
+        for level in range(len(LEVEL_ORDER)):
+            scores[:, level] += np.bincount(
+                rows, weights=self.weights[columns, level] * values, minlength=len(texts)
+            )
+        return _softmax(scores)
+
+    def predict(self, texts: Sequence[str]) -> list[tuple[RiskLevel, float]]:
+        """Get the most likely level and its probability for each text"""
+        probabilities = self.predict_proba(texts)
+        codes = probabilities.argmax(axis=1)
+        return [
+            (LEVEL_ORDER[code], float(probabilities[row, code]))
+            for row, code in enumerate(codes)
+        ]
+
+    def save(self, path: str) -> str:
+        """Write the model as a .npz file and return the path"""
+        with open(path, "wb") as f:
+            np.savez_compressed(
+                f,
+                weights=self.weights,
+                bias=self.bias,
+                trained_on=np.asarray(self.trained_on),
+                levels=np.asarray([level.value for level in LEVEL_ORDER]),
+            )
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> "RiskModel":
+        """
+        Load a model written by save().
+
+        Raises:
+            RuntimeError: If NumPy is not installed
+            ValueError: If the file is not a compatible model
+        """
+        _require_numpy()
+        with np.load(path, allow_pickle=False) as data:
+            if list(data["levels"]) != [level.value for level in LEVEL_ORDER]:
+                raise ValueError(f"Model levels do not match: {list(data['levels'])}")
+            weights = data["weights"].astype(np.float32)
+            bias = data["bias"].astype(np.float32)
+            trained_on = int(data["trained_on"])
+        n_features = weights.shape[0]
+        if weights.ndim != 2 or weights.shape[1] != len(LEVEL_ORDER) or n_features & (n_features - 1):
+            raise ValueError(f"Invalid model weights shape: {weights.shape}")
+        if bias.shape != (len(LEVEL_ORDER),):
+            raise ValueError(f"Invalid model bias shape: {bias.shape}")
+        return cls(weights=weights, bias=bias, trained_on=trained_on)
+
+
+def train_model(
+    texts: Sequence[str],
+    labels: Sequence[RiskLevel],
+    n_features: int = DEFAULT_N_FEATURES,
+    epochs: int = 20,
+    learning_rate: float = 20.0,
+    l2: float = 1e-5,
+    batch_size: int = 256,
+    seed: int = 0,
+) -> RiskModel:
+    """
+    Fit a softmax regression on hashed n-grams with mini-batch gradient descent.
+
+    Classes are weighted by inverse frequency, so rare HIGH examples are not
+    drowned out by LOW ones.
+
+    Args:
+        texts: Operation texts
+        labels: Risk level of each text
+        n_features: Number of hashed columns (a power of two)
+        epochs: Passes over the data
+        learning_rate: Gradient step size
+        l2: L2 regularization strength
+        batch_size: Examples per gradient step
+        seed: Shuffling seed
+
+    Returns:
+        Trained RiskModel
+    """
+    _require_numpy()
+    if n_features <= 0 or n_features & (n_features - 1):
+        raise ValueError("n_features must be a power of two")
+    if not texts or len(texts) != len(labels):
+        raise ValueError("texts and labels must be non-empty and the same length")
+
+    codes = np.asarray([LEVEL_ORDER.index(label) for label in labels], dtype=np.intp)
+    counts = np.bincount(codes, minlength=len(LEVEL_ORDER))
+    class_weights = len(codes) / (len(LEVEL_ORDER) * np.maximum(counts, 1))
+
+    weights = np.zeros((n_features, len(LEVEL_ORDER)), dtype=np.float64)
+    bias = np.zeros(len(LEVEL_ORDER), dtype=np.float64)
+    order = list(range(len(texts)))
+    rnd = random.Random(seed)
+    # Texts are hashed once; each epoch only regroups them into batches
+    hashed = [np.asarray(_feature_hashes(text), dtype=np.uint32) for text in texts]
+
+    for _ in range(epochs):
+        rnd.shuffle(order)
+        for start in range(0, len(order), batch_size):
+            batch = order[start:start + batch_size]
+            rows, columns, values = _coordinates([hashed[i] for i in batch], n_features)
+            scores = np.tile(bias, (len(batch), 1))
+            for level in range(len(LEVEL_ORDER)):
+                scores[:, level] += np.bincount(
+                    rows, weights=weights[columns, level] * values, minlength=len(batch)
+                )
+            targets = np.zeros_like(scores)
+            batch_codes = codes[batch]
+            targets[np.arange(len(batch)), batch_codes] = 1.0
+            errors = (_softmax(scores) - targets) * class_weights[batch_codes][:, None] / len(batch)
+
+            # Only the columns present in the batch are updated
+            touched, inverse = np.unique(columns, return_inverse=True)
+            contributions = errors[rows] * values[:, None]
+            gradient = np.stack([
+                np.bincount(inverse, weights=contributions[:, level], minlength=len(touched))
+                for level in range(len(LEVEL_ORDER))
+            ], axis=1)
+            weights[touched] -= learning_rate * (gradient + l2 * weights[touched])
+            bias -= learning_rate * errors.sum(axis=0)
+
+    return RiskModel(
+        weights=weights.astype(np.float32),
+        bias=bias.astype(np.float32),
+        trained_on=len(texts),
+    )
+
+
+def load_training_records(path: str) -> list[tuple[str, RiskLevel]]:
+    """
+    Read labeled operations from an exported audit history.
+
+    Accepts JSONL with one record per line, or a JSON document that is a
+    list of records or a governor_get_history response ({"entries": [...]}).
+    Each record needs "operation" and a level in "label" (preferred, e.g.
+    a reviewer's correction) or "risk_level". Records without both are
+    skipped.
+
+    Returns:
+        List of (operation, RiskLevel)
+    """
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+    try:
+        document = json.loads(content)
+    except json.JSONDecodeError:
+        records: Iterable[Any] = (json.loads(line) for line in content.splitlines() if line.strip())
+    else:
+        if isinstance(document, dict):
+            document = document.get("entries", [document])
+        records = document if isinstance(document, list) else []
+
+    levels = {level.value: level for level in LEVEL_ORDER}
+    examples = []
+    for record in records:
+        if not isinstance(record, dict):
+            continue
+        operation = record.get("operation")
+        level = levels.get(str(record.get("label") or record.get("risk_level") or "").lower())
+        if isinstance(operation, str) and operation.strip() and level is not None:
+            examples.append((operation, level))
+    return examples
@@ -0,0 +1,150 @@
+"""Vectorized risk scoring for bulk assessment"""
+
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Sequence
+
+from ..classification import ActionType, ResourceType, ScopeType
+from ..classification.action_classifier import ACTION_MULTIPLIERS, SCOPE_MULTIPLIERS
+from ..classification.resource_classifier import RESOURCE_RISK_SCORES
+from ..state import RiskLevel
+
+try:  # Optional vectorized backend
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on environment
+    np = None
+
+HAS_NUMPY = np is not None
+
+# Integer encodings: code == index into these lists
+RESOURCE_ORDER = list(ResourceType)
+ACTION_ORDER = list(ActionType)
+SCOPE_ORDER = list(ScopeType)
+LEVEL_ORDER = [RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH]
+
+RESOURCE_CODES = {resource: code for code, resource in enumerate(RESOURCE_ORDER)}
+ACTION_CODES = {action: code for code, action in enumerate(ACTION_ORDER)}
+SCOPE_CODES = {scope: code for code, scope in enumerate(SCOPE_ORDER)}
+
+
+def _default_thresholds() -> tuple[float, float]:
+    from .risk_assessment import LOW_THRESHOLD, MEDIUM_THRESHOLD
+    return LOW_THRESHOLD, MEDIUM_THRESHOLD
+
+
+@dataclass(frozen=True)
+class ScoringWeights:
+    """Score tables and thresholds used to turn classifications into risk"""
+    resource_scores: dict[ResourceType, float] = field(
+        default_factory=lambda: dict(RESOURCE_RISK_SCORES)
+    )
+    action_multipliers: dict[ActionType, float] = field(
+        default_factory=lambda: dict(ACTION_MULTIPLIERS)
+    )
+    scope_multipliers: dict[ScopeType, float] = field(
+        default_factory=lambda: dict(SCOPE_MULTIPLIERS)
+    )
+    low_threshold: float = field(default_factory=lambda: _default_thresholds()[0])
+    medium_threshold: float = field(default_factory=lambda: _default_thresholds()[1])
+
+    def tables(self) -> tuple[list[float], list[float], list[float]]:
+        """Get the weight tables indexed by resource, action and scope code"""
+        return (
+            [self.resource_scores[r] for r in RESOURCE_ORDER],
+            [self.action_multipliers[a] for a in ACTION_ORDER],
+            [self.scope_multipliers[s] for s in SCOPE_ORDER],
+        )
+
+    def level_code(self, score: float) -> int:
+        """Get the LEVEL_ORDER index for a score"""
+        if score < self.low_threshold:
+            return 0
+        elif score <= self.medium_threshold:
+            return 1
+        return 2
+
+
+def encode(
+    resource_type: ResourceType,
+    action_type: ActionType,
+    scope_type: ScopeType,
+) -> tuple[int, int, int]:
+    """Encode a classification as integer codes"""
+    return RESOURCE_CODES[resource_type], ACTION_CODES[action_type], SCOPE_CODES[scope_type]
+
+
+def score_codes(
+    resource_codes: Sequence[int],
+    action_codes: Sequence[int],
+    scope_codes: Sequence[int],
+    weights: ScoringWeights | None = None,
+    use_numpy: bool | None = None,
+) -> tuple[Any, Any]:
+    """
+    Score encoded classifications in bulk.
+
+    Risk Score = Resource Base Score × Action Multiplier × Scope Multiplier,
+    evaluated in that order so results are bit-identical to RiskAssessor.
+
+    Args:
+        resource_codes: RESOURCE_ORDER indices
+        action_codes: ACTION_ORDER indices
+        scope_codes: SCOPE_ORDER indices
+        weights: Score tables and thresholds (defaults to the current ones)
+        use_numpy: Force (True) or disable (False) the NumPy path;
+            defaults to NumPy when it is installed
+
+    Returns:
+        Tuple of (scores, level_codes) as NumPy arrays on the NumPy path,
+        otherwise as lists; level codes index LEVEL_ORDER
+    """
+    weights = weights or ScoringWeights()
+    resource_table, action_table, scope_table = weights.tables()
+
+    if use_numpy is None:
+        use_numpy = HAS_NUMPY
+    if use_numpy:
+        if not HAS_NUMPY:
+            raise RuntimeError("NumPy is not installed; install the 'numpy' extra")
+        scores = (
+            np.asarray(resource_table, dtype=np.float64)[np.asarray(resource_codes, dtype=np.intp)]
+            * np.asarray(action_table, dtype=np.float64)[np.asarray(action_codes, dtype=np.intp)]
+            * np.asarray(scope_table, dtype=np.float64)[np.asarray(scope_codes, dtype=np.intp)]
+        )
+        # score < low → 0, low <= score <= medium → 1, score > medium → 2
+        bins = np.array([weights.low_threshold, np.nextafter(weights.medium_threshold, np.inf)])
+        return scores, np.digitize(scores, bins)
+
+    scores = [
+        resource_table[r] * action_table[a] * scope_table[s]
+        for r, a, s in zip(resource_codes, action_codes, scope_codes)
+    ]
+    return scores, [weights.level_code(score) for score in scores]
+
+
+def score_classifications(
+    classifications: Iterable[tuple[ResourceType, ActionType, ScopeType]],
+    weights: ScoringWeights | None = None,
+    use_numpy: bool | None = None,
+) -> list[tuple[float, RiskLevel]]:
+    """
+    Score (resource, action, scope) classifications in bulk.
+
+    Args:
+        classifications: Iterable of (ResourceType, ActionType, ScopeType)
+        weights: Score tables and thresholds (defaults to the current ones)
+        use_numpy: See score_codes
+
+    Returns:
+        List of (risk_score, RiskLevel) in input order
+    """
+    codes = [encode(*classification) for classification in classifications]
+    if not codes:
+        return []
+    resource_codes, action_codes, scope_codes = zip(*codes)
+    scores, level_codes = score_codes(
+        resource_codes, action_codes, scope_codes, weights, use_numpy
+    )
+    return [
+        (float(score), LEVEL_ORDER[int(level)])
+        for score, level in zip(scores, level_codes)
+    ]
@@ -2,8 +2,13 @@
 
 from fastmcp import FastMCP
 
+from .classification import configure_rule_pack_from_env
+from .core import get_engine
 from .tools import (
     governor_assess,
+    governor_assess_batch,
+    governor_assess_stream,
+    governor_assess_file,
     governor_approve,
     governor_log_action,
     governor_create_plan,
@@ -11,6 +16,7 @@ from .tools import (
     governor_check_status,
     governor_abort,
     governor_get_history,
+    governor_classification_stats,
 )
 
 # Create the MCP server
@@ -26,11 +32,17 @@ This server provides tools to assess and control AI agent operations based on ri
 
 Workflow:
 1. Call governor_assess before any operation to determine risk level
+   (use governor_assess_batch to assess many operations in one call,
+   governor_assess_stream to assess a long script while composing it, or
+   governor_assess_file before running a script file;
+   pass compact=True for just the verdict and fetch the full explanation
+   with governor_check_status when needed)
 2. For MEDIUM risk: Call governor_approve to record user confirmation
 3. For HIGH risk: Call governor_create_plan, then governor_approve, then governor_execute_step
 4. Use governor_check_status to monitor progress
 5. Use governor_abort if something goes wrong
 6. Use governor_get_history for audit trail
+7. Use governor_classification_stats to profile which classification rules fire
 
 Risk Classification:
 - Resources: memory(0) → local_file(1) → api(2) → sensitive_file(3) → database(4) → system(5)
@@ -47,7 +59,8 @@ Risk Classification:
 async def assess(
     operation: str,
     description: str = "",
-    context: str = "",
+    context: str | list[str] = "",
+    compact: bool = False,
 ) -> dict:
     """
     Assess the risk level of an operation before execution.
@@ -58,12 +71,96 @@ async def assess(
     Args:
         operation: The operation to assess (command, action description, etc.)
         description: Human-readable description of what the operation does
-        context: Additional context (file paths, URLs, targets, etc.)
+        context: Additional context (file paths, URLs, targets, etc.); pass a
+            list of paths/URLs/targets to have each one classified, with
+            duplicates and shared directories handled once
+        compact: Return only id, risk level, score and requires_* flags;
+            use check_status with the assessment_id for the explanation
 
     Returns:
         Assessment result with risk_level, risk_score, and recommendations
     """
-    return await governor_assess(operation, description, context)
+    return await governor_assess(operation, description, context, compact)
+
+
+@mcp.tool()
+async def assess_batch(
+    operations: list[dict],
+    compact: bool = False,
+) -> dict:
+    """
+    Assess the risk level of many operations in one call.
+
+    Use this when planning a sequence of operations instead of calling
+    assess once per operation. Results are returned in input order.
+
+    Args:
+        operations: List of {operation, description, context} definitions
+        compact: Return only the verdict of each operation
+
+    Returns:
+        Per-operation assessments with batch risk summary
+    """
+    return await governor_assess_batch(operations, compact)
+
+
+@mcp.tool()
+async def assess_stream(
+    chunk: str = "",
+    stream_id: str = "",
+    context: str = "",
+    description: str = "",
+    finalize: bool = False,
+    compact: bool = False,
+) -> dict:
+    """
+    Assess a long script or migration incrementally while composing it.
+
+    Open a stream by calling without stream_id, feed chunks with the
+    returned stream_id, and stop early when "terminate" is True (the
+    operation is already HIGH risk). Call with finalize=True to get a
+    normal assessment with an assessment_id.
+
+    Args:
+        chunk: Next piece of operation text
+        stream_id: ID of an open stream; omit to open a new one
+        context: Additional context (when opening)
+        description: Human-readable description (when opening)
+        finalize: Close the stream and store the assessment
+        compact: Return only the verdict when finalizing
+
+    Returns:
+        Running verdict, or the final assessment when finalize=True
+    """
+    return await governor_assess_stream(chunk, stream_id, context, description, finalize, compact)
+
+
+@mcp.tool()
+async def assess_file(
+    path: str,
+    context: str = "",
+    description: str = "",
+    mode: str = "auto",
+    compact: bool = False,
+) -> dict:
+    """
+    Assess a local script file before running it (bash deploy.sh, psql -f migrate.sql).
+
+    Each line (shell) or statement (SQL) is classified separately; the
+    verdict is that of the riskiest one, and the heatmap lists every
+    non-LOW line. Unchanged files are served from cache.
+
+    Args:
+        path: Path of the script file
+        context: Additional context applied to every line or statement
+        description: Human-readable description of what the script does
+        mode: "lines", "statements", or "auto" (statements for .sql files)
+        compact: Return only the verdict and the heatmap
+
+    Returns:
+        Assessment of the riskiest unit plus a per-line heatmap
+    """
+    return await governor_assess_file(path, context, description, mode, compact)
 
 
 @mcp.tool()
@@ -220,6 +317,7 @@ async def get_history(
     success_only: bool = False,
     failures_only: bool = False,
     include_stats: bool = False,
+    fingerprint: str = "",
 ) -> dict:
     """
     Retrieve the audit trail of governor actions.
@@ -234,16 +332,49 @@ async def get_history(
         success_only: Only show successful actions
         failures_only: Only show failed actions
         include_stats: Include audit statistics
+        fingerprint: Filter by assessment fingerprint
 
     Returns:
         Audit history with entries and optional stats
     """
     return await governor_get_history(
         limit, offset, risk_level, action, plan_id,
-        assessment_id, success_only, failures_only, include_stats
+        assessment_id, success_only, failures_only, include_stats, fingerprint
     )
 
 
+@mcp.tool()
+async def classification_stats(
+    enabled: bool | None = None,
+    reset: bool = False,
+    top: int = 25,
+    dump_name: str = "",
+) -> dict:
+    """
+    Inspect or control classification rule instrumentation.
+
+    Args:
+        enabled: True to start recording, False to stop; omit to leave unchanged
+        reset: Clear recorded data before returning
+        top: Maximum number of rules to include per section
+        dump_name: Also write the full data as JSON to a file of this name
+            in the operator's stats directory (GOVERNOR_STATS_DIR)
+
+    Returns:
+        Per-rule hit counts, per-family timings and deciding rules
+    """
+    return await governor_classification_stats(enabled, reset, top, dump_name)
+
+
 def create_server() -> FastMCP:
     """Create and return the MCP server instance"""
+    # Load the rule pack named by GOVERNOR_RULES_PATH, if any
+    configure_rule_pack_from_env()
+    # Load the secondary model named by GOVERNOR_MODEL_PATH, if any
+    get_engine().configure_model_from_env()
+    # Size cutoffs and workers for moving heavy calls off the event loop;
+    # started after the rules and model, which worker processes load too
+    get_engine().configure_offload_from_env().start()
+    # Compile rules and build shared components before the first tool call
+    get_engine().warmup()
     return mcp
@@ -6,6 +6,9 @@ from typing import Any
 
 from .models import AuditEntry, RiskLevel
 
+# Fingerprint groups listed in get_stats, largest first
+MAX_FINGERPRINT_GROUPS = 10
+
 
 class AuditLogger:
     """Manages audit log entries for action tracking"""
@@ -41,6 +44,33 @@ class AuditLogger:
         self._entries.append(entry)
         return entry
 
+    def log_batch(self, records: list[dict[str, Any]]) -> list[AuditEntry]:
+        """
+        Create and store several audit log entries in one append.
+
+        Each record holds the keyword arguments accepted by log().
+        """
+        entries = [
+            AuditEntry(
+                id=str(uuid.uuid4()),
+                action=record["action"],
+                operation=record["operation"],
+                risk_level=record["risk_level"],
+                details=record.get("details") or {},
+                assessment_id=record.get("assessment_id"),
+                plan_id=record.get("plan_id"),
+                step_id=record.get("step_id"),
+                success=record.get("success", True),
+                error=record.get("error"),
+            )
+            for record in records
+        ]
+        self._entries.extend(entries)
+        return entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
     def get_entries(
         self,
         limit: int | None = None,
@@ -53,6 +83,7 @@ class AuditLogger:
         plan_id: str | None = None,
         success_only: bool = False,
         failures_only: bool = False,
+        fingerprint: str | None = None,
     ) -> list[AuditEntry]:
         """Query audit entries with optional filters"""
         entries = self._entries.copy()
@@ -76,6 +107,9 @@ class AuditLogger:
         if plan_id is not None:
             entries = [e for e in entries if e.plan_id == plan_id]
 
+        if fingerprint is not None:
+            entries = [e for e in entries if e.details.get("fingerprint") == fingerprint]
+
         if success_only:
             entries = [e for e in entries if e.success]
 
@@ -110,10 +144,13 @@ class AuditLogger:
                 "by_risk_level": {},
                 "by_action": {},
                 "success_rate": None,
+                "distinct_fingerprints": 0,
+                "by_fingerprint": [],
             }
 
         by_risk = {}
         by_action = {}
+        by_fingerprint: dict[str, dict[str, Any]] = {}
         success_count = 0
 
         for entry in self._entries:
@@ -124,6 +161,19 @@ class AuditLogger:
             # Count by action
             by_action[entry.action] = by_action.get(entry.action, 0) + 1
 
+            # Group operations that differ only in literal values
+            fingerprint = entry.details.get("fingerprint")
+            if fingerprint:
+                group = by_fingerprint.get(fingerprint)
+                if group is None:
+                    group = by_fingerprint[fingerprint] = {
+                        "fingerprint": fingerprint,
+                        "count": 0,
+                        "example": entry.operation[:200],
+                        "risk_level": level,
+                    }
+                group["count"] += 1
+
             # Count successes
             if entry.success:
                 success_count += 1
@@ -133,6 +183,8 @@ class AuditLogger:
             "by_risk_level": by_risk,
             "by_action": by_action,
             "success_rate": success_count / total,
+            "distinct_fingerprints": len(by_fingerprint),
+            "by_fingerprint": sorted(by_fingerprint.values(), key=lambda g: -g["count"])[:MAX_FINGERPRINT_GROUPS],
         }
 
     def clear(self):
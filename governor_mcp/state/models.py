@@ -48,6 +48,9 @@ class Assessment:
     factors: dict[str, Any] = field(default_factory=dict)
     recommendations: list[str] = field(default_factory=list)
     timestamp: datetime = field(default_factory=datetime.now)
+    # Literal-stripping fingerprint of operation and context (hex), shared
+    # by operations that differ only in ids, numbers or quoted values
+    fingerprint: str = ""
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -62,6 +65,7 @@ class Assessment:
             "factors": self.factors,
             "recommendations": self.recommendations,
             "timestamp": self.timestamp.isoformat(),
+            "fingerprint": self.fingerprint,
         }
 
 
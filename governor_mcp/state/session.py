@@ -13,6 +13,8 @@ class SessionManager:
         self._assessments: dict[str, Assessment] = {}
         self._plans: dict[str, Plan] = {}
         self._approvals: dict[str, Approval] = {}
+        # Assessment IDs per fingerprint, oldest first
+        self._by_fingerprint: dict[str, list[str]] = {}
         self._session_id = str(uuid.uuid4())
 
     @property
@@ -22,8 +24,17 @@ class SessionManager:
     # Assessment management
     def store_assessment(self, assessment: Assessment) -> str:
         self._assessments[assessment.id] = assessment
+        if assessment.fingerprint:
+            self._by_fingerprint.setdefault(assessment.fingerprint, []).append(assessment.id)
         return assessment.id
 
+    def store_assessments(self, assessments: list[Assessment]) -> list[str]:
+        self._assessments.update((a.id, a) for a in assessments)
+        for a in assessments:
+            if a.fingerprint:
+                self._by_fingerprint.setdefault(a.fingerprint, []).append(a.id)
+        return [a.id for a in assessments]
+
     def get_assessment(self, assessment_id: str) -> Assessment | None:
         return self._assessments.get(assessment_id)
 
@@ -101,12 +112,29 @@ class SessionManager:
         latest = max(approvals, key=lambda a: a.timestamp)
         return latest.approved
 
+    def find_approved_assessment(self, fingerprint: str, exclude_id: str | None = None) -> Assessment | None:
+        """
+        Find the most recent approved assessment with the same fingerprint.
+
+        Args:
+            fingerprint: Assessment fingerprint to match
+            exclude_id: Assessment to skip (usually the one being checked)
+
+        Returns:
+            The approved assessment, or None
+        """
+        for assessment_id in reversed(self._by_fingerprint.get(fingerprint, [])):
+            if assessment_id != exclude_id and self.is_approved("assessment", assessment_id):
+                return self._assessments[assessment_id]
+        return None
+
     # Session utilities
     def clear_session(self):
         """Clear all session data"""
         self._assessments.clear()
         self._plans.clear()
         self._approvals.clear()
+        self._by_fingerprint.clear()
         self._session_id = str(uuid.uuid4())
 
     def get_session_summary(self) -> dict:
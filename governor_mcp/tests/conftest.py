@@ -0,0 +1,39 @@
+"""Shared fixtures for Governor MCP tests"""
+
+import json
+
+import pytest
+
+from governor_mcp.benchmarks.corpus import generate_corpus
+from governor_mcp.classification import configure_rule_pack
+
+# Corpus cases checked against per-rule reference implementations, which
+# are quadratic on long inputs
+CORPUS_SIZE = 1000
+MAX_REFERENCE_CHARS = 1024
+
+
+@pytest.fixture
+def rule_pack(tmp_path):
+    """Write and activate a JSON rule pack; built-in rules are restored afterwards"""
+    path = tmp_path / "rules.json"
+
+    def activate(pack: dict, check_interval: float = 0.0):
+        path.write_text(json.dumps(pack))
+        return configure_rule_pack(str(path), check_interval=check_interval)
+
+    activate.path = path
+    yield activate
+    configure_rule_pack(None)
+
+
+@pytest.fixture(scope="session")
+def corpus_texts():
+    """Distinct operations and contexts of the benchmark corpus, short inputs only"""
+    texts = {
+        text
+        for case in generate_corpus(CORPUS_SIZE)
+        for text in (case.operation, case.context)
+        if text and len(text) <= MAX_REFERENCE_CHARS
+    }
+    return sorted(texts)
@@ -0,0 +1,54 @@
+"""Tests for assessments of operations fed in chunks"""
+
+import pytest
+
+from governor_mcp.core.assessment_stream import AssessmentStream
+from governor_mcp.core.risk_assessment import RiskAssessor
+from governor_mcp.state import RiskLevel
+
+
+def _chunks(text: str, size: int) -> list[str]:
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("operation, context", [
+    # Read-only SQL override
+    ("psql -c \"SELECT id, name FROM users WHERE id = 7\"", ""),
+    # Per-statement scoring of a multi-statement script
+    ("SELECT id FROM users; DELETE FROM sessions; UPDATE orders SET status = 'x'", "postgres://db/app"),
+    ("rm -rf /tmp/build && git status", ""),
+    ("curl https://api.github.com/repos/org/repo/issues", "auth token in header"),
+    ("Summarize the README before the release", "README.md"),
+])
+@pytest.mark.parametrize("size", [1, 7, 4096])
+def test_short_stream_matches_assess(operation, context, size):
+    assessor = RiskAssessor()
+    stream = AssessmentStream(assessor, context)
+    for chunk in _chunks(operation, size):
+        stream.feed(chunk)
+
+    streamed = stream.finalize()
+    assessed = assessor.assess(operation, context=context)
+    assert (streamed.resource_type, streamed.action_type, streamed.scope) == (
+        assessed.resource_type, assessed.action_type, assessed.scope,
+    )
+    assert streamed.risk_score == assessed.risk_score
+    assert streamed.risk_level == assessed.risk_level
+
+
+def test_short_stream_honours_configured_hosts(rule_pack):
+    rule_pack({"hosts": {"internal.example.com": "local_file"}})
+    assessor = RiskAssessor()
+    operation = "curl https://internal.example.com/health"
+    stream = AssessmentStream(assessor)
+    for chunk in _chunks(operation, 5):
+        stream.feed(chunk)
+    assert stream.finalize().resource_type == assessor.assess(operation).resource_type == "local_file"
+
+
+def test_truncated_stream_is_never_low():
+    stream = AssessmentStream(RiskAssessor())
+    stream._classifier.max_scan_chars = 64
+    stream.feed("echo hello " * 20)
+    assert stream.verdict()["truncated"]
+    assert stream.finalize().risk_level != RiskLevel.LOW
@@ -0,0 +1,54 @@
+"""Verdicts of the rewritten classifiers against the original implementation"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from governor_mcp.benchmarks.corpus import generate_corpus
+from governor_mcp.classification import ActionClassifier, ResourceClassifier
+from governor_mcp.core.risk_assessment import RiskAssessor
+from governor_mcp.core.scoring import LEVEL_ORDER
+from governor_mcp.state import RiskLevel
+
+# Verdicts of the original per-rule classifiers on the benchmark corpus:
+# [index, category, resource, action, scope, risk score, risk level]
+BASELINE = json.loads((Path(__file__).parent / "data" / "baseline_verdicts.json").read_text())
+
+
+def _verdicts(category: str) -> list[tuple]:
+    cases = generate_corpus(BASELINE["size"], BASELINE["seed"])
+    resource_classifier, action_classifier, assessor = ResourceClassifier(), ActionClassifier(), RiskAssessor()
+    verdicts = []
+    for index, case_category, *expected in BASELINE["verdicts"]:
+        if case_category != category:
+            continue
+        case = cases[index]
+        assessment = assessor.assess(case.operation, context=case.context)
+        actual = [
+            resource_classifier.classify(case.operation, case.context)[0].value,
+            action_classifier.classify_action(case.operation)[0].value,
+            action_classifier.classify_scope(case.operation, case.context)[0].value,
+            assessment.risk_score,
+            assessment.risk_level.value,
+        ]
+        verdicts.append((case.operation, expected, actual))
+    return verdicts
+
+
+@pytest.mark.parametrize("category", ["shell", "pipeline", "http", "prose"])
+def test_verdicts_match_baseline(category):
+    verdicts = _verdicts(category)
+    assert verdicts
+    for operation, expected, actual in verdicts:
+        assert actual == expected, operation
+
+
+def test_sql_verdicts_never_lower_than_baseline():
+    # Scripts are now also scored statement by statement, and shell commands
+    # around a query keep their own verdict; both may only raise it
+    verdicts = _verdicts("sql")
+    assert verdicts
+    for operation, expected, actual in verdicts:
+        assert actual[3] >= expected[3], operation
+        assert LEVEL_ORDER.index(RiskLevel(actual[4])) >= LEVEL_ORDER.index(RiskLevel(expected[4])), operation
@@ -0,0 +1,25 @@
+"""Tests for memory-mapped file assessment"""
+
+from governor_mcp.classification.streaming import DEFAULT_MAX_SCAN_CHARS
+from governor_mcp.core.file_assessment import FileAssessor
+from governor_mcp.core.risk_assessment import RiskAssessor
+from governor_mcp.state import RiskLevel
+
+
+def test_truncated_unit_is_never_low(tmp_path):
+    # A benign line too long to scan in full, after a short one
+    long_line = "echo hi " * (DEFAULT_MAX_SCAN_CHARS // 8 + 1024)
+    path = tmp_path / "build.sh"
+    path.write_text(f"ls -la\n{long_line}\nls -la\n")
+
+    assessor = RiskAssessor()
+    scan = FileAssessor(assessor).scan(str(path))
+
+    assert scan.by_risk_level[RiskLevel.LOW.value] == 2
+    assert scan.by_risk_level[RiskLevel.MEDIUM.value] == 1
+    assert [entry["line"] for entry in scan.heatmap] == [2]
+    assert scan.heatmap[0]["risk_level"] == RiskLevel.MEDIUM.value
+    assert scan.max_line == 2
+    assert scan.classification.scan["truncated"]
+    assessment = assessor.build_assessment(str(path), "", scan.classification)
+    assert assessment.risk_level == RiskLevel.MEDIUM
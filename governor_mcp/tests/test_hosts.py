@@ -0,0 +1,55 @@
+"""Tests for URL host classification through the host-suffix trie"""
+
+import pytest
+
+from governor_mcp.classification import IncrementalClassifier, ResourceClassifier, ResourceType
+from governor_mcp.classification.streaming import STREAMING_THRESHOLD
+from governor_mcp.core.risk_assessment import RiskAssessor
+
+HOSTS = {
+    "hosts": {
+        "internal.example.com": "local_file",
+        "deploy.example.com": "system_command",
+    }
+}
+
+# Shell filler without URLs, long enough to push an operation into streaming
+FILLER = "echo building\n" * (STREAMING_THRESHOLD // 14 + 1)
+
+
+@pytest.mark.parametrize("operation, expected", [
+    ("curl https://internal.example.com/health", ResourceType.LOCAL_FILE),
+    ("curl https://v2.internal.example.com/health", ResourceType.LOCAL_FILE),
+    ("curl https://deploy.example.com/hook", ResourceType.SYSTEM_COMMAND),
+    ("curl https://api.github.com/repos", ResourceType.EXTERNAL_API),
+    # An unknown host next to a known one still counts as an external call
+    ("curl https://internal.example.com/a https://api.github.com/b", ResourceType.EXTERNAL_API),
+    # Hosts and the riskier pattern families: the higher verdict wins
+    ("upload .env to https://deploy.example.com/hook", ResourceType.SYSTEM_COMMAND),
+    ("scp ~/.ssh/id_rsa https://internal.example.com/keys", ResourceType.SENSITIVE_FILE),
+])
+def test_host_verdict(rule_pack, operation, expected):
+    rule_pack(HOSTS)
+    assert ResourceClassifier().classify(operation)[0] == expected
+
+
+@pytest.mark.parametrize("url", [
+    "https://internal.example.com/health",
+    "https://deploy.example.com/hook",
+    "https://api.github.com/repos",
+])
+def test_streamed_inputs_use_hosts(rule_pack, url):
+    rule_pack(HOSTS)
+    assessor = RiskAssessor()
+    short = assessor.assess(f"curl {url}", "", "")
+    long = assessor.assess(FILLER + f"curl {url}", "", "")
+    assert "scan" in long.factors
+    assert long.resource_type == short.resource_type
+
+
+def test_incremental_classifier_uses_hosts(rule_pack):
+    rule_pack(HOSTS)
+    classifier = IncrementalClassifier()
+    classifier.feed("echo start\ncurl https://deploy.")
+    result = classifier.feed("example.com/hook\n")
+    assert result.resource_type == ResourceType.SYSTEM_COMMAND
@@ -0,0 +1,38 @@
+"""Tests for the multi-family keyword automaton"""
+
+import pytest
+
+from governor_mcp.classification.keywords import KeywordAutomaton
+from governor_mcp.classification.rules import _default_keywords
+
+
+def _reference(families: dict[str, list[str]], text: str) -> dict[str, set[str]]:
+    text = text.lower()
+    hits = {
+        family: {keyword.lower() for keyword in keywords if keyword and keyword.lower() in text}
+        for family, keywords in families.items()
+    }
+    return {family: keywords for family, keywords in hits.items() if keywords}
+
+
+def test_scan_equals_substring_checks(corpus_texts):
+    families = _default_keywords()
+    automaton = KeywordAutomaton(families)
+    for text in corpus_texts:
+        for variant in (text, text.upper()):
+            assert automaton.scan(variant) == _reference(families, variant), variant
+
+
+@pytest.mark.parametrize("text", [
+    "ushers", "she sells his hers", "hishe", "", "HERS", "h", "sherlock",
+])
+def test_overlapping_keywords(text):
+    # Keywords that are prefixes, suffixes and infixes of each other
+    families = {"a": ["he", "she", "his"], "b": ["hers", "he"], "c": ["s"]}
+    assert KeywordAutomaton(families).scan(text) == _reference(families, text)
+
+
+def test_empty_families():
+    automaton = KeywordAutomaton({"a": [], "b": [""]})
+    assert automaton.scan("anything") == {}
+    assert len(automaton) == 0
@@ -0,0 +1,67 @@
+"""Tests for literal lookups of path-shaped rules"""
+
+import re
+
+import pytest
+
+from governor_mcp.classification import ResourceClassifier, ResourceType
+from governor_mcp.classification.paths import PathRuleIndex
+from governor_mcp.classification.patterns import PatternSet
+from governor_mcp.classification.rules import PATTERN_FAMILIES
+
+TEXTS = [
+    "cat certs/server.pem", "cat certs/server.pem\n", "cat certs/server.pem\n\n", "server.pem.bak",
+    "CAT ~/.SSH/ID_RSA", "ls ~/.ssh/id_rsa.pub", "db/app.sqlite", "db/app.sqlite3", "db/app.sqlite33",
+    "open café.pem", "open CAFÉ.PEM", "scp .netrc host:", "echo hello", "",
+]
+
+
+@pytest.mark.parametrize("source, flags, indexed", [
+    (r".*\.pem$", re.IGNORECASE, True),
+    (r"\.sqlite3?$", re.IGNORECASE, True),
+    (r"id_rsa.*", re.IGNORECASE, True),
+    (r"\.netrc", re.IGNORECASE, True),
+    # Case-sensitive, multiline or non-literal rules stay with the regex engine
+    (r".*\.pem$", 0, False),
+    (r"\.pem$", re.IGNORECASE | re.MULTILINE, False),
+    (r"secret[0-9]", re.IGNORECASE, False),
+    (r"^id_rsa", re.IGNORECASE, False),
+    (r"id_rsa?", re.IGNORECASE, False),
+    # An optional-only suffix would match every input
+    (r"a?$", re.IGNORECASE, False),
+])
+def test_indexed_rules_agree_with_regex(source, flags, indexed):
+    pattern = re.compile(source, flags)
+    index = PathRuleIndex.build([pattern])
+    assert bool(index) == indexed
+    for text in TEXTS:
+        if indexed and text.isascii():
+            assert index.matches(text.lower()) == bool(pattern.search(text)), text
+        assert PatternSet("test", [pattern]).matches(text) == bool(pattern.search(text)), text
+
+
+@pytest.mark.parametrize("family", sorted(PATTERN_FAMILIES))
+def test_builtin_families_agree_with_regex(family):
+    patterns = PATTERN_FAMILIES[family]
+    pattern_set = PatternSet(family, patterns)
+    for text in TEXTS:
+        assert pattern_set.matches(text) == any(pattern.search(text) for pattern in patterns), text
+
+
+def test_custom_suffix_rules(rule_pack):
+    rules = rule_pack({"patterns": {"sensitive_file": [
+        r".*\.kdbx$", r"vault_token.*", {"pattern": r"\.Secret$", "ignore_case": False},
+    ]}})
+    custom = rules.sensitive_file
+    # Pack rules follow the built-in ones; the case-sensitive rule is not indexed
+    builtin = len(PATTERN_FAMILIES["sensitive_file"])
+    assert {builtin, builtin + 1} <= custom.path_index.indexed
+    assert builtin + 2 not in custom.path_index.indexed
+    for text in [*TEXTS, "open passwords.KDBX", "cat ~/VAULT_TOKEN", "open app.Secret", "open app.secret"]:
+        assert custom.matches(text) == any(pattern.search(text) for pattern in custom.patterns), text
+
+    classifier = ResourceClassifier()
+    assert classifier.classify("open passwords.KDBX")[0] == ResourceType.SENSITIVE_FILE
+    assert classifier.classify("cat ~/VAULT_TOKEN")[0] == ResourceType.SENSITIVE_FILE
+    assert classifier.classify("open app.Secret")[0] == ResourceType.SENSITIVE_FILE
+    assert classifier.classify("open app.secret")[0] != ResourceType.SENSITIVE_FILE
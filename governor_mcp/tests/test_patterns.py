@@ -0,0 +1,49 @@
+"""Tests for single-scan pattern families"""
+
+import re
+
+import pytest
+
+from governor_mcp.classification.patterns import PatternSet
+from governor_mcp.classification.rules import PATTERN_FAMILIES
+
+
+def _reference(patterns: list[re.Pattern], text: str) -> bool:
+    return any(pattern.search(text) for pattern in patterns)
+
+
+@pytest.mark.parametrize("family", sorted(PATTERN_FAMILIES))
+def test_matches_equals_per_rule_search(corpus_texts, family):
+    patterns = PATTERN_FAMILIES[family]
+    pattern_set = PatternSet(family, patterns)
+    for text in corpus_texts:
+        for variant in (text, text.upper()):
+            assert pattern_set.matches(variant) == _reference(patterns, variant), variant
+
+
+@pytest.mark.parametrize("family", sorted(PATTERN_FAMILIES))
+def test_first_match_is_a_matching_rule(corpus_texts, family):
+    pattern_set = PatternSet(family, PATTERN_FAMILIES[family])
+    for text in corpus_texts:
+        index = pattern_set.first_match(text)
+        if index is None:
+            assert not pattern_set.matches(text)
+        else:
+            assert pattern_set.patterns[index].search(text), text
+
+
+@pytest.mark.parametrize("patterns, text, expected", [
+    # Flags stay scoped to their own rule
+    ([re.compile("secret", re.IGNORECASE), re.compile("^token$")], "A SECRET", True),
+    ([re.compile("secret"), re.compile("^token$", re.MULTILINE)], "x\ntoken\ny", True),
+    ([re.compile("secret"), re.compile("^token$", re.MULTILINE)], "A SECRET", False),
+    # Stripped wildcards; an escaped trailing backslash is kept
+    ([re.compile(r".*\.pem$")], "certs/server.pem", True),
+    ([re.compile(r".*dump\\.*")], "dump\\ file", True),
+    ([re.compile(r".*dump\\.*")], "dump file", False),
+    ([re.compile(r"id_rsa\.*")], "id_rsa", True),
+    ([], "anything", False),
+])
+def test_matches_edge_cases(patterns, text, expected):
+    pattern_set = PatternSet("test", patterns)
+    assert pattern_set.matches(text) == _reference(patterns, text) == expected
@@ -0,0 +1,47 @@
+"""Tests for the secondary risk model"""
+
+import threading
+
+import pytest
+
+from governor_mcp.core.risk_assessment import RiskAssessor
+from governor_mcp.core.scoring import LEVEL_ORDER
+
+
+@pytest.mark.parametrize("bias_shape", [(2,), (4,), (3, 1), ()])
+def test_load_rejects_bias_shape(tmp_path, bias_shape):
+    np = pytest.importorskip("numpy")
+    from governor_mcp.core.risk_model import RiskModel
+
+    path = str(tmp_path / "model.npz")
+    RiskModel(
+        weights=np.zeros((16, len(LEVEL_ORDER)), dtype=np.float32),
+        bias=np.zeros(bias_shape, dtype=np.float32),
+        trained_on=1,
+    ).save(path)
+    with pytest.raises(ValueError, match="bias shape"):
+        RiskModel.load(path)
+
+
+def test_model_stats_are_counted_across_threads():
+    np = pytest.importorskip("numpy")
+    from governor_mcp.core.risk_model import RiskModel
+
+    assessor = RiskAssessor()
+    assessor.set_model(RiskModel(
+        weights=np.zeros((16, len(LEVEL_ORDER)), dtype=np.float32),
+        bias=np.zeros(len(LEVEL_ORDER), dtype=np.float32),
+        trained_on=1,
+    ))
+    operations = ["Summarize the README before the release"] * 10
+
+    def predict():
+        for _ in range(50):
+            assessor.predict_levels(operations)
+
+    threads = [threading.Thread(target=predict) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert assessor.get_model_stats()["predictions"] == 8 * 50 * 10
@@ -0,0 +1,114 @@
+"""Tests for hot-reloadable rule packs"""
+
+import json
+import os
+
+import pytest
+
+from governor_mcp.classification import ActionType, ResourceType
+from governor_mcp.classification.rules import (
+    configure_rule_pack,
+    get_rule_pack_loader,
+    get_rule_set,
+    tomllib,
+)
+from governor_mcp.core.risk_assessment import RiskAssessor
+
+KDBX = {"patterns": {"sensitive_file": [r"\.kdbx$"]}}
+
+
+def _rewrite(path, pack) -> None:
+    """Replace a pack file and make sure its modification time changes"""
+    path.write_text(pack if isinstance(pack, str) else json.dumps(pack))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_pack_rules_take_effect(rule_pack):
+    assessor = RiskAssessor()
+    assert assessor.assess("open vault.kdbx").resource_type != ResourceType.SENSITIVE_FILE.value
+    rules = rule_pack(KDBX)
+    assert get_rule_set() is rules
+    assert assessor.assess("open vault.kdbx").resource_type == ResourceType.SENSITIVE_FILE.value
+    configure_rule_pack(None)
+    assert get_rule_set().source == "builtin"
+    assert assessor.assess("open vault.kdbx").resource_type != ResourceType.SENSITIVE_FILE.value
+
+
+def test_changed_pack_is_reloaded(rule_pack):
+    first = rule_pack(KDBX)
+    assessor = RiskAssessor()
+    _rewrite(rule_pack.path, {"patterns": {"sensitive_file": [r"\.vault$"]}})
+
+    second = get_rule_set()
+    assert second is not first and second.version > first.version
+    assert get_rule_pack_loader().reloads == 2
+    assert assessor.assess("open team.vault").resource_type == ResourceType.SENSITIVE_FILE.value
+    assert assessor.assess("open vault.kdbx").resource_type != ResourceType.SENSITIVE_FILE.value
+    # A rule set already pinned by a caller is never changed by a reload
+    assert first.sensitive_file.matches("open vault.kdbx")
+
+
+def test_unchanged_pack_is_not_reloaded(rule_pack):
+    rules = rule_pack(KDBX)
+    assert get_rule_set() is rules
+    assert get_rule_pack_loader().reloads == 1
+    assert get_rule_pack_loader().reload()
+    assert get_rule_set().version > rules.version
+
+
+@pytest.mark.parametrize("broken", [
+    "{not json",
+    json.dumps({"patterns": {"sensitive_file": ["("]}}),
+    json.dumps({"patterns": {"no_such_family": ["x"]}}),
+    json.dumps({"mode": "merge"}),
+])
+def test_broken_pack_keeps_previous_rules(rule_pack, broken):
+    rules = rule_pack(KDBX)
+    _rewrite(rule_pack.path, broken)
+
+    assert get_rule_set() is rules
+    loader = get_rule_pack_loader()
+    assert loader.failures == 1
+    assert loader.last_error
+    # Not retried until the file changes again
+    assert get_rule_set() is rules
+    assert loader.failures == 1
+
+    _rewrite(rule_pack.path, KDBX)
+    assert get_rule_set() is not rules
+    assert loader.last_error is None
+
+
+def test_missing_pack_keeps_previous_rules(rule_pack):
+    rules = rule_pack(KDBX)
+    rule_pack.path.unlink()
+    assert get_rule_set() is rules
+    assert get_rule_pack_loader().failures == 1
+
+
+def test_invalid_initial_pack_raises(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps({"keywords": {"read": [""]}}))
+    with pytest.raises(ValueError):
+        configure_rule_pack(str(path))
+    assert get_rule_pack_loader() is None
+
+
+def test_keyword_modes(rule_pack):
+    rules = rule_pack({"keywords": {"delete": ["obliterate"]}})
+    assert {"obliterate", "rm"} <= rules.automaton.families[ActionType.DELETE]
+    rules = rule_pack({"mode": "replace", "keywords": {"delete": ["obliterate"]}})
+    assert rules.automaton.families[ActionType.DELETE] == {"obliterate"}
+    assert RiskAssessor().assess("obliterate build").action_type == ActionType.DELETE.value
+
+
+@pytest.mark.skipif(tomllib is None, reason="tomllib requires Python 3.11")
+def test_toml_pack(tmp_path):
+    path = tmp_path / "rules.toml"
+    path.write_text('[patterns]\nsensitive_file = ["\\\\.kdbx$"]\n')
+    try:
+        configure_rule_pack(str(path), check_interval=0.0)
+        assert get_rule_set().sensitive_file.matches("open vault.kdbx")
+    finally:
+        configure_rule_pack(None)
@@ -0,0 +1,72 @@
+"""Tests for the SQL statement scanner and read-only SQL detection"""
+
+import pytest
+
+from governor_mcp.classification import ActionClassifier, ActionType
+from governor_mcp.classification.sql import scan_sql
+from governor_mcp.core.risk_assessment import RiskAssessor
+from governor_mcp.state import RiskLevel
+
+
+@pytest.mark.parametrize("text, shapes", [
+    ("SELECT * FROM users", {"select"}),
+    ("select id, name from users where id = 1", {"select"}),
+    ("SELECT count(*) FROM t", {"select"}),
+    ("SELECT 'x' FROM dual", {"select"}),
+    ("DELETE FROM users", {"delete"}),
+    ("UPDATE users SET active = false", {"write"}),
+    ("INSERT INTO users VALUES (1)", {"write"}),
+    ("DROP TABLE users", {"ddl"}),
+    ("TRUNCATE TABLE users", {"ddl"}),
+    ("SELECT id FROM t; DELETE FROM t", {"select", "delete"}),
+])
+def test_shapes(text, shapes):
+    assert scan_sql(text).shapes == shapes
+
+
+@pytest.mark.parametrize("text", [
+    "select from x",
+    "SELECT\nFROM x",
+    "users sudo select from .env",
+])
+def test_select_needs_something_to_select(text):
+    assert "select" not in scan_sql(text).shapes
+
+
+def test_semicolon_inside_string_literal():
+    scan = scan_sql("INSERT INTO t VALUES ('a;b'); DELETE FROM t")
+    assert [statement.verb for statement in scan.statements] == ["insert", "delete"]
+    assert scan.missing_where
+
+
+@pytest.mark.parametrize("operation", [
+    "SELECT * FROM users",
+    'psql -c "SELECT id, email FROM users WHERE id = 7"',
+])
+def test_read_only_sql_is_a_read(operation):
+    assert ActionClassifier().classify_action(operation)[0] == ActionType.READ
+
+
+# Inputs whose SQL part looks read-only but whose shell part is destructive.
+# The first three are HIGH at the baseline commit as well; the last two were
+# read-only there and are now scored by their shell commands.
+@pytest.mark.parametrize("operation, level, score", [
+    ("sudo rm -rf / && psql -c 'select from x'", RiskLevel.HIGH, 15.0),
+    ("rm -rf build; select from t", RiskLevel.HIGH, 12.5),
+    ("users sudo select from .env", RiskLevel.HIGH, 15.0),
+    ("rm -rf build; select id from t", RiskLevel.HIGH, 12.5),
+    ("sudo rm -rf / && psql -c 'SELECT * FROM users'", RiskLevel.HIGH, 15.0),
+])
+def test_destructive_shell_around_select(operation, level, score):
+    assessment = RiskAssessor().assess(operation, "", "")
+    assert assessment.risk_level == level
+    assert assessment.risk_score == score
+    assert assessment.action_type != ActionType.READ.value
+
+
+@pytest.mark.parametrize("operation", [
+    "run query: SELECT id FROM users",
+    "delete old rows, then SELECT id FROM users",
+])
+def test_execute_or_delete_keyword_overrides_select(operation):
+    assert ActionClassifier().classify_action(operation)[0] != ActionType.READ
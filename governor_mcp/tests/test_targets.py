@@ -0,0 +1,76 @@
+"""Tests for list-valued contexts"""
+
+import random
+
+import pytest
+
+from governor_mcp.benchmarks import corpus
+from governor_mcp.classification import ActionClassifier, ResourceClassifier, ScopeType
+from governor_mcp.classification.action_classifier import SCOPE_MULTIPLIERS
+from governor_mcp.classification.resource_classifier import RESOURCE_RISK_SCORES
+from governor_mcp.classification.targets import TargetClassifier, dedupe_targets
+from governor_mcp.core.risk_assessment import RiskAssessor
+from governor_mcp.core.scoring import LEVEL_ORDER
+
+POOL = [
+    *corpus._FILES, *corpus._DIRS, *corpus._TABLES,
+    *(f"https://{host}/{path}" for host in corpus._HOSTS for path in corpus._PATHS[:2]),
+    "prod-db", "users table", "all servers", "git status", "SELECT id FROM users", "a\nb.pem",
+]
+
+
+def _samples(count: int = 300) -> list[list[str]]:
+    rnd = random.Random(0)
+    return [rnd.sample(POOL, rnd.randint(1, 8)) for _ in range(count)]
+
+
+def test_resource_is_riskiest_target():
+    resource_classifier, target_classifier = ResourceClassifier(), TargetClassifier()
+    for targets in _samples():
+        expected = max(
+            (resource_classifier.classify(target)[0] for target in targets),
+            key=RESOURCE_RISK_SCORES.__getitem__,
+        )
+        assert target_classifier.classify(targets).resource_type == expected, targets
+
+
+def test_scope_covers_all_targets():
+    action_classifier, target_classifier = ActionClassifier(), TargetClassifier()
+    for targets in _samples():
+        expected = action_classifier.classify_scope("", "\n".join(targets))[0]
+        if len(targets) > 1 and SCOPE_MULTIPLIERS[expected] < SCOPE_MULTIPLIERS[ScopeType.MULTIPLE]:
+            expected = ScopeType.MULTIPLE
+        assert target_classifier.classify(targets).scope_type == expected, targets
+
+
+def test_dedupe_targets():
+    assert dedupe_targets([" a.txt", "b.txt", "a.txt ", "", "  ", "b.txt"]) == (["a.txt", "b.txt"], 2)
+
+
+@pytest.mark.parametrize("operation", ["cat", "rm -rf", "deploy", "Summarize the files"])
+def test_targets_only_raise_the_verdict(operation):
+    assessor = RiskAssessor()
+    alone = assessor.assess(operation)
+    for targets in _samples(50):
+        assessment = assessor.assess(operation, context=targets)
+        assert assessment.risk_score >= alone.risk_score, targets
+        assert LEVEL_ORDER.index(assessment.risk_level) >= LEVEL_ORDER.index(alone.risk_level), targets
+        # Order and duplicates do not change the verdict
+        shuffled = assessor.assess(operation, context=[*reversed(targets), *targets])
+        assert (shuffled.risk_score, shuffled.resource_type, shuffled.scope) == (
+            assessment.risk_score, assessment.resource_type, assessment.scope,
+        )
+
+
+def test_target_summary():
+    classification = RiskAssessor().classify_targets("cat", ["~/.ssh/id_rsa", "README.md", "README.md"])
+    assert classification.targets["count"] == 2
+    assert classification.targets["duplicates"] == 1
+    assert classification.targets["max_target"] == "~/.ssh/id_rsa"
+    assert classification.resource_type.value == "sensitive_file"
+
+
+def test_separator_keywords_disable_splitting(rule_pack):
+    # A keyword spanning a path separator must still be found
+    rule_pack({"keywords": {"system": ["etc/nginx"]}})
+    assert TargetClassifier().classify(["/etc/nginx/nginx.conf"]).scope_type == ScopeType.SYSTEM
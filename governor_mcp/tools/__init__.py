@@ -1,6 +1,6 @@
 """MCP tools for Governor"""
 
-from .assess import governor_assess
+from .assess import governor_assess, governor_assess_batch, governor_assess_stream, governor_assess_file
 from .approve import governor_approve
 from .log import governor_log_action
 from .plan import governor_create_plan
@@ -8,9 +8,13 @@ from .execute import governor_execute_step
 from .status import governor_check_status
 from .abort import governor_abort
 from .history import governor_get_history
+from .stats import governor_classification_stats
 
 __all__ = [
     "governor_assess",
+    "governor_assess_batch",
+    "governor_assess_stream",
+    "governor_assess_file",
     "governor_approve",
     "governor_log_action",
     "governor_create_plan",
@@ -18,4 +22,5 @@ __all__ = [
     "governor_check_status",
     "governor_abort",
     "governor_get_history",
+    "governor_classification_stats",
 ]
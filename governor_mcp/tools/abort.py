@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from ..core import PlanController
+from ..core import get_engine
 from ..state import RiskLevel
 from ..state.session import get_session
 from ..state.audit import get_audit_logger
@@ -38,7 +38,7 @@ async def governor_abort(
     """
     session = get_session()
     audit = get_audit_logger()
-    plan_controller = PlanController()
+    plan_controller = get_engine().plan_controller
 
     # Get the plan first for logging
     plan = session.get_plan(plan_id)
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from ..core import PlanController
+from ..core import get_engine
 from ..state import RiskLevel
 from ..state.session import get_session
 from ..state.audit import get_audit_logger
@@ -35,7 +35,7 @@ async def governor_approve(
     """
     session = get_session()
     audit = get_audit_logger()
-    plan_controller = PlanController()
+    plan_controller = get_engine().plan_controller
 
     if target_type not in ("assessment", "plan", "step"):
         return {
@@ -2,16 +2,25 @@
 
 from typing import Any
 
-from ..core import RiskAssessor
-from ..state import RiskLevel
+from ..core import assess_operation, assess_operations, get_engine, text_size
+from ..state import Assessment, RiskLevel
 from ..state.session import get_session
 from ..state.audit import get_audit_logger
 
+# Maximum number of operations accepted by governor_assess_batch
+MAX_BATCH_SIZE = 500
+
+# Maximum number of targets in a list-valued context
+MAX_CONTEXT_TARGETS = 10000
+
+_RISK_ORDER = [RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH]
+
 
 async def governor_assess(
     operation: str,
     description: str = "",
-    context: str = "",
+    context: str | list[str] = "",
+    compact: bool = False,
 ) -> dict[str, Any]:
     """
     Assess the risk level of an operation before execution.
@@ -25,21 +34,36 @@ async def governor_assess(
     Args:
         operation: The operation to assess (command, action description, etc.)
         description: Human-readable description of what the operation does
-        context: Additional context (file paths, URLs, targets, etc.)
+        context: Additional context (file paths, URLs, targets, etc.), as
+            free text or as a list of targets; a list is deduplicated and
+            each target classified separately, with the highest-risk one
+            reported in factors["targets"]
+        compact: Return only the verdict (assessment_id, risk_level,
+            risk_score, requires_approval, requires_plan); fetch the full
+            explanation later with governor_check_status
 
     Returns:
         Assessment result including:
         - risk_level: "low", "medium", or "high"
         - risk_score: Numeric score
-        - recommendations: List of suggested actions
+        - recommendations: List of suggested actions (omitted when compact)
         - assessment_id: ID for tracking
+        - prior_approval: Earlier approved assessment of the same operation
+          up to ids and values, if any (omitted when compact)
     """
-    assessor = RiskAssessor()
+    error = _check_context(context)
+    if error:
+        return {"error": error}
+
+    engine = get_engine()
     session = get_session()
     audit = get_audit_logger()
 
-    # Perform assessment
-    assessment = assessor.assess(operation, description, context)
+    # Perform assessment, off the event loop for large inputs
+    assessment = await engine.offloader.run(
+        "assess", text_size(operation, description, context),
+        assess_operation, operation, description, context,
+    )
 
     # Store in session
     session.store_assessment(assessment)
@@ -53,38 +77,340 @@ async def governor_assess(
             "description": description,
             "context": context,
             "risk_score": assessment.risk_score,
+            "fingerprint": assessment.fingerprint,
         },
         assessment_id=assessment.id,
     )
 
-    # Build response based on risk level
-    response = {
+    response = _build_response(assessment, compact)
+    if not compact:
+        _add_prior_approval(response, assessment)
+    engine.record_response("assess", response, compact)
+    return response
+
+
+def _check_context(context: Any) -> str | None:
+    """Get an error message for an invalid context, or None"""
+    if isinstance(context, str):
+        return None
+    if not isinstance(context, list) or not all(isinstance(target, str) for target in context):
+        return "context must be a string or a list of strings"
+    if len(context) > MAX_CONTEXT_TARGETS:
+        return f"Too many context targets: {len(context)} (maximum {MAX_CONTEXT_TARGETS})"
+    return None
+
+
+def _requirements(risk_level: RiskLevel) -> tuple[bool, bool]:
+    """Get (requires_approval, requires_plan) for a risk level"""
+    return risk_level != RiskLevel.LOW, risk_level == RiskLevel.HIGH
+
+
+def get_next_steps(assessment: Assessment) -> str:
+    """Get next steps guidance for an assessment based on its risk level"""
+    if assessment.risk_level == RiskLevel.LOW:
+        return "Operation can proceed without additional approval."
+    if assessment.risk_level == RiskLevel.MEDIUM:
+        return (
+            "User confirmation required. Use governor_approve with "
+            f"target_type='assessment' and target_id='{assessment.id}' to record approval."
+        )
+    return (
+        "Create a structured execution plan. Use governor_create_plan with "
+        f"assessment_id='{assessment.id}' to create a plan with detailed steps."
+    )
+
+
+def _build_response(assessment: Assessment, compact: bool = False) -> dict[str, Any]:
+    """
+    Build the tool response for an assessment based on its risk level.
+
+    Compact responses carry only the verdict and leave out the explanation
+    (operation, factors, recommendations and next steps). The assessment
+    itself still holds the factors and recommendations, so the explanation
+    stays available through governor_check_status.
+    """
+    requires_approval, requires_plan = _requirements(assessment.risk_level)
+    if compact:
+        return {
+            "assessment_id": assessment.id,
+            "risk_level": assessment.risk_level.value,
+            "risk_score": assessment.risk_score,
+            "requires_approval": requires_approval,
+            "requires_plan": requires_plan,
+        }
+
+    return {
         "assessment_id": assessment.id,
-        "operation": operation,
+        "operation": assessment.operation,
         "risk_level": assessment.risk_level.value,
         "risk_score": assessment.risk_score,
         "factors": assessment.factors,
         "recommendations": assessment.recommendations,
+        "next_steps": get_next_steps(assessment),
+        "requires_approval": requires_approval,
+        "requires_plan": requires_plan,
     }
 
-    # Add next steps guidance
-    if assessment.risk_level == RiskLevel.LOW:
-        response["next_steps"] = "Operation can proceed without additional approval."
-        response["requires_approval"] = False
-        response["requires_plan"] = False
-    elif assessment.risk_level == RiskLevel.MEDIUM:
-        response["next_steps"] = (
-            "User confirmation required. Use governor_approve with "
-            f"target_type='assessment' and target_id='{assessment.id}' to record approval."
-        )
-        response["requires_approval"] = True
-        response["requires_plan"] = False
-    else:  # HIGH
-        response["next_steps"] = (
-            "Create a structured execution plan. Use governor_create_plan with "
-            f"assessment_id='{assessment.id}' to create a plan with detailed steps."
-        )
-        response["requires_approval"] = True
-        response["requires_plan"] = True
 
+def _add_prior_approval(response: dict[str, Any], assessment: Assessment) -> None:
+    """
+    Point to an earlier approval of an operation with the same fingerprint.
+
+    The current assessment still needs its own approval; the reference lets
+    the user confirm a repeat of an operation they already reviewed (same
+    command, different ids or values) without re-reading the details.
+    """
+    if assessment.risk_level == RiskLevel.LOW or not assessment.fingerprint:
+        return
+    session = get_session()
+    prior = session.find_approved_assessment(assessment.fingerprint, exclude_id=assessment.id)
+    if prior is None:
+        return
+    approval = max(session.get_approvals_for_target("assessment", prior.id), key=lambda a: a.timestamp)
+    response["prior_approval"] = {
+        "assessment_id": prior.id,
+        "operation": prior.operation,
+        "approval_id": approval.id,
+        "approved_at": approval.timestamp.isoformat(),
+    }
+
+
+async def governor_assess_batch(
+    operations: list[dict[str, Any]],
+    compact: bool = False,
+) -> dict[str, Any]:
+    """
+    Assess the risk level of many operations in one call.
+
+    Equivalent to calling governor_assess for each operation in order, but
+    stores all assessments and audit entries in a single batch.
+
+    Args:
+        operations: List of operation definitions, each containing:
+            - operation: The operation to assess
+            - description: Human-readable description (optional)
+            - context: Additional context, a string or a list of targets (optional)
+        compact: Return only the verdict of each operation
+
+    Returns:
+        Batch result including:
+        - assessments: Per-operation results in input order (same shape as governor_assess)
+        - count: Number of operations assessed
+        - by_risk_level: Number of assessments at each risk level
+        - max_risk_level: Highest risk level in the batch
+        - requires_approval / requires_plan: True if any operation requires it
+    """
+    # Validate operations
+    if not operations:
+        return {"error": "At least one operation is required"}
+    if len(operations) > MAX_BATCH_SIZE:
+        return {"error": f"Too many operations: {len(operations)} (maximum {MAX_BATCH_SIZE})"}
+
+    for i, item in enumerate(operations):
+        if not isinstance(item, dict) or not item.get("operation"):
+            return {"error": f"Operation {i + 1} missing 'operation'"}
+        error = _check_context(item.get("context", ""))
+        if error:
+            return {"error": f"Operation {i + 1}: {error}"}
+
+    engine = get_engine()
+    session = get_session()
+    audit = get_audit_logger()
+
+    # Perform assessments, off the event loop for large batches
+    items = [
+        (item["operation"], item.get("description", ""), item.get("context", ""))
+        for item in operations
+    ]
+    assessments = await engine.offloader.run(
+        "assess", sum(text_size(*item) for item in items), assess_operations, items,
+    )
+
+    # Store in session and log in one batch each
+    session.store_assessments(assessments)
+    audit.log_batch([
+        {
+            "action": "assess",
+            "operation": assessment.operation,
+            "risk_level": assessment.risk_level,
+            "details": {
+                "description": item.get("description", ""),
+                "context": item.get("context", ""),
+                "risk_score": assessment.risk_score,
+                "fingerprint": assessment.fingerprint,
+                "batch_size": len(operations),
+            },
+            "assessment_id": assessment.id,
+        }
+        for item, assessment in zip(operations, assessments)
+    ])
+
+    results = [_build_response(assessment, compact) for assessment in assessments]
+    if not compact:
+        for result, assessment in zip(results, assessments):
+            _add_prior_approval(result, assessment)
+
+    by_risk_level = {level.value: 0 for level in RiskLevel}
+    for assessment in assessments:
+        by_risk_level[assessment.risk_level.value] += 1
+    max_level = max(
+        (assessment.risk_level for assessment in assessments),
+        key=_RISK_ORDER.index,
+    )
+
+    response = {
+        "assessments": results,
+        "count": len(results),
+        "by_risk_level": by_risk_level,
+        "max_risk_level": max_level.value,
+        "requires_approval": any(r["requires_approval"] for r in results),
+        "requires_plan": any(r["requires_plan"] for r in results),
+    }
+    engine.record_response("assess_batch", response, compact)
+    return response
+
+
+async def governor_assess_stream(
+    chunk: str = "",
+    stream_id: str = "",
+    context: str = "",
+    description: str = "",
+    finalize: bool = False,
+    compact: bool = False,
+) -> dict[str, Any]:
+    """
+    Assess a long operation incrementally while it is being composed.
+
+    Call without stream_id to open a stream (optionally with a first chunk),
+    then pass the returned stream_id with each following chunk. Every call
+    returns the running verdict; "terminate" becomes True as soon as the
+    text seen so far is HIGH risk. Call with finalize=True to turn the
+    stream into a normal assessment. Only the first MiB of text is scanned
+    and stored; past that "truncated" is True and the final verdict is at
+    least MEDIUM.
+
+    Args:
+        chunk: Next piece of operation text
+        stream_id: ID of an open stream; omit to open a new one
+        context: Additional context (only used when opening a stream)
+        description: Human-readable description (only used when opening a stream)
+        finalize: Close the stream and store the resulting assessment
+        compact: Return only the verdict when finalizing
+
+    Returns:
+        Running verdict (stream_id, resource_type, action_type, scope,
+        risk_score, risk_level, chars_scanned, total_chars, truncated,
+        chunks, terminate), or the
+        same result as governor_assess plus stream_id when finalized
+    """
+    engine = get_engine()
+    if stream_id:
+        stream = engine.get_stream(stream_id)
+        if stream is None:
+            return {"error": f"Stream not found: {stream_id}"}
+    else:
+        stream = engine.open_stream(context, description)
+
+    verdict = stream.feed(chunk) if chunk else stream.verdict()
+    if not finalize:
+        return verdict
+
+    engine.close_stream(stream.id)
+    if not stream.chars_fed:
+        return {"error": "Cannot finalize an empty stream"}
+    assessment = stream.finalize()
+
+    get_session().store_assessment(assessment)
+    get_audit_logger().log(
+        action="assess",
+        operation=assessment.operation,
+        risk_level=assessment.risk_level,
+        details={
+            "description": stream.description,
+            "context": stream.context,
+            "risk_score": assessment.risk_score,
+            "stream_chunks": verdict["chunks"],
+        },
+        assessment_id=assessment.id,
+    )
+
+    response = _build_response(assessment, compact)
+    response["stream_id"] = stream.id
+    engine.record_response("assess_stream", response, compact)
+    return response
+
+
+async def governor_assess_file(
+    path: str,
+    context: str = "",
+    description: str = "",
+    mode: str = "auto",
+    compact: bool = False,
+) -> dict[str, Any]:
+    """
+    Assess a local script file line by line or statement by statement.
+
+    Use this before running a script whose contents the command alone does
+    not reveal (`bash deploy.sh`, `psql -f migrate.sql`). The file is read
+    through a memory map and each unit is classified separately; the
+    verdict is that of the highest-risk unit. Results are cached by path,
+    inode, modification time and size, so repeat assessments of an
+    unchanged file are free.
+
+    Args:
+        path: Path of the script file
+        context: Additional context applied to every unit
+        description: Human-readable description of what the script does
+        mode: "lines" (shell commands), "statements" (SQL), or "auto"
+            (statements for .sql files, lines otherwise)
+        compact: Return only the verdict and the heatmap
+
+    Returns:
+        Same result as governor_assess for the highest-risk unit, plus
+        "file" with line and unit counts, max_line (where the verdict comes
+        from), by_risk_level counts and heatmap (non-LOW units with line,
+        end_line for multi-line units, risk_level and risk_score)
+    """
+    if not path:
+        return {"error": "A file path is required"}
+
+    engine = get_engine()
+    try:
+        scan = engine.file_assessor.scan(path, context, mode)
+    except ValueError as e:
+        return {"error": str(e)}
+    except OSError as e:
+        return {"error": f"Failed to read {path}: {e}"}
+
+    assessment = engine.assessor.build_assessment(
+        scan.path,
+        description or f"Run script {scan.path} ({scan.units} {scan.mode})",
+        scan.classification,
+    )
+    assessment.factors["file"] = {
+        "mode": scan.mode,
+        "units": scan.units,
+        "max_line": scan.max_line,
+        "by_risk_level": scan.by_risk_level,
+    }
+
+    get_session().store_assessment(assessment)
+    get_audit_logger().log(
+        action="assess",
+        operation=assessment.operation,
+        risk_level=assessment.risk_level,
+        details={
+            "description": assessment.description,
+            "context": context,
+            "risk_score": assessment.risk_score,
+            "file_size": scan.size,
+            "file_units": scan.units,
+            "max_line": scan.max_line,
+        },
+        assessment_id=assessment.id,
+    )
+
+    response = _build_response(assessment, compact)
+    response["file"] = scan.to_dict()
+    engine.record_response("assess_file", response, compact)
     return response
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from ..core import PlanController, DeviationDetector
+from ..core import detect_deviation, get_engine, text_size
 from ..state import StepStatus, PlanStatus, RiskLevel
 from ..state.session import get_session
 from ..state.audit import get_audit_logger
@@ -42,8 +42,8 @@ async def governor_execute_step(
     """
     session = get_session()
     audit = get_audit_logger()
-    plan_controller = PlanController()
-    deviation_detector = DeviationDetector()
+    engine = get_engine()
+    plan_controller = engine.plan_controller
 
     # Get the plan
     plan = session.get_plan(plan_id)
@@ -108,8 +108,11 @@ async def governor_execute_step(
     # Mark as executing
     plan_controller.start_step_execution(plan_id, step_id)
 
-    # Perform deviation detection
-    deviation_report = deviation_detector.detect(
+    # Perform deviation detection, off the event loop for large inputs
+    deviation_report = await engine.offloader.run(
+        "detect",
+        text_size(step.operation, step.expected_outcome, actual_operation or step.operation, actual_outcome),
+        detect_deviation,
         step=step,
         actual_operation=actual_operation or step.operation,
         actual_outcome=actual_outcome or "",
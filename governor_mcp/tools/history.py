@@ -3,6 +3,7 @@
 from datetime import datetime
 from typing import Any
 
+from ..core import get_engine
 from ..state import RiskLevel
 from ..state.audit import get_audit_logger
 
@@ -17,6 +18,7 @@ async def governor_get_history(
     success_only: bool = False,
     failures_only: bool = False,
     include_stats: bool = False,
+    fingerprint: str = "",
 ) -> dict[str, Any]:
     """
     Retrieve the audit trail of governor actions.
@@ -33,7 +35,10 @@ async def governor_get_history(
         assessment_id: Filter by assessment ID
         success_only: Only show successful actions
         failures_only: Only show failed actions
-        include_stats: Include audit statistics
+        include_stats: Include audit statistics (including the largest
+            groups of assessments by fingerprint)
+        fingerprint: Filter by assessment fingerprint, i.e. repeats of one
+            operation that differ only in ids, numbers or quoted values
 
     Returns:
         Audit history including:
@@ -51,27 +56,21 @@ async def governor_get_history(
         except ValueError:
             pass
 
-    # Get filtered entries
-    entries = audit.get_entries(
-        limit=limit,
-        offset=offset,
-        risk_level=level_filter,
-        action=action or None,
-        plan_id=plan_id or None,
-        assessment_id=assessment_id or None,
-        success_only=success_only,
-        failures_only=failures_only,
-    )
-
-    # Get total count (without pagination)
-    all_entries = audit.get_entries(
+    # Filter once and page the result; large audit logs are filtered off
+    # the event loop
+    all_entries = await get_engine().offloader.run(
+        "history",
+        len(audit),
+        audit.get_entries,
         risk_level=level_filter,
         action=action or None,
         plan_id=plan_id or None,
         assessment_id=assessment_id or None,
         success_only=success_only,
         failures_only=failures_only,
+        fingerprint=fingerprint or None,
     )
+    entries = (all_entries[offset:] if offset > 0 else all_entries)[:limit]
 
     response: dict[str, Any] = {
         "entries": [entry.to_dict() for entry in entries],
@@ -95,13 +94,15 @@ async def governor_get_history(
         active_filters.append("success_only=true")
     if failures_only:
         active_filters.append("failures_only=true")
+    if fingerprint:
+        active_filters.append(f"fingerprint={fingerprint}")
 
     if active_filters:
         response["filters"] = active_filters
 
     # Include stats if requested
     if include_stats:
-        stats = audit.get_stats()
+        stats = await get_engine().offloader.run("history", len(audit), audit.get_stats)
         response["stats"] = stats
 
     # Add pagination info
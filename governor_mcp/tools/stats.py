@@ -0,0 +1,103 @@
+"""Governor stats tool - classification rule instrumentation"""
+
+import os
+from typing import Any
+
+from ..classification import get_classification_stats, get_rule_stats
+from ..core import get_classification_cache, get_engine
+
+# Directory that stats dumps are written to; dumping is disabled when unset
+STATS_DIR_ENV = "GOVERNOR_STATS_DIR"
+
+
+def _dump_target(name: str) -> tuple[str | None, str | None]:
+    """
+    Resolve a dump file name inside the operator's stats directory.
+
+    The tool is called by the agent being governed, so it may only pick a
+    bare file name; the directory comes from GOVERNOR_STATS_DIR.
+
+    Returns:
+        Tuple of (path, None) or (None, error message)
+    """
+    directory = os.environ.get(STATS_DIR_ENV)
+    if not directory:
+        return None, f"Stats dumps are disabled; set {STATS_DIR_ENV} to enable them"
+    if (
+        name in (".", "..")
+        or os.path.basename(name) != name
+        or (os.path.altsep and os.path.altsep in name)
+        or os.path.isabs(name)
+    ):
+        return None, f"dump_name must be a bare file name, got {name!r}"
+    directory = os.path.realpath(directory)
+    path = os.path.realpath(os.path.join(directory, name))
+    if os.path.dirname(path) != directory:
+        return None, f"dump_name must be a bare file name, got {name!r}"
+    return path, None
+
+
+async def governor_classification_stats(
+    enabled: bool | None = None,
+    reset: bool = False,
+    top: int = 25,
+    dump_name: str = "",
+) -> dict[str, Any]:
+    """
+    Inspect or control classification rule instrumentation.
+
+    Instrumentation is off by default. While enabled, every assessment
+    records which patterns and keywords matched, how long each rule family
+    took, and which rule decided each verdict. Use the data to find rules
+    that never fire, rules that are slow, and rules that decide most verdicts.
+
+    Args:
+        enabled: True to start recording, False to stop; omit to leave unchanged
+        reset: Clear recorded data before returning
+        top: Maximum number of rules to include per section
+        dump_name: Also write the full data as JSON to a file of this name
+            in the directory set by GOVERNOR_STATS_DIR (bare file names
+            only; disabled when the variable is unset)
+
+    Returns:
+        Instrumentation data including:
+        - enabled: Whether recording is active
+        - rules: Per-rule hit counts, evaluations and total time
+        - families: Per-family call counts and timings
+        - decisions: Rules that decided each verdict
+        - cache: Classification cache statistics
+        - rule_set: Active rule set (version, source, rule counts) and
+          rule pack reload metrics (reloads, failures, last_reload_ms)
+        - engine: Startup warmup time of the shared engine, calls and
+          sampled response sizes per assess tool and mode
+          (response_bytes) and offload queue depths and counts (offload)
+    """
+    stats = get_classification_stats()
+
+    if enabled is True:
+        stats.enable()
+    elif enabled is False:
+        stats.disable()
+
+    dumped = None
+    if dump_name:
+        path, error = _dump_target(dump_name)
+        if error:
+            return {"error": error}
+        try:
+            dumped = stats.dump_json(path)
+        except OSError as e:
+            return {"error": f"Failed to write stats to {path}: {e}"}
+
+    response = stats.to_dict(top=top)
+    response["cache"] = get_classification_cache().get_stats()
+    response["rule_set"] = get_rule_stats()
+    response["engine"] = get_engine().get_stats()
+    if dumped:
+        response["dump_path"] = dumped
+
+    if reset:
+        stats.reset()
+        response["reset"] = True
+
+    return response
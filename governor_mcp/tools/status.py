@@ -2,7 +2,9 @@
 
 from typing import Any
 
+from ..core import get_classification_cache
 from ..state.session import get_session
+from .assess import get_next_steps
 
 
 async def governor_check_status(
@@ -15,7 +17,8 @@ async def governor_check_status(
 
     Use this tool to:
     - Check the current status of a specific plan
-    - Review an assessment
+    - Review an assessment, including the full explanation (factors,
+      recommendations, next steps) of compact assess results
     - Get an overview of the current session
 
     Args:
@@ -27,7 +30,8 @@ async def governor_check_status(
         Status information for the requested item(s):
         - plan: Plan details if plan_id provided
         - assessment: Assessment details if assessment_id provided
-        - session: Session overview if include_session_summary is True
+        - session: Session overview if include_session_summary is True,
+          including classification cache statistics
     """
     session = get_session()
     response: dict[str, Any] = {}
@@ -99,6 +103,7 @@ async def governor_check_status(
                 "scope": assessment.scope,
                 "factors": assessment.factors,
                 "recommendations": assessment.recommendations,
+                "next_steps": get_next_steps(assessment),
                 "timestamp": assessment.timestamp.isoformat(),
             }
 
@@ -155,6 +160,7 @@ async def governor_check_status(
                 }
                 for a in recent_assessments
             ],
+            "classification_cache": get_classification_cache().get_stats(),
         }
 
     # If nothing specific was requested, show session summary
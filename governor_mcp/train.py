@@ -0,0 +1,83 @@
+"""Train the secondary risk model from audit history: python -m governor_mcp.train"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from collections import Counter
+
+from .core.risk_model import DEFAULT_N_FEATURES, RiskModel, load_training_records, train_model
+
+
+def _accuracy(model: RiskModel, examples: list) -> float | None:
+    """Share of examples whose most likely level matches the label"""
+    if not examples:
+        return None
+    predictions = model.predict([operation for operation, _ in examples])
+    correct = sum(1 for (_, label), (level, _) in zip(examples, predictions) if level == label)
+    return round(correct / len(examples), 4)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(
+        prog="python -m governor_mcp.train",
+        description="Train the hashing-vectorizer risk model from labeled audit history",
+    )
+    parser.add_argument("input", help="audit history (JSONL, JSON list, or get_history output)")
+    parser.add_argument("--output", "-o", required=True, help="model file to write (.npz)")
+    parser.add_argument("--features-bits", type=int, default=DEFAULT_N_FEATURES.bit_length() - 1,
+                        help="log2 of the hashed feature count (default: 18)")
+    parser.add_argument("--epochs", type=int, default=20, help="passes over the data")
+    parser.add_argument("--learning-rate", type=float, default=20.0, help="gradient step size")
+    parser.add_argument("--l2", type=float, default=1e-5, help="L2 regularization strength")
+    parser.add_argument("--holdout", type=float, default=0.1,
+                        help="fraction held out to report accuracy (default 0.1)")
+    parser.add_argument("--seed", type=int, default=0, help="shuffling seed")
+    args = parser.parse_args(argv)
+
+    try:
+        examples = load_training_records(args.input)
+    except (OSError, json.JSONDecodeError) as e:
+        parser.error(f"Failed to read {args.input}: {e}")
+    if not examples:
+        parser.error(f"No labeled operations found in {args.input}")
+
+    random.Random(args.seed).shuffle(examples)
+    holdout_size = int(len(examples) * args.holdout) if len(examples) > 1 else 0
+    holdout, training = examples[:holdout_size], examples[holdout_size:]
+
+    started = time.perf_counter()
+    try:
+        model = train_model(
+            [operation for operation, _ in training],
+            [label for _, label in training],
+            n_features=2 ** args.features_bits,
+            epochs=args.epochs,
+            learning_rate=args.learning_rate,
+            l2=args.l2,
+            seed=args.seed,
+        )
+    except (RuntimeError, ValueError) as e:
+        parser.error(str(e))
+    elapsed = time.perf_counter() - started
+    model.save(args.output)
+
+    summary = {
+        "output": args.output,
+        "examples": len(examples),
+        "by_risk_level": dict(Counter(label.value for _, label in examples)),
+        "n_features": model.n_features,
+        "epochs": args.epochs,
+        "train_seconds": round(elapsed, 3),
+        "train_accuracy": _accuracy(model, training),
+        "holdout_accuracy": _accuracy(model, holdout),
+    }
+    json.dump(summary, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())